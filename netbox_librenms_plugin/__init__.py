@@ -29,6 +29,8 @@ class LibreNMSSyncConfig(PluginConfig):
 
         from django.conf import settings
 
+        from . import signals  # noqa: F401 - registers signal receivers
+
         plugin_config = getattr(settings, "PLUGINS_CONFIG", {}).get(self.name, {})
 
         # Check if using new multi-server configuration
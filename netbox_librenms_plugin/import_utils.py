@@ -9,9 +9,14 @@ This module provides functions for:
 - Permission checking for import operations
 """
 
+import base64
+import copy
+import functools
+import hashlib
 import logging
 from typing import List
 
+import orjson
 from core.choices import JobStatusChoices
 from dcim.models import Device, DeviceRole, DeviceType, Rack, Site, VirtualChassis
 from django.core.cache import cache
@@ -21,6 +26,7 @@ from django.utils import timezone
 from virtualization.models import Cluster
 
 from .librenms_api import LibreNMSAPI
+from .metrics import instrumented_cache
 from .utils import (
     find_matching_platform,
     find_matching_site,
@@ -178,6 +184,10 @@ def get_active_cached_searches(server_key: str) -> list[dict]:
     return active_searches
 
 
+# Filter keys accepted by the import form, in the fixed order used for cache keys
+IMPORT_FILTER_KEYS = ("location", "type", "os", "hostname", "sysname", "hardware")
+
+
 def get_validated_device_cache_key(server_key: str, filters: dict, device_id: int | str, vc_enabled: bool) -> str:
     """
     Generate a consistent cache key for validated device data.
@@ -185,6 +195,10 @@ def get_validated_device_cache_key(server_key: str, filters: dict, device_id: in
     This ensures both synchronous and background job processing use the same
     cache keys, avoiding duplicate validation work and cache entries.
 
+    Filter values are read in the fixed IMPORT_FILTER_KEYS order and digested
+    with blake2b, so the key is stable across processes (unlike ``hash()``,
+    which is salted per interpreter) and safe for memcached.
+
     Args:
         server_key: LibreNMS server key
         filters: Filter dict with location, type, os, hostname, sysname, hardware keys
@@ -197,12 +211,26 @@ def get_validated_device_cache_key(server_key: str, filters: dict, device_id: in
     Example:
         >>> key = get_validated_device_cache_key('default', {'location': 'NYC'}, 123, True)
         >>> key
-        'validated_device_default_-1234567890_123_vc'
+        'validated_device_default_e7607e6b7a22c7f3_123_vc'
     """
-    # Sort filters for consistent hashing
-    filter_hash = hash(str(sorted(filters.items())))
+    filter_values = "\x1f".join(str(filters.get(key) or "") for key in IMPORT_FILTER_KEYS)
+    filter_digest = hashlib.blake2b(filter_values.encode(), digest_size=8).hexdigest()
     vc_part = "vc" if vc_enabled else "novc"
-    return f"validated_device_{server_key}_{filter_hash}_{device_id}_{vc_part}"
+    return f"validated_device_{server_key}_{filter_digest}_{device_id}_{vc_part}"
+
+
+@functools.lru_cache(maxsize=None)
+def _server_cache_id(server_key: str) -> str:
+    """
+    Return a short, stable identifier for a server key to embed in cache keys.
+
+    Server keys can be long (e.g. DNS hostnames), so they are digested once per
+    process into a 7-character base32hex id. The "default" key is kept verbatim.
+    """
+    if server_key == "default":
+        return server_key
+    digest = hashlib.blake2b(server_key.encode(), digest_size=4).digest()
+    return base64.b32hexencode(digest).decode().rstrip("=").lower()
 
 
 def get_import_device_cache_key(device_id: int | str, server_key: str = "default") -> str:
@@ -222,9 +250,81 @@ def get_import_device_cache_key(device_id: int | str, server_key: str = "default
 
     Example:
         >>> get_import_device_cache_key(123, "production")
-        'import_device_data_production_123'
+        'import_device_data_bb29sg8_123'
+    """
+    return f"import_device_data_{_server_cache_id(server_key)}_{device_id}"
+
+
+# Serial values LibreNMS reports when the real serial is unknown
+_MEANINGLESS_SERIALS = frozenset({"", "-", "n/a", "none", "unknown"})
+
+
+def _meaningful_serial(serial: str | None) -> str | None:
+    """
+    Return the stripped serial, or None for LibreNMS placeholder values.
+
+    Example:
+        >>> _meaningful_serial(" FOC1234X ")
+        'FOC1234X'
+        >>> _meaningful_serial("N/A") is None
+        True
+    """
+    if serial is None:
+        return None
+    serial = str(serial).strip()
+    return serial if serial.lower() not in _MEANINGLESS_SERIALS else None
+
+
+# Validation results depend on NetBox state; bumping this version orphans every
+# cached result at once. It is bumped after commit, at most once per transaction,
+# when any model in signals.VALIDATION_DEPENDENCIES is saved or deleted.
+VALIDATION_RESULT_CACHE_VERSION_KEY = "librenms_import_validation_version"
+VALIDATION_RESULT_CACHE_TIMEOUT = 60
+
+
+def get_validation_result_cache_key(libre_device: dict, **options) -> str:
+    """
+    Build the cache key for a validate_device_for_import() result.
+
+    The key covers the LibreNMS device data, the validation options and the
+    current validation cache version.
+
+    Args:
+        libre_device: Device data from LibreNMS
+        **options: Validation options that affect the result
+
+    Returns:
+        str: Cache key like 'librenms_import_validation_v3_<digest>'
+    """
+    version = cache.get(VALIDATION_RESULT_CACHE_VERSION_KEY, 0)
+    payload = orjson.dumps({"device": libre_device, **options}, option=orjson.OPT_SORT_KEYS, default=str)
+    digest = hashlib.blake2b(payload, digest_size=16).hexdigest()
+    return f"librenms_import_validation_v{version}_{digest}"
+
+
+def _bump_validation_cache_version() -> None:
+    """Increment the validation cache version, orphaning every cached result."""
+    try:
+        cache.incr(VALIDATION_RESULT_CACHE_VERSION_KEY)
+    except ValueError:
+        # Version key missing or evicted
+        cache.set(VALIDATION_RESULT_CACHE_VERSION_KEY, 1, None)
+
+
+def invalidate_validation_results(raw: bool = False, using: str = None, **kwargs) -> None:
     """
-    return f"import_device_data_{server_key}_{device_id}"
+    Invalidate all cached validation results (usable as a signal receiver).
+
+    Raw saves (fixture loading) are ignored. The version bump is deferred
+    until the surrounding transaction commits and is scheduled at most once
+    per transaction, so bulk edits cost a single cache write.
+    """
+    if raw:
+        return
+    connection = transaction.get_connection(using)
+    if any(entry[1] is _bump_validation_cache_version for entry in connection.run_on_commit):
+        return
+    transaction.on_commit(_bump_validation_cache_version, using=using)
 
 
 def _determine_device_name(
@@ -418,6 +518,12 @@ def get_device_count_for_filters(
     return len(devices)
 
 
+@instrumented_cache("devices_import")
+def _get_cached_import_devices(cache_key: str) -> List[dict] | None:
+    """Look up a cached LibreNMS device list for the import workflow."""
+    return cache.get(cache_key)
+
+
 def get_librenms_devices_for_import(
     api: LibreNMSAPI = None,
     filters: dict = None,
@@ -555,7 +661,7 @@ def get_librenms_devices_for_import(
         if force_refresh:
             cache.delete(cache_key)
         else:
-            cached_result = cache.get(cache_key)
+            cached_result = _get_cached_import_devices(cache_key)
             if cached_result is not None:
                 # No need to deepcopy - cached data isn't mutated
                 devices = cached_result
@@ -631,6 +737,172 @@ def _apply_client_filters(devices: List[dict], filters: dict) -> List[dict]:
     return filtered
 
 
+# ORM lookup for the librenms_id custom field, shared by both lookup classes
+# and by tests that dispatch fake querysets on the filter kwargs.
+LIBRENMS_ID_LOOKUP = "custom_field_data__librenms_id"
+
+
+class ExistingObjectLookup:
+    """
+    Find existing NetBox Devices/VMs that may correspond to a LibreNMS device.
+
+    Each lookup issues its own query. PrefetchedExistingObjectLookup answers the
+    same questions from a few batched queries when validating many devices.
+    """
+
+    def vm_by_librenms_id(self, librenms_id: int):
+        from virtualization.models import VirtualMachine
+
+        return VirtualMachine.objects.filter(**{LIBRENMS_ID_LOOKUP: librenms_id}).first()
+
+    def device_by_librenms_id(self, librenms_id: int):
+        return Device.objects.filter(**{LIBRENMS_ID_LOOKUP: librenms_id}).first()
+
+    def vm_by_name(self, name: str):
+        from virtualization.models import VirtualMachine
+
+        return VirtualMachine.objects.filter(name__iexact=name).first()
+
+    def device_by_name(self, name: str):
+        return Device.objects.filter(name__iexact=name).first()
+
+    def device_by_serial(self, serial: str):
+        return Device.objects.filter(serial=serial).first()
+
+    def other_device_with_serial(self, serial: str, pk):
+        """Return a device other than ``pk`` that already carries ``serial``."""
+        return Device.objects.filter(serial=serial).exclude(pk=pk).first()
+
+
+class PrefetchedExistingObjectLookup(ExistingObjectLookup):
+    """
+    ExistingObjectLookup backed by batched queries for a list of LibreNMS devices.
+
+    Resolves every candidate match for the batch with one Device query and one
+    VirtualMachine query (librenms_id, case-insensitive name, serial), instead
+    of up to five queries per device. Lookups for values outside the batch
+    return None.
+    """
+
+    def __init__(self, libre_devices: List[dict], *, use_sysname: bool = True, strip_domain: bool = False):
+        from django.db.models import Q
+        from django.db.models.functions import Lower
+        from virtualization.models import VirtualMachine
+
+        librenms_ids = set()
+        names = set()
+        serials = set()
+        for libre_device in libre_devices:
+            device_id = libre_device.get("device_id")
+            try:
+                librenms_ids.add(int(device_id))
+            except (TypeError, ValueError):
+                pass
+            name = _determine_device_name(
+                libre_device, use_sysname=use_sysname, strip_domain=strip_domain, device_id=device_id
+            )
+            if name:
+                names.add(name.lower())
+            serial = _meaningful_serial(libre_device.get("serial"))
+            if serial:
+                serials.add(serial)
+
+        librenms_id_q = Q(**{f"{LIBRENMS_ID_LOOKUP}__in": librenms_ids})
+        self._vms_by_librenms_id = {}
+        self._vms_by_name = {}
+        self._devices_by_librenms_id = {}
+        self._devices_by_name = {}
+        self._devices_by_serial = {}
+
+        # Querysets keep the model's default ordering, so the first object kept
+        # per key is the one .first() would have returned. Validation reads the
+        # role (and device type) of matched objects, so join them up front.
+        vms = (
+            VirtualMachine.objects.select_related("role")
+            .annotate(name_lower=Lower("name"))
+            .filter(librenms_id_q | Q(name_lower__in=names))
+        )
+        for vm in vms:
+            self._index(vm, self._vms_by_librenms_id, self._vms_by_name)
+
+        devices = (
+            Device.objects.select_related("role", "device_type")
+            .annotate(name_lower=Lower("name"))
+            .filter(librenms_id_q | Q(name_lower__in=names) | Q(serial__in=serials))
+        )
+        for device in devices:
+            self._index(device, self._devices_by_librenms_id, self._devices_by_name)
+            if device.serial:
+                self._devices_by_serial.setdefault(device.serial, []).append(device)
+
+    @staticmethod
+    def _index(obj, by_librenms_id: dict, by_name: dict) -> None:
+        try:
+            by_librenms_id.setdefault(int(obj.custom_field_data.get("librenms_id")), obj)
+        except (TypeError, ValueError):
+            pass
+        by_name.setdefault(obj.name_lower, obj)
+
+    def vm_by_librenms_id(self, librenms_id: int):
+        return self._vms_by_librenms_id.get(librenms_id)
+
+    def device_by_librenms_id(self, librenms_id: int):
+        return self._devices_by_librenms_id.get(librenms_id)
+
+    def vm_by_name(self, name: str):
+        return self._vms_by_name.get(name.lower()) if name else None
+
+    def device_by_name(self, name: str):
+        return self._devices_by_name.get(name.lower()) if name else None
+
+    def device_by_serial(self, serial: str):
+        matches = self._devices_by_serial.get(serial)
+        return matches[0] if matches else None
+
+    def other_device_with_serial(self, serial: str, pk):
+        for device in self._devices_by_serial.get(serial, []):
+            if device.pk != pk:
+                return device
+        return None
+
+
+def _get_import_choices(lookup_cache: dict, cache_key: str, loader, api: "LibreNMSAPI" = None) -> list:
+    """
+    Return a list of import choices, memoized per batch and in Django's cache.
+
+    Args:
+        lookup_cache: Per-batch dict checked before Django's cache
+        cache_key: Django cache key for the choice list
+        loader: Callable that queries the choices on a cache miss
+        api: Optional LibreNMSAPI instance providing the cache timeout
+
+    Returns:
+        list: Cached or freshly loaded choices
+    """
+    if cache_key in lookup_cache:
+        return lookup_cache[cache_key]
+    choices = cache.get(cache_key)
+    if choices is None:
+        choices = loader()
+        # Use API cache timeout if available, otherwise use default 5 minutes
+        cache_timeout = api.cache_timeout if api else 300
+        cache.set(cache_key, choices, cache_timeout)
+    lookup_cache[cache_key] = choices
+    return choices
+
+
+def _match_once(lookup_cache: dict, kind: str, value: str, matcher) -> dict:
+    """
+    Run a site/platform/device type matcher once per distinct value in a batch.
+
+    Returns a shallow copy because validation adds keys to the match result.
+    """
+    key = (kind, value)
+    if key not in lookup_cache:
+        lookup_cache[key] = matcher(value)
+    return copy.copy(lookup_cache[key])
+
+
 def validate_device_for_import(
     libre_device: dict,
     import_as_vm: bool = False,
@@ -640,6 +912,9 @@ def validate_device_for_import(
     force_vc_refresh: bool = False,
     use_sysname: bool = True,
     strip_domain: bool = False,
+    existing_lookup: "ExistingObjectLookup" = None,
+    lookup_cache: dict = None,
+    cache_result: bool = False,
 ) -> dict:
     """
     Validate if a LibreNMS device can be imported to NetBox.
@@ -660,6 +935,15 @@ def validate_device_for_import(
         force_vc_refresh: When True, bypass cached VC data and re-query LibreNMS
         use_sysname: If True, prefer sysName over hostname (matches import behaviour)
         strip_domain: If True, strip domain suffix from device name
+        existing_lookup: Lookup used to find existing Devices/VMs. Defaults to one
+            query per lookup; pass a PrefetchedExistingObjectLookup when validating
+            many devices (see process_device_filters)
+        lookup_cache: Dict shared across a batch to memoize site/platform/device
+            type matches and role/cluster/rack choice lists, so each distinct
+            value is resolved once per batch
+        cache_result: If True, reuse a result cached for identical input for up
+            to VALIDATION_RESULT_CACHE_TIMEOUT seconds, and cache this one.
+            Ignored when force_vc_refresh is set.
 
     Returns:
         dict: Validation result with structure:
@@ -704,6 +988,19 @@ def validate_device_for_import(
         >>> if validation['is_ready']:
         ...     import_single_device(libre_device['device_id'])
     """
+    result_cache_key = None
+    if cache_result and not force_vc_refresh:
+        result_cache_key = get_validation_result_cache_key(
+            libre_device,
+            import_as_vm=import_as_vm,
+            include_vc_detection=include_vc_detection and api is not None,
+            use_sysname=use_sysname,
+            strip_domain=strip_domain,
+        )
+        cached_result = cache.get(result_cache_key)
+        if cached_result is not None:
+            return cached_result
+
     result = {
         "is_ready": False,
         "can_import": False,
@@ -775,12 +1072,14 @@ def validate_device_for_import(
             f"hostname={hostname}"
         )
 
-        from virtualization.models import VirtualMachine
+        existing_lookup = existing_lookup or ExistingObjectLookup()
+        if lookup_cache is None:
+            lookup_cache = {}
 
         # Check for existing VM first (by librenms_id custom field)
         # Always query with int to match custom field type
         try:
-            existing_vm = VirtualMachine.objects.filter(custom_field_data__librenms_id=int(librenms_id)).first()
+            existing_vm = existing_lookup.vm_by_librenms_id(int(librenms_id))
         except (ValueError, TypeError):
             # librenms_id is not convertible to int; no match will be found
             existing_vm = None
@@ -803,7 +1102,7 @@ def validate_device_for_import(
         # Always query with int to match custom field type
         if not result["existing_device"]:
             try:
-                existing_device = Device.objects.filter(custom_field_data__librenms_id=int(librenms_id)).first()
+                existing_device = existing_lookup.device_by_librenms_id(int(librenms_id))
             except (ValueError, TypeError):
                 # librenms_id is not convertible to int; no match will be found
                 existing_device = None
@@ -855,14 +1154,12 @@ def validate_device_for_import(
                         result["suggested_name"] = hostname
 
                 # Check for serial drift on the linked device
-                incoming_serial = libre_device.get("serial") or ""
-                if incoming_serial and incoming_serial != "-":
+                incoming_serial = _meaningful_serial(libre_device.get("serial"))
+                if incoming_serial:
                     if existing_device.serial and existing_device.serial == incoming_serial:
                         result["serial_confirmed"] = True
                     elif existing_device.serial and existing_device.serial != incoming_serial:
-                        serial_conflict = (
-                            Device.objects.filter(serial=incoming_serial).exclude(pk=existing_device.pk).first()
-                        )
+                        serial_conflict = existing_lookup.other_device_with_serial(incoming_serial, existing_device.pk)
                         if serial_conflict:
                             result["serial_action"] = "conflict"
                             result["serial_duplicate"] = True
@@ -881,8 +1178,8 @@ def validate_device_for_import(
         # Only check hostname/serial/IP if not already matched by librenms_id
         if not result["existing_device"]:
             # Check by hostname/name - Check both VMs and Devices for conflicts
-            existing_vm = VirtualMachine.objects.filter(name__iexact=hostname).first()
-            existing_device = Device.objects.filter(name__iexact=hostname).first()
+            existing_vm = existing_lookup.vm_by_name(hostname)
+            existing_device = existing_lookup.device_by_name(hostname)
 
             # If BOTH exist with same hostname, it's ambiguous - don't match either
             if existing_vm and existing_device:
@@ -911,11 +1208,9 @@ def validate_device_for_import(
                 result["existing_match_type"] = "hostname"
 
                 # Check for serial conflict on hostname-matched device
-                incoming_serial = libre_device.get("serial") or ""
-                if incoming_serial and incoming_serial != "-" and existing_device.serial != incoming_serial:
-                    serial_conflict = (
-                        Device.objects.filter(serial=incoming_serial).exclude(pk=existing_device.pk).first()
-                    )
+                incoming_serial = _meaningful_serial(libre_device.get("serial"))
+                if incoming_serial and existing_device.serial != incoming_serial:
+                    serial_conflict = existing_lookup.other_device_with_serial(incoming_serial, existing_device.pk)
                     if serial_conflict:
                         result["serial_action"] = "conflict"
                         result["serial_duplicate"] = True
@@ -939,9 +1234,9 @@ def validate_device_for_import(
 
             # Check by serial number (strong physical match - hardware identity)
             if not result["existing_device"]:
-                serial = libre_device.get("serial") or ""
-                if serial and serial != "-" and not import_as_vm:
-                    existing_by_serial = Device.objects.filter(serial=serial).first()
+                serial = _meaningful_serial(libre_device.get("serial"))
+                if serial and not import_as_vm:
+                    existing_by_serial = existing_lookup.device_by_serial(serial)
                     if existing_by_serial:
                         logger.info(f"Found existing device by serial: {existing_by_serial.name} (serial={serial})")
                         result["existing_device"] = existing_by_serial
@@ -985,19 +1280,12 @@ def validate_device_for_import(
         # Validate based on import type (Device or VM)
         if import_as_vm:
             # 2. For VMs: Validate Cluster (required) - Must be manually selected
-            from virtualization.models import Cluster
-
             result["cluster"]["found"] = False
             result["issues"].append("Cluster must be manually selected before importing as VM")
             # Provide list of available clusters for user selection (cached)
-            cache_key = "librenms_import_all_clusters"
-            all_clusters = cache.get(cache_key)
-            if all_clusters is None:
-                all_clusters = list(Cluster.objects.all())
-                # Use API cache timeout if available, otherwise use default 5 minutes
-                cache_timeout = api.cache_timeout if api else 300
-                cache.set(cache_key, all_clusters, cache_timeout)
-            result["cluster"]["available_clusters"] = all_clusters
+            result["cluster"]["available_clusters"] = _get_import_choices(
+                lookup_cache, "librenms_import_all_clusters", lambda: list(Cluster.objects.all()), api
+            )
 
             # Skip device-specific validations for VMs
             result["site"]["found"] = True  # Not required for VMs
@@ -1007,25 +1295,28 @@ def validate_device_for_import(
         else:
             # 2. For Devices: Validate Site (required)
             location = libre_device.get("location", "")
-            site_match = find_matching_site(location)
+            site_match = _match_once(lookup_cache, "site", location, find_matching_site)
             result["site"] = site_match
 
             if not site_match["found"]:
                 result["issues"].append(f"No matching site found for location: '{location}'")
                 # Get alternative suggestions
                 if location:
-                    all_sites = Site.objects.all()[:10]  # Limit for performance
-                    result["site"]["suggestions"] = list(all_sites)
+                    if "site_suggestions" not in lookup_cache:
+                        lookup_cache["site_suggestions"] = list(Site.objects.all()[:10])  # Limit for performance
+                    result["site"]["suggestions"] = list(lookup_cache["site_suggestions"])
 
             # 3. Validate DeviceType (required)
             hardware = libre_device.get("hardware", "")
-            dt_match = match_librenms_hardware_to_device_type(hardware)
+            dt_match = _match_once(lookup_cache, "device_type", hardware, match_librenms_hardware_to_device_type)
             result["device_type"] = dt_match
 
             if not dt_match["matched"]:
                 result["issues"].append(f"No matching device type found for hardware: '{hardware}'")
                 # Get some device types for user to choose from
-                all_device_types = DeviceType.objects.all()[:10]
+                if "device_type_suggestions" not in lookup_cache:
+                    lookup_cache["device_type_suggestions"] = list(DeviceType.objects.all()[:10])
+                all_device_types = lookup_cache["device_type_suggestions"]
                 result["device_type"]["suggestions"] = [
                     {
                         "device_type": dt,
@@ -1046,39 +1337,30 @@ def validate_device_for_import(
             result["issues"].append("Device role must be manually selected before import")
             logger.debug(f"[{hostname}] Issues AFTER adding role issue: {result['issues']}")
             # Provide list of available roles for user selection (cached)
-            cache_key = "librenms_import_all_roles"
-            all_roles = cache.get(cache_key)
-            if all_roles is None:
-                all_roles = list(DeviceRole.objects.all())
-                # Use API cache timeout if available, otherwise use default 5 minutes
-                cache_timeout = api.cache_timeout if api else 300
-                cache.set(cache_key, all_roles, cache_timeout)
-            result["device_role"]["available_roles"] = all_roles
+            result["device_role"]["available_roles"] = _get_import_choices(
+                lookup_cache, "librenms_import_all_roles", lambda: list(DeviceRole.objects.all()), api
+            )
 
             # 4b. Rack (optional) - Provide available racks for the matched site
             if site_match["found"] and site_match["site"]:
                 site = site_match["site"]
-                # Use cache to optimize rack lookups per site
-                cache_key = f"librenms_import_racks_site_{site.pk}"
-                available_racks = cache.get(cache_key)
 
-                if available_racks is None:
-                    from dcim.models import Rack
+                def load_site_racks():
                     from django.db.models import Q
 
                     # Query racks for this site - include both:
                     # 1. Racks assigned to locations within the site
                     # 2. Racks directly assigned to the site (without location)
-                    available_racks = list(
+                    return list(
                         Rack.objects.filter(Q(location__site=site) | Q(site=site))
                         .select_related("location", "site")
                         .order_by("location__name", "name")
                     )
-                    # Use API cache timeout if available, otherwise use default 5 minutes
-                    cache_timeout = api.cache_timeout if api else 300
-                    cache.set(cache_key, available_racks, cache_timeout)
 
-                result["rack"]["available_racks"] = available_racks
+                # Use cache to optimize rack lookups per site
+                result["rack"]["available_racks"] = _get_import_choices(
+                    lookup_cache, f"librenms_import_racks_site_{site.pk}", load_site_racks, api
+                )
                 # Rack is optional, don't add to issues
                 result["rack"]["found"] = True  # Mark as "found" even if None (optional field)
 
@@ -1087,7 +1369,7 @@ def validate_device_for_import(
 
         # 5. Match Platform (optional - same for both devices and VMs)
         os = libre_device.get("os", "")
-        platform_match = find_matching_platform(os)
+        platform_match = _match_once(lookup_cache, "platform", os, find_matching_platform)
         result["platform"] = platform_match
 
         if not platform_match["found"] and os:
@@ -1172,6 +1454,8 @@ def validate_device_for_import(
             f"issues_list={result['issues']}"
         )
 
+        if result_cache_key:
+            cache.set(result_cache_key, result, VALIDATION_RESULT_CACHE_TIMEOUT)
         return result
 
     except Exception as e:
@@ -1341,8 +1625,8 @@ def import_single_device(
             if rack:
                 device_data["rack"] = rack
 
-            serial = libre_device.get("serial", "")
-            if serial and serial != "-":
+            serial = _meaningful_serial(libre_device.get("serial"))
+            if serial:
                 device_data["serial"] = serial
 
             location_name = libre_device.get("location", "")
@@ -2409,6 +2693,23 @@ def process_device_filters(
     else:
         logger.info(f"Validating {total} devices")
 
+    # Read every cached validation in one round trip; only the misses are validated below
+    cache_keys = {
+        device["device_id"]: get_validated_device_cache_key(
+            server_key=api.server_key,
+            filters=filters,
+            device_id=device["device_id"],
+            vc_enabled=vc_detection_enabled,
+        )
+        for device in libre_devices
+    }
+    cached_devices = {} if clear_cache else cache.get_many(list(cache_keys.values()))
+
+    # Built on the first cache miss, from the uncached devices only, so fully
+    # cached result sets cost no extra queries
+    existing_lookup = None
+    lookup_cache = {}
+
     for idx, device in enumerate(libre_devices, 1):
         # Check for job termination or client disconnect periodically
         if idx % 5 == 0 or idx == 1:  # Check more frequently (every 5 devices + first device)
@@ -2447,19 +2748,14 @@ def process_device_filters(
         # Drop any cached validation/meta keys before recomputing
         device.pop("_validation", None)
 
-        # Generate shared cache key for this validated device
+        # Shared cache key for this validated device
         device_id = device["device_id"]
-        cache_key = get_validated_device_cache_key(
-            server_key=api.server_key,
-            filters=filters,
-            device_id=device_id,
-            vc_enabled=vc_detection_enabled,
-        )
+        cache_key = cache_keys[device_id]
 
         # Check if we already have cached validation for this device
         # (only if not forcing refresh)
         if not clear_cache:
-            cached_device = cache.get(cache_key)
+            cached_device = cached_devices.get(cache_key)
             if cached_device:
                 # Use cached validation
                 device["_validation"] = cached_device["_validation"]
@@ -2478,6 +2774,13 @@ def process_device_filters(
                 continue
 
         # Not in cache or forcing refresh - validate now
+        if existing_lookup is None:
+            # Resolve existing NetBox matches for every device that needs validation in bulk
+            existing_lookup = PrefetchedExistingObjectLookup(
+                [d for d in libre_devices if not cached_devices.get(cache_keys[d["device_id"]])],
+                use_sysname=use_sysname,
+                strip_domain=strip_domain,
+            )
         try:
             validation = validate_device_for_import(
                 device,
@@ -2486,6 +2789,8 @@ def process_device_filters(
                 force_vc_refresh=clear_cache,
                 use_sysname=use_sysname,
                 strip_domain=strip_domain,
+                existing_lookup=existing_lookup,
+                lookup_cache=lookup_cache,
             )
         except (BrokenPipeError, ConnectionError, IOError) as e:
             if request:
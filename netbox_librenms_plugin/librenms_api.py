@@ -1,6 +1,7 @@
 import logging
 import urllib.parse
 
+import orjson
 import requests
 from django.core.cache import cache
 from netbox.plugins import get_plugin_config
@@ -857,11 +858,14 @@ class LibreNMSAPI:
             )
             response.raise_for_status()
             if response.status_code == 200:
-                result = response.json()
+                # Device listings can be megabytes of JSON; decode with orjson
+                result = orjson.loads(response.content)
                 if result.get("status") == "ok":
                     return True, result.get("devices", [])
 
             return False, []
+        except orjson.JSONDecodeError as e:
+            return False, f"Invalid JSON response from LibreNMS: {e}"
         except requests.exceptions.RequestException as e:
             return False, str(e)
 
@@ -0,0 +1,73 @@
+"""
+Prometheus metrics for plugin cache access.
+
+NetBox ships prometheus_client (via django-prometheus), so metrics registered
+here are exported on NetBox's /metrics endpoint. When prometheus_client is not
+installed, instrumented_cache() returns the wrapped function unchanged.
+"""
+
+import functools
+import time
+
+try:
+    from prometheus_client import Counter, Histogram
+except ImportError:  # pragma: no cover - prometheus_client ships with NetBox
+    Counter = Histogram = None
+
+if Counter is not None:
+    CACHE_HITS = Counter(
+        "nlp_cache_hits_total",
+        "LibreNMS plugin cache lookups that returned a value",
+        labelnames=["func"],
+    )
+    CACHE_MISSES = Counter(
+        "nlp_cache_misses_total",
+        "LibreNMS plugin cache lookups that returned nothing",
+        labelnames=["func"],
+    )
+    CACHE_GET_SECONDS = Histogram(
+        "nlp_cache_get_seconds",
+        "Latency of LibreNMS plugin cache lookups",
+        labelnames=["func"],
+    )
+
+
+def instrumented_cache(label: str):
+    """
+    Decorate a cache lookup helper to record hit/miss counts and latency.
+
+    The wrapped function must return None on a cache miss, matching
+    ``cache.get()`` semantics.
+
+    Args:
+        label: Value of the ``func`` label on the exported metrics
+
+    Example:
+        >>> @instrumented_cache("devices_import")
+        ... def _get_cached_devices(cache_key):
+        ...     return cache.get(cache_key)
+    """
+
+    def decorator(func):
+        if Counter is None:
+            return func
+
+        # Bind the labelled children once instead of resolving them per call
+        hits = CACHE_HITS.labels(func=label)
+        misses = CACHE_MISSES.labels(func=label)
+        latency = CACHE_GET_SECONDS.labels(func=label)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter_ns()
+            value = func(*args, **kwargs)
+            latency.observe((time.perf_counter_ns() - start) / 1e9)
+            if value is None:
+                misses.inc()
+            else:
+                hits.inc()
+            return value
+
+        return wrapper
+
+    return decorator
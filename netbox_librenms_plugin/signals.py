@@ -0,0 +1,20 @@
+"""Signal receivers for the NetBox LibreNMS plugin."""
+
+from dcim.models import Device, DeviceType, Platform, Rack, Site
+from django.db.models.signals import post_delete, post_save
+from ipam.models import IPAddress
+from virtualization.models import VirtualMachine
+
+from .import_utils import invalidate_validation_results
+from .models import LibreNMSSettings
+
+# Models whose changes can alter a cached import validation result
+VALIDATION_DEPENDENCIES = (Device, VirtualMachine, Site, DeviceType, Platform, Rack, IPAddress, LibreNMSSettings)
+
+for model in VALIDATION_DEPENDENCIES:
+    post_save.connect(
+        invalidate_validation_results, sender=model, dispatch_uid=f"librenms_validation_save_{model.__name__}"
+    )
+    post_delete.connect(
+        invalidate_validation_results, sender=model, dispatch_uid=f"librenms_validation_delete_{model.__name__}"
+    )
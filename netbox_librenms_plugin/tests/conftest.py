@@ -4,6 +4,17 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+# =============================================================================
+# Cache Fixtures
+# =============================================================================
+
+
+@pytest.fixture(autouse=True)
+def _dummy_cache(settings):
+    """Use Django's DummyCache so no test reads values cached by another test."""
+    settings.CACHES = {"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}}
+
+
 # =============================================================================
 # Configuration Fixtures
 # =============================================================================
@@ -57,6 +68,16 @@ def mock_librenms_api(mock_multi_server_config):
             yield api
 
 
+@pytest.fixture(scope="module")
+def librenms_api():
+    """LibreNMSAPI built once per module; the client keeps no state beyond its configuration."""
+    servers = {"default": {"librenms_url": "https://librenms.example.com", "api_token": "test-token"}}
+    with patch("netbox_librenms_plugin.librenms_api.get_plugin_config", return_value=servers):
+        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
+
+        return LibreNMSAPI(server_key="default")
+
+
 # =============================================================================
 # NetBox Object Mocks (Avoid Database)
 # =============================================================================
@@ -10,14 +10,15 @@ All tests use mocking and direct attribute manipulation instead of HTTP requests
 
 from unittest.mock import MagicMock, patch
 
+from netbox_librenms_plugin.jobs import FilterDevicesJob, ImportDevicesJob
+from netbox_librenms_plugin.views.imports.list import LibreNMSImportView
+
 
 class TestShouldUseBackgroundJob:
     """Test background job decision logic."""
 
     def test_checkbox_checked_returns_true(self):
         """When use_background_job form field is True, return True for superusers."""
-        from netbox_librenms_plugin.views.imports.list import LibreNMSImportView
-
         view = LibreNMSImportView()
         view._filter_form_data = {"use_background_job": True}
         view.request = MagicMock()
@@ -27,8 +28,6 @@ class TestShouldUseBackgroundJob:
 
     def test_checkbox_unchecked_returns_false(self):
         """When use_background_job form field is False, return False."""
-        from netbox_librenms_plugin.views.imports.list import LibreNMSImportView
-
         view = LibreNMSImportView()
         view._filter_form_data = {"use_background_job": False}
         view.request = MagicMock()
@@ -38,8 +37,6 @@ class TestShouldUseBackgroundJob:
 
     def test_default_when_field_missing(self):
         """When field is missing, default to True for superusers."""
-        from netbox_librenms_plugin.views.imports.list import LibreNMSImportView
-
         view = LibreNMSImportView()
         view._filter_form_data = {"some_other_field": "value"}
         view.request = MagicMock()
@@ -49,8 +46,6 @@ class TestShouldUseBackgroundJob:
 
     def test_empty_form_data_returns_default(self):
         """Empty form data returns default True for superusers."""
-        from netbox_librenms_plugin.views.imports.list import LibreNMSImportView
-
         view = LibreNMSImportView()
         view._filter_form_data = {}
         view.request = MagicMock()
@@ -60,8 +55,6 @@ class TestShouldUseBackgroundJob:
 
     def test_non_superuser_always_returns_false(self):
         """Non-superuser users always get synchronous mode."""
-        from netbox_librenms_plugin.views.imports.list import LibreNMSImportView
-
         view = LibreNMSImportView()
         view._filter_form_data = {"use_background_job": True}
         view.request = MagicMock()
@@ -90,8 +83,6 @@ class TestFilterDevicesJob:
     @patch("netbox_librenms_plugin.import_utils.process_device_filters")
     def test_run_processes_filters_successfully(self, mock_process, mock_api_class):
         """Job runs and processes filters correctly."""
-        from netbox_librenms_plugin.jobs import FilterDevicesJob
-
         # Setup mocks
         mock_api = MagicMock()
         mock_api.cache_timeout = 300
@@ -128,8 +119,6 @@ class TestFilterDevicesJob:
     @patch("netbox_librenms_plugin.import_utils.process_device_filters")
     def test_run_with_vc_detection_enabled(self, mock_process, mock_api_class):
         """vc_detection_enabled=True passed to processor."""
-        from netbox_librenms_plugin.jobs import FilterDevicesJob
-
         mock_api = MagicMock()
         mock_api.cache_timeout = 300
         mock_api_class.return_value = mock_api
@@ -151,8 +140,6 @@ class TestFilterDevicesJob:
     @patch("netbox_librenms_plugin.import_utils.process_device_filters")
     def test_run_with_clear_cache(self, mock_process, mock_api_class):
         """clear_cache=True triggers cache refresh."""
-        from netbox_librenms_plugin.jobs import FilterDevicesJob
-
         mock_api = MagicMock()
         mock_api.cache_timeout = 300
         mock_api_class.return_value = mock_api
@@ -174,8 +161,6 @@ class TestFilterDevicesJob:
     @patch("netbox_librenms_plugin.import_utils.process_device_filters")
     def test_run_with_show_disabled(self, mock_process, mock_api_class):
         """show_disabled=True includes disabled devices."""
-        from netbox_librenms_plugin.jobs import FilterDevicesJob
-
         mock_api = MagicMock()
         mock_api.cache_timeout = 300
         mock_api_class.return_value = mock_api
@@ -197,8 +182,6 @@ class TestFilterDevicesJob:
     @patch("netbox_librenms_plugin.import_utils.process_device_filters")
     def test_run_with_exclude_existing(self, mock_process, mock_api_class):
         """exclude_existing=True filters out NetBox devices."""
-        from netbox_librenms_plugin.jobs import FilterDevicesJob
-
         mock_api = MagicMock()
         mock_api.cache_timeout = 300
         mock_api_class.return_value = mock_api
@@ -221,8 +204,6 @@ class TestFilterDevicesJob:
     @patch("netbox_librenms_plugin.import_utils.process_device_filters")
     def test_run_with_custom_server_key(self, mock_process, mock_api_class):
         """Non-default server_key used for API."""
-        from netbox_librenms_plugin.jobs import FilterDevicesJob
-
         mock_api = MagicMock()
         mock_api.cache_timeout = 300
         mock_api_class.return_value = mock_api
@@ -247,8 +228,6 @@ class TestFilterDevicesJob:
     @patch("netbox_librenms_plugin.import_utils.process_device_filters")
     def test_run_stores_job_data_correctly(self, mock_process, mock_api_class):
         """Job stores expected data structure."""
-        from netbox_librenms_plugin.jobs import FilterDevicesJob
-
         mock_api = MagicMock()
         mock_api.cache_timeout = 300
         mock_api_class.return_value = mock_api
@@ -283,8 +262,6 @@ class TestFilterDevicesJob:
     @patch("netbox_librenms_plugin.import_utils.process_device_filters")
     def test_run_handles_empty_results(self, mock_process, mock_api_class):
         """Empty filter results handled gracefully."""
-        from netbox_librenms_plugin.jobs import FilterDevicesJob
-
         mock_api = MagicMock()
         mock_api.cache_timeout = 300
         mock_api_class.return_value = mock_api
@@ -309,8 +286,6 @@ class TestFilterDevicesJob:
     @patch("netbox_librenms_plugin.import_utils.process_device_filters")
     def test_run_logs_progress(self, mock_process, mock_api_class):
         """Logger called with expected messages."""
-        from netbox_librenms_plugin.jobs import FilterDevicesJob
-
         mock_api = MagicMock()
         mock_api.cache_timeout = 300
         mock_api_class.return_value = mock_api
@@ -333,8 +308,6 @@ class TestFilterDevicesJob:
 
     def test_job_meta_name(self):
         """Job has correct Meta.name."""
-        from netbox_librenms_plugin.jobs import FilterDevicesJob
-
         assert FilterDevicesJob.Meta.name == "LibreNMS Device Filter"
 
 
@@ -346,8 +319,6 @@ class TestImportDevicesJob:
     @patch("netbox_librenms_plugin.librenms_api.LibreNMSAPI")
     def test_run_device_only_import(self, mock_api_class, mock_bulk_devices, mock_bulk_vms):
         """Import devices without VMs."""
-        from netbox_librenms_plugin.jobs import ImportDevicesJob
-
         mock_api_class.return_value = MagicMock()
 
         # Mock successful device imports
@@ -391,8 +362,6 @@ class TestImportDevicesJob:
     @patch("netbox_librenms_plugin.librenms_api.LibreNMSAPI")
     def test_run_vm_only_import(self, mock_api_class, mock_bulk_devices, mock_bulk_vms):
         """Import VMs without devices."""
-        from netbox_librenms_plugin.jobs import ImportDevicesJob
-
         mock_api_class.return_value = MagicMock()
 
         # Mock successful VM imports
@@ -433,8 +402,6 @@ class TestImportDevicesJob:
     @patch("netbox_librenms_plugin.librenms_api.LibreNMSAPI")
     def test_run_mixed_device_and_vm_import(self, mock_api_class, mock_bulk_devices, mock_bulk_vms):
         """Import both devices and VMs."""
-        from netbox_librenms_plugin.jobs import ImportDevicesJob
-
         mock_api_class.return_value = MagicMock()
 
         # Mock device imports
@@ -481,8 +448,6 @@ class TestImportDevicesJob:
     @patch("netbox_librenms_plugin.librenms_api.LibreNMSAPI")
     def test_run_with_sync_options(self, mock_api_class, mock_bulk_devices, mock_bulk_vms):
         """Sync options passed to bulk import."""
-        from netbox_librenms_plugin.jobs import ImportDevicesJob
-
         mock_api_class.return_value = MagicMock()
 
         mock_bulk_devices.return_value = {
@@ -518,8 +483,6 @@ class TestImportDevicesJob:
     @patch("netbox_librenms_plugin.librenms_api.LibreNMSAPI")
     def test_run_with_manual_mappings(self, mock_api_class, mock_bulk_devices, mock_bulk_vms):
         """Manual mappings passed correctly."""
-        from netbox_librenms_plugin.jobs import ImportDevicesJob
-
         mock_api_class.return_value = MagicMock()
 
         mock_bulk_devices.return_value = {
@@ -551,8 +514,6 @@ class TestImportDevicesJob:
     @patch("netbox_librenms_plugin.librenms_api.LibreNMSAPI")
     def test_run_stores_imported_pks(self, mock_api_class, mock_bulk_devices, mock_bulk_vms):
         """Imported device/VM PKs stored in job.data."""
-        from netbox_librenms_plugin.jobs import ImportDevicesJob
-
         mock_api_class.return_value = MagicMock()
 
         mock_device = MagicMock()
@@ -576,8 +537,6 @@ class TestImportDevicesJob:
     @patch("netbox_librenms_plugin.librenms_api.LibreNMSAPI")
     def test_run_stores_libre_device_ids(self, mock_api_class, mock_bulk_devices, mock_bulk_vms):
         """LibreNMS device IDs stored for re-render."""
-        from netbox_librenms_plugin.jobs import ImportDevicesJob
-
         mock_api_class.return_value = MagicMock()
 
         mock_device = MagicMock()
@@ -601,8 +560,6 @@ class TestImportDevicesJob:
     @patch("netbox_librenms_plugin.librenms_api.LibreNMSAPI")
     def test_run_aggregates_errors(self, mock_api_class, mock_bulk_devices, mock_bulk_vms):
         """Device and VM errors are combined in job.data."""
-        from netbox_librenms_plugin.jobs import ImportDevicesJob
-
         mock_api_class.return_value = MagicMock()
 
         # Mock mixed results
@@ -635,8 +592,6 @@ class TestImportDevicesJob:
     @patch("netbox_librenms_plugin.librenms_api.LibreNMSAPI")
     def test_run_handles_all_failures(self, mock_api_class, mock_bulk_devices, mock_bulk_vms):
         """All imports fail gracefully."""
-        from netbox_librenms_plugin.jobs import ImportDevicesJob
-
         mock_api_class.return_value = MagicMock()
 
         mock_bulk_devices.return_value = {
@@ -661,8 +616,6 @@ class TestImportDevicesJob:
 
     def test_job_meta_name(self):
         """Job has correct Meta.name."""
-        from netbox_librenms_plugin.jobs import ImportDevicesJob
-
         assert ImportDevicesJob.Meta.name == "LibreNMS Device Import"
 
 
@@ -674,8 +627,6 @@ class TestLoadJobResults:
     @patch("core.models.Job")
     def test_load_success_uses_correct_cache_keys(self, mock_job_class, mock_get_key, mock_cache):
         """Load uses get_validated_device_cache_key with job data."""
-        from netbox_librenms_plugin.views.imports.list import LibreNMSImportView
-
         # Setup mock job
         mock_job = MagicMock()
         mock_job.status = "completed"
@@ -723,8 +674,6 @@ class TestLoadJobResults:
     @patch("core.models.Job")
     def test_load_extracts_filters_from_job_data(self, mock_job_class, mock_get_key, mock_cache):
         """Filters, server_key, vc_enabled extracted from job data."""
-        from netbox_librenms_plugin.views.imports.list import LibreNMSImportView
-
         mock_job = MagicMock()
         mock_job.status = "completed"
         mock_job.data = {
@@ -755,8 +704,6 @@ class TestLoadJobResults:
     @patch("core.models.Job")
     def test_load_returns_cached_devices(self, mock_job_class, mock_get_key, mock_cache):
         """Devices retrieved from cache."""
-        from netbox_librenms_plugin.views.imports.list import LibreNMSImportView
-
         mock_job = MagicMock()
         mock_job.status = "completed"
         mock_job.data = {
@@ -786,8 +733,6 @@ class TestLoadJobResults:
     @patch("core.models.Job")
     def test_load_sets_cache_metadata(self, mock_job_class, mock_get_key, mock_cache):
         """Load sets _cache_timestamp and _cache_timeout on view."""
-        from netbox_librenms_plugin.views.imports.list import LibreNMSImportView
-
         mock_job = MagicMock()
         mock_job.status = "completed"
         mock_job.data = {
@@ -811,8 +756,6 @@ class TestLoadJobResults:
     @patch("core.models.Job")
     def test_load_job_not_found_returns_empty(self, mock_job_class):
         """Non-existent job returns empty list."""
-        from netbox_librenms_plugin.views.imports.list import LibreNMSImportView
-
         # Create a mock DoesNotExist exception
         mock_job_class.DoesNotExist = Exception
         mock_job_class.objects.get.side_effect = mock_job_class.DoesNotExist
@@ -825,8 +768,6 @@ class TestLoadJobResults:
     @patch("core.models.Job")
     def test_load_job_not_completed_returns_empty(self, mock_job_class):
         """Running job returns empty list."""
-        from netbox_librenms_plugin.views.imports.list import LibreNMSImportView
-
         mock_job = MagicMock()
         mock_job.status = "running"
         mock_job_class.objects.get.return_value = mock_job
@@ -841,8 +782,6 @@ class TestLoadJobResults:
     @patch("core.models.Job")
     def test_load_expired_cache_returns_empty(self, mock_job_class, mock_get_key, mock_cache):
         """All cache misses returns empty list."""
-        from netbox_librenms_plugin.views.imports.list import LibreNMSImportView
-
         mock_job = MagicMock()
         mock_job.status = "completed"
         mock_job.data = {
@@ -869,8 +808,6 @@ class TestLoadJobResults:
     @patch("core.models.Job")
     def test_load_partial_cache_returns_available(self, mock_job_class, mock_get_key, mock_cache):
         """Some expired, returns available devices."""
-        from netbox_librenms_plugin.views.imports.list import LibreNMSImportView
-
         mock_job = MagicMock()
         mock_job.status = "completed"
         mock_job.data = {
@@ -4,10 +4,54 @@ Phase 2 tests covering cache key generation, device name determination,
 device retrieval, and device validation functions.
 """
 
-from unittest.mock import MagicMock, patch
+import contextlib
+import functools
+from dataclasses import dataclass
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+from dcim.models import Device
+
+from netbox_librenms_plugin.import_utils import (
+    LIBRENMS_ID_LOOKUP,
+    VALIDATION_RESULT_CACHE_TIMEOUT,
+    VALIDATION_RESULT_CACHE_VERSION_KEY,
+    PrefetchedExistingObjectLookup,
+    _bump_validation_cache_version,
+    _determine_device_name,
+    empty_virtual_chassis_data,
+    get_cache_metadata_key,
+    get_device_count_for_filters,
+    get_import_device_cache_key,
+    get_librenms_devices_for_import,
+    get_validated_device_cache_key,
+    get_validation_result_cache_key,
+    get_virtual_chassis_data,
+    invalidate_validation_results,
+    process_device_filters,
+    validate_device_for_import,
+)
+from netbox_librenms_plugin.views.imports import actions as import_actions
+from netbox_librenms_plugin.views.imports.actions import (
+    _CONFLICT_DEVICE_RELATED,
+    DeviceConflictActionView,
+    DeviceValidationDetailsView,
+)
+
+
+@dataclass(slots=True, frozen=True)
+class _Ref:
+    """Stand-in for a related model that the code under test only reads ``pk`` from."""
+
+    pk: int
+
+
+# Validation tests don't exercise the LibreNMS API, so skip virtual chassis detection
+validate_without_vc = functools.partial(validate_device_for_import, include_vc_detection=False)
 
 # =============================================================================
-# TestCacheKeyGeneration - 4 tests
+# TestCacheKeyGeneration - 5 tests
 # =============================================================================
 
 
@@ -16,8 +60,6 @@ class TestCacheKeyGeneration:
 
     def test_get_cache_metadata_key_basic(self):
         """Generate cache metadata key with minimal filters."""
-        from netbox_librenms_plugin.import_utils import get_cache_metadata_key
-
         key = get_cache_metadata_key(server_key="default", filters={}, vc_enabled=False)
 
         assert "default" in key
@@ -26,8 +68,6 @@ class TestCacheKeyGeneration:
 
     def test_get_cache_metadata_key_all_params(self):
         """Generate cache metadata key with all filter parameters."""
-        from netbox_librenms_plugin.import_utils import get_cache_metadata_key
-
         key = get_cache_metadata_key(
             server_key="production",
             filters={"location": "DC1", "type": "network", "hostname": "switch*"},
@@ -40,8 +80,6 @@ class TestCacheKeyGeneration:
 
     def test_get_validated_device_cache_key(self):
         """Generate validated device cache key."""
-        from netbox_librenms_plugin.import_utils import get_validated_device_cache_key
-
         key = get_validated_device_cache_key(
             server_key="default",
             filters={"location": "NYC"},
@@ -54,15 +92,41 @@ class TestCacheKeyGeneration:
         assert "123" in key
         assert "vc" in key
 
+    def test_get_validated_device_cache_key_is_order_independent(self):
+        """Validated device key only depends on known filter values, not dict order."""
+        key_a = get_validated_device_cache_key(
+            server_key="default",
+            filters={"location": "NYC", "os": "ios", "hostname": ""},
+            device_id=123,
+            vc_enabled=True,
+        )
+        key_b = get_validated_device_cache_key(
+            server_key="default",
+            filters={"os": "ios", "location": "NYC"},
+            device_id=123,
+            vc_enabled=True,
+        )
+        key_other = get_validated_device_cache_key(
+            server_key="default",
+            filters={"os": "junos", "location": "NYC"},
+            device_id=123,
+            vc_enabled=True,
+        )
+
+        assert key_a == key_b
+        assert key_a != key_other
+        assert " " not in key_a
+
     def test_get_import_device_cache_key(self):
         """Generate raw device data cache key."""
-        from netbox_librenms_plugin.import_utils import get_import_device_cache_key
-
-        key = get_import_device_cache_key(device_id=456, server_key="secondary")
+        key = get_import_device_cache_key(device_id=456, server_key="librenms-secondary.example.com")
 
         assert "import_device_data" in key
-        assert "secondary" in key
         assert "456" in key
+        # Non-default server keys are shortened to a stable digest
+        assert "librenms-secondary.example.com" not in key
+        assert key == get_import_device_cache_key(device_id=456, server_key="librenms-secondary.example.com")
+        assert key != get_import_device_cache_key(device_id=456, server_key="librenms-primary.example.com")
 
 
 # =============================================================================
@@ -75,8 +139,6 @@ class TestDeviceNameDetermination:
 
     def test_determine_device_name_prefers_sysname(self):
         """sysName should be preferred over hostname when use_sysname=True."""
-        from netbox_librenms_plugin.import_utils import _determine_device_name
-
         device_data = {"sysName": "switch-01", "hostname": "switch-01.example.com"}
 
         name = _determine_device_name(device_data, use_sysname=True)
@@ -84,8 +146,6 @@ class TestDeviceNameDetermination:
 
     def test_determine_device_name_falls_back_to_hostname(self):
         """hostname used when sysName missing."""
-        from netbox_librenms_plugin.import_utils import _determine_device_name
-
         device_data = {"hostname": "router-01.example.com"}
 
         name = _determine_device_name(device_data, use_sysname=True)
@@ -93,8 +153,6 @@ class TestDeviceNameDetermination:
 
     def test_determine_device_name_strips_domain(self):
         """FQDN domain suffix should be stripped when strip_domain=True."""
-        from netbox_librenms_plugin.import_utils import _determine_device_name
-
         device_data = {
             "sysName": "router-core.datacenter.example.com",
             "hostname": "10.0.0.1",
@@ -105,8 +163,6 @@ class TestDeviceNameDetermination:
 
     def test_determine_device_name_handles_empty_sysname(self):
         """Empty sysName should fall back to hostname."""
-        from netbox_librenms_plugin.import_utils import _determine_device_name
-
         device_data = {"sysName": "", "hostname": "fallback-host"}
 
         name = _determine_device_name(device_data, use_sysname=True)
@@ -114,8 +170,6 @@ class TestDeviceNameDetermination:
 
     def test_determine_device_name_preserves_short_names(self):
         """Names without dots should remain unchanged."""
-        from netbox_librenms_plugin.import_utils import _determine_device_name
-
         device_data = {"sysName": "shortname", "hostname": "192.168.1.1"}
 
         name = _determine_device_name(device_data, use_sysname=True, strip_domain=True)
@@ -123,8 +177,6 @@ class TestDeviceNameDetermination:
 
     def test_determine_device_name_handles_ip_address(self):
         """IP addresses should not be stripped even with strip_domain=True."""
-        from netbox_librenms_plugin.import_utils import _determine_device_name
-
         device_data = {"sysName": "192.168.1.1", "hostname": "192.168.1.1"}
 
         name = _determine_device_name(device_data, use_sysname=True, strip_domain=True)
@@ -133,8 +185,6 @@ class TestDeviceNameDetermination:
 
     def test_determine_device_name_fallback_to_device_id(self):
         """Fallback to device_id when no name available."""
-        from netbox_librenms_plugin.import_utils import _determine_device_name
-
         device_data = {}
 
         name = _determine_device_name(device_data, device_id=999)
@@ -164,8 +214,6 @@ class TestDeviceRetrieval:
         )
         mock_api.cache_timeout = 300
 
-        from netbox_librenms_plugin.import_utils import get_librenms_devices_for_import
-
         devices = get_librenms_devices_for_import(api=mock_api, filters={})
 
         assert len(devices) == 2
@@ -181,8 +229,6 @@ class TestDeviceRetrieval:
 
         mock_api = MagicMock()
 
-        from netbox_librenms_plugin.import_utils import get_librenms_devices_for_import
-
         devices = get_librenms_devices_for_import(api=mock_api, filters={})
 
         assert len(devices) == 1
@@ -202,8 +248,6 @@ class TestDeviceRetrieval:
         )
         mock_api.cache_timeout = 300
 
-        from netbox_librenms_plugin.import_utils import get_librenms_devices_for_import
-
         devices = get_librenms_devices_for_import(api=mock_api, filters={}, force_refresh=True)
 
         mock_api.list_devices.assert_called_once()
@@ -219,8 +263,6 @@ class TestDeviceRetrieval:
         ]
         mock_api = MagicMock()
 
-        from netbox_librenms_plugin.import_utils import get_device_count_for_filters
-
         count = get_device_count_for_filters(api=mock_api, filters={})
 
         assert count == 3
@@ -235,16 +277,12 @@ class TestDeviceRetrieval:
         ]
         mock_api = MagicMock()
 
-        from netbox_librenms_plugin.import_utils import get_device_count_for_filters
-
         count = get_device_count_for_filters(api=mock_api, filters={}, show_disabled=False)
 
         assert count == 2
 
     def test_get_import_device_cache_key_default_server(self):
         """Generate cache key with default server."""
-        from netbox_librenms_plugin.import_utils import get_import_device_cache_key
-
         key = get_import_device_cache_key(device_id=123)
 
         assert "default" in key
@@ -252,16 +290,12 @@ class TestDeviceRetrieval:
 
     def test_get_validated_device_cache_key_no_vc(self):
         """Generate cache key without VC enabled."""
-        from netbox_librenms_plugin.import_utils import get_validated_device_cache_key
-
         key = get_validated_device_cache_key(server_key="default", filters={}, device_id=100, vc_enabled=False)
 
         assert "novc" in key
 
     def test_get_validated_device_cache_key_with_vc(self):
         """Generate cache key with VC enabled."""
-        from netbox_librenms_plugin.import_utils import get_validated_device_cache_key
-
         key_vc = get_validated_device_cache_key(server_key="default", filters={}, device_id=100, vc_enabled=True)
         key_novc = get_validated_device_cache_key(server_key="default", filters={}, device_id=100, vc_enabled=False)
 
@@ -270,8 +304,6 @@ class TestDeviceRetrieval:
 
     def test_empty_virtual_chassis_data(self):
         """Empty VC data helper returns correct structure."""
-        from netbox_librenms_plugin.import_utils import empty_virtual_chassis_data
-
         data = empty_virtual_chassis_data()
 
         assert data["is_stack"] is False
@@ -282,8 +314,6 @@ class TestDeviceRetrieval:
     @patch("netbox_librenms_plugin.import_utils.cache")
     def test_get_virtual_chassis_data_returns_empty_without_api(self, mock_cache):
         """Get VC data returns empty structure without API."""
-        from netbox_librenms_plugin.import_utils import get_virtual_chassis_data
-
         result = get_virtual_chassis_data(api=None, device_id=123)
 
         assert result["is_stack"] is False
@@ -291,700 +321,253 @@ class TestDeviceRetrieval:
 
 
 # =============================================================================
-# TestDeviceValidation - 15 tests
+# TestDeviceValidation - 14 tests
 # =============================================================================
 
 
-class TestDeviceValidation:
-    """Test device validation for import."""
-
-    @patch("virtualization.models.VirtualMachine")
-    @patch("netbox_librenms_plugin.import_utils.Device")
-    @patch("netbox_librenms_plugin.import_utils.find_matching_site")
-    @patch("netbox_librenms_plugin.import_utils.find_matching_platform")
-    @patch("netbox_librenms_plugin.import_utils.match_librenms_hardware_to_device_type")
-    @patch("netbox_librenms_plugin.import_utils.DeviceRole")
-    @patch("netbox_librenms_plugin.import_utils.Cluster")
-    @patch("netbox_librenms_plugin.import_utils.Rack")
-    @patch("netbox_librenms_plugin.import_utils.Site")
-    def test_validate_device_site_match_found(
-        self,
-        mock_site_model,
-        mock_rack,
-        mock_cluster,
-        mock_role,
-        mock_match_type,
-        mock_find_platform,
-        mock_find_site,
-        mock_device,
-        mock_vm,
-    ):
-        """Site matched successfully."""
-        mock_vm.objects.filter.return_value.first.return_value = None
-        mock_device.objects.filter.return_value.first.return_value = None
-        mock_site = MagicMock(id=1, name="DC1")
-        mock_find_site.return_value = {
-            "found": True,
-            "site": mock_site,
-            "match_type": "exact",
-            "confidence": 1.0,
-        }
-        mock_find_platform.return_value = {
-            "found": False,
-            "platform": None,
-            "match_type": None,
-        }
-        mock_match_type.return_value = {
-            "matched": False,
-            "device_type": None,
-            "match_type": None,
-        }
-        mock_role.objects.all.return_value = []
-        mock_cluster.objects.all.return_value = []
-        mock_rack.objects.filter.return_value = []
-        mock_site_model.objects.all.return_value = [mock_site]
+# Matcher results for "nothing matched", shared read-only across tests
+_SITE_NOT_FOUND = MappingProxyType({"found": False, "site": None, "match_type": None, "confidence": 0.0})
+_PLATFORM_NOT_FOUND = MappingProxyType({"found": False, "platform": None, "match_type": None})
+_DT_NOT_FOUND = MappingProxyType({"matched": False, "device_type": None, "match_type": None})
 
-        from netbox_librenms_plugin.import_utils import validate_device_for_import
 
-        device_data = {
-            "device_id": 1,
-            "hostname": "switch-01",
-            "location": "DC1",
-        }
+def _has_issue(result, needle):
+    """Return True if any validation issue mentions needle (case-insensitive)."""
+    return any(needle in issue.lower() for issue in result["issues"])
 
-        result = validate_device_for_import(device_data, include_vc_detection=False)
 
-        assert result["site"]["found"] is True
-        assert result["site"]["site"] == mock_site
+def _make_manager_mock():
+    """
+    Build a model stand-in whose manager reports no objects.
 
-    @patch("virtualization.models.VirtualMachine")
-    @patch("netbox_librenms_plugin.import_utils.Device")
-    @patch("netbox_librenms_plugin.import_utils.find_matching_site")
-    @patch("netbox_librenms_plugin.import_utils.find_matching_platform")
-    @patch("netbox_librenms_plugin.import_utils.match_librenms_hardware_to_device_type")
-    @patch("netbox_librenms_plugin.import_utils.DeviceRole")
-    @patch("netbox_librenms_plugin.import_utils.Cluster")
-    @patch("netbox_librenms_plugin.import_utils.Rack")
-    @patch("netbox_librenms_plugin.import_utils.Site")
-    def test_validate_device_site_not_found(
-        self,
-        mock_site_model,
-        mock_rack,
-        mock_cluster,
-        mock_role,
-        mock_match_type,
-        mock_find_platform,
-        mock_find_site,
-        mock_device,
-        mock_vm,
-    ):
-        """Site not found adds validation issue."""
-        mock_vm.objects.filter.return_value.first.return_value = None
-        mock_device.objects.filter.return_value.first.return_value = None
-        mock_find_site.return_value = {
-            "found": False,
-            "site": None,
-            "match_type": None,
-            "confidence": 0.0,
-        }
-        mock_find_platform.return_value = {
-            "found": False,
-            "platform": None,
-            "match_type": None,
-        }
-        mock_match_type.return_value = {
-            "matched": False,
-            "device_type": None,
-            "match_type": None,
-        }
-        mock_role.objects.all.return_value = []
-        mock_cluster.objects.all.return_value = []
-        mock_rack.objects.filter.return_value = []
-        mock_site_model.objects.all.return_value = []
+    Uses Mock rather than MagicMock (no magic-method setup) and pre-wires the
+    ``objects.filter().first()`` / ``objects.all()`` chains so patching a model
+    does not require per-test configuration.
+    """
+    model = Mock()
+    model.objects.filter.return_value.first.return_value = None
+    model.objects.all.return_value = []
+    return model
 
-        from netbox_librenms_plugin.import_utils import validate_device_for_import
 
-        device_data = {
-            "device_id": 1,
-            "hostname": "switch-01",
-            "location": "Unknown Location",
-        }
+class _FakeQuerySet:
+    """Minimal stand-in for the filter()/exclude()/first() chains validation uses."""
 
-        result = validate_device_for_import(device_data, include_vc_detection=False)
+    __slots__ = ("first_value", "exclude_first_value")
 
-        assert result["site"]["found"] is False
-        assert any("site" in issue.lower() for issue in result["issues"])
+    def __init__(self, first=None, exclude_first=None):
+        self.first_value = first
+        self.exclude_first_value = exclude_first
 
-    @patch("virtualization.models.VirtualMachine")
-    @patch("netbox_librenms_plugin.import_utils.Device")
-    @patch("netbox_librenms_plugin.import_utils.find_matching_site")
-    @patch("netbox_librenms_plugin.import_utils.find_matching_platform")
-    @patch("netbox_librenms_plugin.import_utils.match_librenms_hardware_to_device_type")
-    @patch("netbox_librenms_plugin.import_utils.DeviceRole")
-    @patch("netbox_librenms_plugin.import_utils.Cluster")
-    @patch("netbox_librenms_plugin.import_utils.Rack")
-    @patch("netbox_librenms_plugin.import_utils.Site")
-    @patch("netbox_librenms_plugin.import_utils.DeviceType")
-    def test_validate_device_platform_match_found(
-        self,
-        mock_device_type,
-        mock_site_model,
-        mock_rack,
-        mock_cluster,
-        mock_role,
-        mock_match_type,
-        mock_find_platform,
-        mock_find_site,
-        mock_device,
-        mock_vm,
-    ):
-        """Platform matched successfully."""
-        mock_vm.objects.filter.return_value.first.return_value = None
-        mock_device.objects.filter.return_value.first.return_value = None
-        mock_device_type.objects.all.return_value = []
-        mock_find_site.return_value = {
-            "found": False,
-            "site": None,
-            "match_type": None,
-            "confidence": 0.0,
-        }
-        mock_platform = MagicMock(id=1, name="ios")
-        mock_find_platform.return_value = {
-            "found": True,
-            "platform": mock_platform,
-            "match_type": "exact",
-        }
-        mock_match_type.return_value = {
-            "matched": False,
-            "device_type": None,
-            "match_type": None,
-        }
-        mock_role.objects.all.return_value = []
-        mock_cluster.objects.all.return_value = []
-        mock_rack.objects.filter.return_value = []
-        mock_site_model.objects.all.return_value = []
+    def first(self):
+        return self.first_value
 
-        from netbox_librenms_plugin.import_utils import validate_device_for_import
+    def exclude(self, **kwargs):
+        return _FakeQuerySet(first=self.exclude_first_value)
 
-        device_data = {
-            "device_id": 1,
-            "hostname": "switch-01",
-            "os": "ios",
-        }
 
-        result = validate_device_for_import(device_data, include_vc_detection=False)
+# LibreNMS device the conflict-action tests resolve; tests override single keys.
+_CONFLICT_LIBRE_DEVICE = MappingProxyType(
+    {"device_id": 10, "hostname": "switch-01", "sysName": "switch-01.example.com", "serial": "ABC123"}
+)
 
-        assert result["platform"]["found"] is True
-        assert result["platform"]["platform"] == mock_platform
+# Re-validation results for a confirmed conflict; tests add the existing device.
+_VALIDATION_CONFLICT = MappingProxyType({"can_import": False})
+_VALIDATION_MISMATCH = MappingProxyType({**_VALIDATION_CONFLICT, "device_type_mismatch": True})
 
-    @patch("virtualization.models.VirtualMachine")
-    @patch("netbox_librenms_plugin.import_utils.Device")
-    @patch("netbox_librenms_plugin.import_utils.find_matching_site")
-    @patch("netbox_librenms_plugin.import_utils.find_matching_platform")
-    @patch("netbox_librenms_plugin.import_utils.match_librenms_hardware_to_device_type")
-    @patch("netbox_librenms_plugin.import_utils.DeviceRole")
-    @patch("netbox_librenms_plugin.import_utils.Cluster")
-    @patch("netbox_librenms_plugin.import_utils.Rack")
-    @patch("netbox_librenms_plugin.import_utils.Site")
-    def test_validate_device_platform_not_found(
-        self,
-        mock_site_model,
-        mock_rack,
-        mock_cluster,
-        mock_role,
-        mock_match_type,
-        mock_find_platform,
-        mock_find_site,
-        mock_device,
-        mock_vm,
-    ):
-        """Platform not found adds warning (not blocking)."""
-        mock_vm.objects.filter.return_value.first.return_value = None
-        mock_device.objects.filter.return_value.first.return_value = None
-        mock_find_site.return_value = {
-            "found": False,
-            "site": None,
-            "match_type": None,
-            "confidence": 0.0,
-        }
-        mock_find_platform.return_value = {
-            "found": False,
-            "platform": None,
-            "match_type": None,
-        }
-        mock_match_type.return_value = {
-            "matched": False,
-            "device_type": None,
-            "match_type": None,
-        }
-        mock_role.objects.all.return_value = []
-        mock_cluster.objects.all.return_value = []
-        mock_rack.objects.filter.return_value = []
-        mock_site_model.objects.all.return_value = []
+# Values LibreNMS-driven conflict actions write onto an existing device.
+_NEW_DEVICE_TYPE = _Ref(99)
+_NEW_PLATFORM = _Ref(7)
 
-        from netbox_librenms_plugin.import_utils import validate_device_for_import
 
-        device_data = {
-            "device_id": 1,
-            "hostname": "switch-01",
-            "os": "unknown_os",
-        }
+def _make_existing_device(**attrs):
+    """Return a Device-spec'd double with an empty custom_field_data and ``attrs`` applied."""
+    device = MagicMock(spec=Device)
+    device.custom_field_data = {}
+    for name, value in attrs.items():
+        setattr(device, name, value)
+    return device
 
-        result = validate_device_for_import(device_data, include_vc_detection=False)
 
-        assert result["platform"]["found"] is False
+def _make_device_filter(*, serial_hit=None, name_hit=None, librenms_hit=None, serial_conflict=None):
+    """Return a Device.objects.filter side_effect that dispatches on the lookup kwarg."""
 
-    @patch("virtualization.models.VirtualMachine")
-    @patch("netbox_librenms_plugin.import_utils.Device")
-    @patch("netbox_librenms_plugin.import_utils.find_matching_site")
-    @patch("netbox_librenms_plugin.import_utils.find_matching_platform")
-    @patch("netbox_librenms_plugin.import_utils.match_librenms_hardware_to_device_type")
-    @patch("netbox_librenms_plugin.import_utils.DeviceRole")
-    @patch("netbox_librenms_plugin.import_utils.Cluster")
-    @patch("netbox_librenms_plugin.import_utils.Rack")
-    @patch("netbox_librenms_plugin.import_utils.Site")
-    def test_validate_device_type_match_found(
-        self,
-        mock_site_model,
-        mock_rack,
-        mock_cluster,
-        mock_role,
-        mock_match_type,
-        mock_find_platform,
-        mock_find_site,
-        mock_device,
-        mock_vm,
-    ):
-        """Device type matched successfully."""
-        mock_vm.objects.filter.return_value.first.return_value = None
-        mock_device.objects.filter.return_value.first.return_value = None
-        mock_find_site.return_value = {
-            "found": False,
-            "site": None,
-            "match_type": None,
-            "confidence": 0.0,
-        }
-        mock_find_platform.return_value = {
-            "found": False,
-            "platform": None,
-            "match_type": None,
-        }
-        mock_dt = MagicMock(id=1, model="C9300-48P")
-        mock_match_type.return_value = {
-            "matched": True,
-            "device_type": mock_dt,
-            "match_type": "exact",
-        }
-        mock_role.objects.all.return_value = []
-        mock_cluster.objects.all.return_value = []
-        mock_rack.objects.filter.return_value = []
-        mock_site_model.objects.all.return_value = []
+    def device_filter(**kwargs):
+        if LIBRENMS_ID_LOOKUP in kwargs:
+            return _FakeQuerySet(first=librenms_hit)
+        if "serial" in kwargs:
+            return _FakeQuerySet(first=serial_hit, exclude_first=serial_conflict)
+        if "name__iexact" in kwargs:
+            return _FakeQuerySet(first=name_hit)
+        return _FakeQuerySet()
 
-        from netbox_librenms_plugin.import_utils import validate_device_for_import
+    return device_filter
 
-        device_data = {
-            "device_id": 1,
-            "hostname": "switch-01",
-            "hardware": "C9300-48P",
-        }
 
-        result = validate_device_for_import(device_data, include_vc_detection=False)
+@pytest.fixture
+def patch_device_ops():
+    """
+    Patch the models and matchers used by validate_device_for_import.
+
+    Site, platform and device type matchers default to "not found" and all
+    model managers are empty; tests override only the fields they care about.
+    Models are patched where import_utils imports them, except VirtualMachine,
+    which is imported inside the lookups and so is patched at its source module.
+    The cache is replaced so nothing reaches the configured cache backend or
+    the database.
+    """
+    with (
+        patch("virtualization.models.VirtualMachine", new_callable=_make_manager_mock) as mock_vm,
+        patch("netbox_librenms_plugin.import_utils.Device", new_callable=_make_manager_mock) as mock_device,
+        patch("netbox_librenms_plugin.import_utils.find_matching_site") as mock_find_site,
+        patch("netbox_librenms_plugin.import_utils.find_matching_platform") as mock_find_platform,
+        patch("netbox_librenms_plugin.import_utils.match_librenms_hardware_to_device_type") as mock_match_type,
+        patch("netbox_librenms_plugin.import_utils.DeviceRole", new_callable=_make_manager_mock) as mock_role,
+        patch("netbox_librenms_plugin.import_utils.Cluster", new_callable=_make_manager_mock) as mock_cluster,
+        patch("netbox_librenms_plugin.import_utils.Rack", new_callable=_make_manager_mock) as mock_rack,
+        patch("netbox_librenms_plugin.import_utils.Site", new_callable=_make_manager_mock) as mock_site_model,
+        patch("netbox_librenms_plugin.import_utils.DeviceType", new_callable=_make_manager_mock) as mock_device_type,
+        patch("netbox_librenms_plugin.import_utils.cache") as mock_cache,
+    ):
+        # validate_device_for_import mutates match results, so hand out copies
+        mock_find_site.return_value = dict(_SITE_NOT_FOUND)
+        mock_find_platform.return_value = dict(_PLATFORM_NOT_FOUND)
+        mock_match_type.return_value = dict(_DT_NOT_FOUND)
+        # Rack lookups are chained querysets evaluated as a list of racks
+        mock_rack.objects.filter.return_value.select_related.return_value.order_by.return_value = []
+        # Every cached choice list is a miss, so lookups fall through to the mocked managers
+        mock_cache.get.return_value = None
+        yield SimpleNamespace(
+            vm=mock_vm,
+            device=mock_device,
+            find_site=mock_find_site,
+            find_platform=mock_find_platform,
+            match_type=mock_match_type,
+            role=mock_role,
+            cluster=mock_cluster,
+            rack=mock_rack,
+            site_model=mock_site_model,
+            device_type=mock_device_type,
+            cache=mock_cache,
+        )
 
-        assert result["device_type"]["found"] is True
-        assert result["device_type"]["device_type"] == mock_dt
 
-    @patch("virtualization.models.VirtualMachine")
-    @patch("netbox_librenms_plugin.import_utils.Device")
-    @patch("netbox_librenms_plugin.import_utils.find_matching_site")
-    @patch("netbox_librenms_plugin.import_utils.find_matching_platform")
-    @patch("netbox_librenms_plugin.import_utils.match_librenms_hardware_to_device_type")
-    @patch("netbox_librenms_plugin.import_utils.DeviceRole")
-    @patch("netbox_librenms_plugin.import_utils.Cluster")
-    @patch("netbox_librenms_plugin.import_utils.Rack")
-    @patch("netbox_librenms_plugin.import_utils.Site")
-    @patch("netbox_librenms_plugin.import_utils.DeviceType")
-    def test_validate_device_type_not_found(
-        self,
-        mock_device_type,
-        mock_site_model,
-        mock_rack,
-        mock_cluster,
-        mock_role,
-        mock_match_type,
-        mock_find_platform,
-        mock_find_site,
-        mock_device,
-        mock_vm,
-    ):
-        """Device type not found adds validation issue."""
-        mock_vm.objects.filter.return_value.first.return_value = None
-        mock_device.objects.filter.return_value.first.return_value = None
-        mock_device_type.objects.all.return_value = []
-        mock_find_site.return_value = {
-            "found": False,
-            "site": None,
-            "match_type": None,
-            "confidence": 0.0,
-        }
-        mock_find_platform.return_value = {
-            "found": False,
-            "platform": None,
-            "match_type": None,
-        }
-        mock_match_type.return_value = {
-            "matched": False,
-            "device_type": None,
-            "match_type": None,
-        }
-        mock_role.objects.all.return_value = []
-        mock_cluster.objects.all.return_value = []
-        mock_rack.objects.filter.return_value = []
-        mock_site_model.objects.all.return_value = []
+@pytest.fixture
+def device_data_factory():
+    """Build LibreNMS device dicts for validation tests from a common base."""
 
-        from netbox_librenms_plugin.import_utils import validate_device_for_import
+    def _make(**overrides):
+        return {"device_id": 1, "hostname": "switch-01", **overrides}
 
-        device_data = {
-            "device_id": 1,
-            "hostname": "switch-01",
-            "hardware": "Unknown Hardware",
-        }
+    return _make
 
-        result = validate_device_for_import(device_data, include_vc_detection=False)
 
-        assert result["device_type"]["matched"] is False
-        assert any("device type" in issue.lower() for issue in result["issues"])
+@pytest.mark.usefixtures("patch_device_ops")
+class TestDeviceValidation:
+    """Test device validation for import."""
 
-    @patch("virtualization.models.VirtualMachine")
-    @patch("netbox_librenms_plugin.import_utils.Device")
-    @patch("netbox_librenms_plugin.import_utils.find_matching_site")
-    @patch("netbox_librenms_plugin.import_utils.find_matching_platform")
-    @patch("netbox_librenms_plugin.import_utils.match_librenms_hardware_to_device_type")
-    @patch("netbox_librenms_plugin.import_utils.DeviceRole")
-    @patch("netbox_librenms_plugin.import_utils.Cluster")
-    @patch("netbox_librenms_plugin.import_utils.Rack")
-    @patch("netbox_librenms_plugin.import_utils.Site")
-    def test_validate_device_role_required(
-        self,
-        mock_site_model,
-        mock_rack,
-        mock_cluster,
-        mock_role,
-        mock_match_type,
-        mock_find_platform,
-        mock_find_site,
-        mock_device,
-        mock_vm,
-    ):
+    @pytest.mark.parametrize(
+        "matcher,field,value,key,flag",
+        [
+            pytest.param("find_site", "location", "DC1", "site", "found", id="site"),
+            pytest.param("find_platform", "os", "ios", "platform", "found", id="platform"),
+            pytest.param("match_type", "hardware", "C9300-48P", "device_type", "matched", id="device_type"),
+        ],
+    )
+    def test_validate_device_match_found(self, device_data_factory, patch_device_ops, matcher, field, value, key, flag):
+        """Site, platform and device type matches are reported as found."""
+        mocks = patch_device_ops
+        matched_obj = SimpleNamespace(id=1, pk=1)
+        getattr(mocks, matcher).return_value = {flag: True, key: matched_obj, "match_type": "exact"}
+
+        device_data = device_data_factory(**{field: value})
+
+        result = validate_without_vc(device_data)
+
+        assert result[key]["found"] is True
+        assert result[key][key] == matched_obj
+
+    @pytest.mark.parametrize(
+        "field,value,key,flag,issue",
+        [
+            pytest.param("location", "Unknown Location", "site", "found", "site", id="site"),
+            # Missing platform is only a warning, not a blocking issue
+            pytest.param("os", "unknown_os", "platform", "found", None, id="platform"),
+            pytest.param("hardware", "Unknown Hardware", "device_type", "matched", "device type", id="device_type"),
+        ],
+    )
+    def test_validate_device_match_not_found(self, device_data_factory, field, value, key, flag, issue):
+        """Unmatched site/device type add a validation issue; unmatched platform does not block."""
+        device_data = device_data_factory(**{field: value})
+
+        result = validate_without_vc(device_data)
+
+        assert result[key][flag] is False
+        if issue:
+            assert _has_issue(result, issue)
+
+    def test_validate_device_role_required(self, device_data_factory, patch_device_ops):
         """Missing role flagged as required."""
-        mock_vm.objects.filter.return_value.first.return_value = None
-        mock_device.objects.filter.return_value.first.return_value = None
-        mock_site = MagicMock(id=1, name="DC1")
-        mock_find_site.return_value = {
+        mocks = patch_device_ops
+        mock_site = SimpleNamespace(id=1, pk=1, name="DC1")
+        mocks.find_site.return_value = {
             "found": True,
             "site": mock_site,
             "match_type": "exact",
             "confidence": 1.0,
         }
-        mock_find_platform.return_value = {
-            "found": False,
-            "platform": None,
-            "match_type": None,
-        }
-        mock_dt = MagicMock(id=1, model="C9300-48P")
-        mock_match_type.return_value = {
+        mock_dt = SimpleNamespace(id=1, model="C9300-48P")
+        mocks.match_type.return_value = {
             "matched": True,
             "device_type": mock_dt,
             "match_type": "exact",
         }
-        mock_role.objects.all.return_value = [MagicMock(id=1, name="Access Switch")]
-        mock_cluster.objects.all.return_value = []
-        mock_rack.objects.filter.return_value = []
-        mock_site_model.objects.all.return_value = [mock_site]
-
-        from netbox_librenms_plugin.import_utils import validate_device_for_import
+        mocks.role.objects.all.return_value = [SimpleNamespace(id=1, name="Access Switch")]
+        mocks.site_model.objects.all.return_value = [mock_site]
 
-        device_data = {
-            "device_id": 1,
-            "hostname": "switch-01",
-            "location": "DC1",
-            "hardware": "C9300-48P",
-        }
+        device_data = device_data_factory(location="DC1", hardware="C9300-48P")
 
-        result = validate_device_for_import(device_data, include_vc_detection=False)
+        result = validate_without_vc(device_data)
 
         assert result["device_role"]["found"] is False
-        assert any("role" in issue.lower() for issue in result["issues"])
-
-    @patch("virtualization.models.VirtualMachine")
-    @patch("netbox_librenms_plugin.import_utils.Device")
-    @patch("netbox_librenms_plugin.import_utils.find_matching_site")
-    @patch("netbox_librenms_plugin.import_utils.find_matching_platform")
-    @patch("netbox_librenms_plugin.import_utils.match_librenms_hardware_to_device_type")
-    @patch("netbox_librenms_plugin.import_utils.DeviceRole")
-    @patch("netbox_librenms_plugin.import_utils.Cluster")
-    @patch("netbox_librenms_plugin.import_utils.Rack")
-    @patch("netbox_librenms_plugin.import_utils.Site")
-    def test_validate_device_handles_empty_location(
-        self,
-        mock_site_model,
-        mock_rack,
-        mock_cluster,
-        mock_role,
-        mock_match_type,
-        mock_find_platform,
-        mock_find_site,
-        mock_device,
-        mock_vm,
-    ):
-        """Empty location handled gracefully."""
-        mock_vm.objects.filter.return_value.first.return_value = None
-        mock_device.objects.filter.return_value.first.return_value = None
-        mock_find_site.return_value = {
-            "found": False,
-            "site": None,
-            "match_type": None,
-            "confidence": 0.0,
-        }
-        mock_find_platform.return_value = {
-            "found": False,
-            "platform": None,
-            "match_type": None,
-        }
-        mock_match_type.return_value = {
-            "matched": False,
-            "device_type": None,
-            "match_type": None,
-        }
-        mock_role.objects.all.return_value = []
-        mock_cluster.objects.all.return_value = []
-        mock_rack.objects.filter.return_value = []
-        mock_site_model.objects.all.return_value = []
-
-        from netbox_librenms_plugin.import_utils import validate_device_for_import
-
-        device_data = {
-            "device_id": 1,
-            "hostname": "switch-01",
-            "location": "",
-        }
+        assert _has_issue(result, "role")
+
+    @pytest.mark.parametrize(
+        "field,key,flag",
+        [
+            pytest.param("location", "site", "found", id="location"),
+            pytest.param("os", "platform", "found", id="os"),
+            pytest.param("hardware", "device_type", "matched", id="hardware"),
+        ],
+    )
+    def test_validate_device_handles_empty_field(self, device_data_factory, field, key, flag):
+        """Empty location, OS or hardware handled gracefully."""
+        device_data = device_data_factory(**{field: ""})
 
         # Should not raise exception
-        result = validate_device_for_import(device_data, include_vc_detection=False)
+        result = validate_without_vc(device_data)
 
         assert result is not None
-        assert result["site"]["found"] is False
-
-    @patch("virtualization.models.VirtualMachine")
-    @patch("netbox_librenms_plugin.import_utils.Device")
-    @patch("netbox_librenms_plugin.import_utils.find_matching_site")
-    @patch("netbox_librenms_plugin.import_utils.find_matching_platform")
-    @patch("netbox_librenms_plugin.import_utils.match_librenms_hardware_to_device_type")
-    @patch("netbox_librenms_plugin.import_utils.DeviceRole")
-    @patch("netbox_librenms_plugin.import_utils.Cluster")
-    @patch("netbox_librenms_plugin.import_utils.Rack")
-    @patch("netbox_librenms_plugin.import_utils.Site")
-    def test_validate_device_handles_empty_os(
-        self,
-        mock_site_model,
-        mock_rack,
-        mock_cluster,
-        mock_role,
-        mock_match_type,
-        mock_find_platform,
-        mock_find_site,
-        mock_device,
-        mock_vm,
-    ):
-        """Empty OS handled gracefully."""
-        mock_vm.objects.filter.return_value.first.return_value = None
-        mock_device.objects.filter.return_value.first.return_value = None
-        mock_find_site.return_value = {
-            "found": False,
-            "site": None,
-            "match_type": None,
-            "confidence": 0.0,
-        }
-        mock_find_platform.return_value = {
-            "found": False,
-            "platform": None,
-            "match_type": None,
-        }
-        mock_match_type.return_value = {
-            "matched": False,
-            "device_type": None,
-            "match_type": None,
-        }
-        mock_role.objects.all.return_value = []
-        mock_cluster.objects.all.return_value = []
-        mock_rack.objects.filter.return_value = []
-        mock_site_model.objects.all.return_value = []
-
-        from netbox_librenms_plugin.import_utils import validate_device_for_import
+        assert result[key][flag] is False
 
-        device_data = {
-            "device_id": 1,
-            "hostname": "switch-01",
-            "os": "",
-        }
-
-        result = validate_device_for_import(device_data, include_vc_detection=False)
+    def test_validate_device_duplicate_detection(self, device_data_factory, patch_device_ops):
+        """Existing device detected."""
+        mocks = patch_device_ops
+        existing_device = SimpleNamespace(name="switch-01")
+        mocks.device.objects.filter.return_value.first.return_value = existing_device
 
-        assert result is not None
-        assert result["platform"]["found"] is False
+        device_data = device_data_factory()
 
-    @patch("virtualization.models.VirtualMachine")
-    @patch("netbox_librenms_plugin.import_utils.Device")
-    @patch("netbox_librenms_plugin.import_utils.find_matching_site")
-    @patch("netbox_librenms_plugin.import_utils.find_matching_platform")
-    @patch("netbox_librenms_plugin.import_utils.match_librenms_hardware_to_device_type")
-    @patch("netbox_librenms_plugin.import_utils.DeviceRole")
-    @patch("netbox_librenms_plugin.import_utils.Cluster")
-    @patch("netbox_librenms_plugin.import_utils.Rack")
-    @patch("netbox_librenms_plugin.import_utils.Site")
-    @patch("netbox_librenms_plugin.import_utils.DeviceType")
-    def test_validate_device_handles_empty_hardware(
-        self,
-        mock_device_type,
-        mock_site_model,
-        mock_rack,
-        mock_cluster,
-        mock_role,
-        mock_match_type,
-        mock_find_platform,
-        mock_find_site,
-        mock_device,
-        mock_vm,
-    ):
-        """Empty hardware handled gracefully."""
-        mock_vm.objects.filter.return_value.first.return_value = None
-        mock_device.objects.filter.return_value.first.return_value = None
-        mock_device_type.objects.all.return_value = []
-        mock_find_site.return_value = {
-            "found": False,
-            "site": None,
-            "match_type": None,
-            "confidence": 0.0,
-        }
-        mock_find_platform.return_value = {
-            "found": False,
-            "platform": None,
-            "match_type": None,
-        }
-        mock_match_type.return_value = {
-            "matched": False,
-            "device_type": None,
-            "match_type": None,
-        }
-        mock_role.objects.all.return_value = []
-        mock_cluster.objects.all.return_value = []
-        mock_rack.objects.filter.return_value = []
-        mock_site_model.objects.all.return_value = []
+        result = validate_without_vc(device_data)
 
-        from netbox_librenms_plugin.import_utils import validate_device_for_import
+        assert result["existing_device"] == existing_device
+        assert result["can_import"] is False
 
-        device_data = {
-            "device_id": 1,
-            "hostname": "switch-01",
-            "hardware": "",
-        }
+    def test_validate_device_returns_complete_state(self, device_data_factory):
+        """All expected fields in result."""
+        device_data = device_data_factory()
 
-        result = validate_device_for_import(device_data, include_vc_detection=False)
-
-        assert result is not None
-        assert result["device_type"]["matched"] is False
-
-    @patch("virtualization.models.VirtualMachine")
-    @patch("netbox_librenms_plugin.import_utils.Device")
-    @patch("netbox_librenms_plugin.import_utils.find_matching_site")
-    @patch("netbox_librenms_plugin.import_utils.find_matching_platform")
-    @patch("netbox_librenms_plugin.import_utils.match_librenms_hardware_to_device_type")
-    @patch("netbox_librenms_plugin.import_utils.DeviceRole")
-    @patch("netbox_librenms_plugin.import_utils.Cluster")
-    @patch("netbox_librenms_plugin.import_utils.Rack")
-    @patch("netbox_librenms_plugin.import_utils.Site")
-    def test_validate_device_duplicate_detection(
-        self,
-        mock_site_model,
-        mock_rack,
-        mock_cluster,
-        mock_role,
-        mock_match_type,
-        mock_find_platform,
-        mock_find_site,
-        mock_device,
-        mock_vm,
-    ):
-        """Existing device detected."""
-        existing_device = MagicMock()
-        existing_device.name = "switch-01"
-        mock_vm.objects.filter.return_value.first.return_value = None
-        mock_device.objects.filter.return_value.first.return_value = existing_device
-
-        from netbox_librenms_plugin.import_utils import validate_device_for_import
-
-        device_data = {
-            "device_id": 1,
-            "hostname": "switch-01",
-        }
-
-        result = validate_device_for_import(device_data, include_vc_detection=False)
-
-        assert result["existing_device"] == existing_device
-        assert result["can_import"] is False
-
-    @patch("virtualization.models.VirtualMachine")
-    @patch("netbox_librenms_plugin.import_utils.Device")
-    @patch("netbox_librenms_plugin.import_utils.find_matching_site")
-    @patch("netbox_librenms_plugin.import_utils.find_matching_platform")
-    @patch("netbox_librenms_plugin.import_utils.match_librenms_hardware_to_device_type")
-    @patch("netbox_librenms_plugin.import_utils.DeviceRole")
-    @patch("netbox_librenms_plugin.import_utils.Cluster")
-    @patch("netbox_librenms_plugin.import_utils.Rack")
-    @patch("netbox_librenms_plugin.import_utils.Site")
-    def test_validate_device_returns_complete_state(
-        self,
-        mock_site_model,
-        mock_rack,
-        mock_cluster,
-        mock_role,
-        mock_match_type,
-        mock_find_platform,
-        mock_find_site,
-        mock_device,
-        mock_vm,
-    ):
-        """All expected fields in result."""
-        mock_vm.objects.filter.return_value.first.return_value = None
-        mock_device.objects.filter.return_value.first.return_value = None
-        mock_find_site.return_value = {
-            "found": False,
-            "site": None,
-            "match_type": None,
-            "confidence": 0.0,
-        }
-        mock_find_platform.return_value = {
-            "found": False,
-            "platform": None,
-            "match_type": None,
-        }
-        mock_match_type.return_value = {
-            "matched": False,
-            "device_type": None,
-            "match_type": None,
-        }
-        mock_role.objects.all.return_value = []
-        mock_cluster.objects.all.return_value = []
-        mock_rack.objects.filter.return_value = []
-        mock_site_model.objects.all.return_value = []
-
-        from netbox_librenms_plugin.import_utils import validate_device_for_import
-
-        device_data = {
-            "device_id": 1,
-            "hostname": "switch-01",
-        }
-
-        result = validate_device_for_import(device_data, include_vc_detection=False)
+        result = validate_without_vc(device_data)
 
         # Check all expected keys exist
         assert "is_ready" in result
@@ -999,111 +582,243 @@ class TestDeviceValidation:
         assert "cluster" in result
         assert "platform" in result
 
-    @patch("netbox_librenms_plugin.import_utils.cache")
-    @patch("virtualization.models.Cluster")
-    @patch("virtualization.models.VirtualMachine")
-    @patch("netbox_librenms_plugin.import_utils.Device")
-    @patch("netbox_librenms_plugin.import_utils.find_matching_site")
-    @patch("netbox_librenms_plugin.import_utils.find_matching_platform")
-    @patch("netbox_librenms_plugin.import_utils.match_librenms_hardware_to_device_type")
-    @patch("netbox_librenms_plugin.import_utils.DeviceRole")
-    @patch("netbox_librenms_plugin.import_utils.Cluster")
-    @patch("netbox_librenms_plugin.import_utils.Rack")
-    @patch("netbox_librenms_plugin.import_utils.Site")
-    def test_validate_device_import_as_vm(
-        self,
-        mock_site_model,
-        mock_rack,
-        mock_cluster_module,
-        mock_role,
-        mock_match_type,
-        mock_find_platform,
-        mock_find_site,
-        mock_device,
-        mock_vm,
-        mock_cluster_local,
-        mock_cache,
-    ):
+    def test_validate_device_import_as_vm(self, device_data_factory, patch_device_ops):
         """Import as VM mode uses cluster instead of site/device_type."""
-        mock_vm.objects.filter.return_value.first.return_value = None
-        mock_device.objects.filter.return_value.first.return_value = None
-        mock_find_site.return_value = {
-            "found": False,
-            "site": None,
-            "match_type": None,
-            "confidence": 0.0,
-        }
-        mock_find_platform.return_value = {
-            "found": False,
-            "platform": None,
-            "match_type": None,
-        }
-        mock_match_type.return_value = {
-            "matched": False,
-            "device_type": None,
-            "match_type": None,
-        }
-        mock_role.objects.all.return_value = []
-        mock_clusters = [MagicMock(id=1, name="VMware Cluster")]
-        # Cluster is imported locally in the VM path, so we need to mock it there
-        mock_cluster_local.objects.all.return_value = mock_clusters
-        mock_cache.get.return_value = None  # Force cache miss to trigger Cluster.objects.all()
-        mock_rack.objects.filter.return_value = []
-        mock_site_model.objects.all.return_value = []
-
-        from netbox_librenms_plugin.import_utils import validate_device_for_import
+        mock_clusters = [SimpleNamespace(id=1, name="VMware Cluster")]
+        patch_device_ops.cluster.objects.all.return_value = mock_clusters
 
-        device_data = {
-            "device_id": 1,
-            "hostname": "vm-01",
-        }
+        device_data = device_data_factory(hostname="vm-01")
 
-        result = validate_device_for_import(device_data, import_as_vm=True, include_vc_detection=False)
+        result = validate_without_vc(device_data, import_as_vm=True)
 
         assert result["import_as_vm"] is True
         assert result["cluster"]["available_clusters"] == mock_clusters
 
-    @patch("virtualization.models.VirtualMachine")
-    @patch("netbox_librenms_plugin.import_utils.Device")
-    @patch("netbox_librenms_plugin.import_utils.find_matching_site")
-    @patch("netbox_librenms_plugin.import_utils.find_matching_platform")
-    @patch("netbox_librenms_plugin.import_utils.match_librenms_hardware_to_device_type")
-    @patch("netbox_librenms_plugin.import_utils.DeviceRole")
-    @patch("netbox_librenms_plugin.import_utils.Cluster")
-    @patch("netbox_librenms_plugin.import_utils.Rack")
-    @patch("netbox_librenms_plugin.import_utils.Site")
-    def test_validate_device_existing_vm_blocks_import(
-        self,
-        mock_site_model,
-        mock_rack,
-        mock_cluster,
-        mock_role,
-        mock_match_type,
-        mock_find_platform,
-        mock_find_site,
-        mock_device,
-        mock_vm,
-    ):
-        """Existing VM detection blocks import."""
-        existing_vm = MagicMock()
-        existing_vm.name = "vm-01"
-        mock_vm.objects.filter.return_value.first.return_value = existing_vm
-        mock_device.objects.filter.return_value.first.return_value = None
+    def test_validate_device_shared_lookup_cache_loads_roles_once(self, device_data_factory, patch_device_ops):
+        """A lookup_cache shared across a batch loads the role list once."""
+        patch_device_ops.role.objects.all.return_value = [SimpleNamespace(pk=1, name="Switch")]
+        lookup_cache = {}
 
-        from netbox_librenms_plugin.import_utils import validate_device_for_import
+        first = validate_without_vc(device_data_factory(device_id=1), lookup_cache=lookup_cache)
+        second = validate_without_vc(device_data_factory(device_id=2), lookup_cache=lookup_cache)
 
-        device_data = {
-            "device_id": 1,
-            "hostname": "vm-01",
-        }
+        assert first["device_role"]["available_roles"] == second["device_role"]["available_roles"]
+        assert patch_device_ops.role.objects.all.call_count == 1
+        assert patch_device_ops.cache.get.call_count == 1
 
-        result = validate_device_for_import(device_data, include_vc_detection=False)
+    def test_validate_device_shared_lookup_cache_matches_each_value_once(self, device_data_factory, patch_device_ops):
+        """Devices sharing location/hardware/os in a batch run each matcher once."""
+        lookup_cache = {}
+        shared = {"location": "DC1", "hardware": "C9300-48P", "os": "ios"}
+
+        first = validate_without_vc(device_data_factory(device_id=1, **shared), lookup_cache=lookup_cache)
+        second = validate_without_vc(device_data_factory(device_id=2, **shared), lookup_cache=lookup_cache)
+
+        patch_device_ops.find_site.assert_called_once_with("DC1")
+        patch_device_ops.match_type.assert_called_once_with("C9300-48P")
+        patch_device_ops.find_platform.assert_called_once_with("ios")
+        assert first["site"] is not second["site"]
+
+    def test_validate_device_existing_vm_blocks_import(self, device_data_factory, patch_device_ops):
+        """Existing VM detection blocks import."""
+        mocks = patch_device_ops
+        existing_vm = SimpleNamespace(name="vm-01")
+        mocks.vm.objects.filter.return_value.first.return_value = existing_vm
+
+        device_data = device_data_factory(hostname="vm-01")
+
+        result = validate_without_vc(device_data)
 
         assert result["existing_device"] == existing_vm
         assert result["can_import"] is False
         assert result["import_as_vm"] is True
 
 
+class TestPrefetchedExistingObjectLookup:
+    """Test batched existing-object lookups used when validating many devices."""
+
+    def _build(self, devices, vms, libre_devices, **kwargs):
+        with (
+            patch("netbox_librenms_plugin.import_utils.Device") as mock_device,
+            patch("virtualization.models.VirtualMachine") as mock_vm,
+        ):
+            mock_device.objects.select_related.return_value.annotate.return_value.filter.return_value = devices
+            mock_vm.objects.select_related.return_value.annotate.return_value.filter.return_value = vms
+            lookup = PrefetchedExistingObjectLookup(libre_devices, **kwargs)
+        return lookup, mock_device, mock_vm
+
+    @staticmethod
+    def _obj(pk, name, librenms_id=None, serial=""):
+        return SimpleNamespace(
+            pk=pk,
+            name=name,
+            name_lower=name.lower(),
+            serial=serial,
+            custom_field_data={"librenms_id": librenms_id},
+        )
+
+    def test_issues_one_query_per_model(self):
+        """Each model is queried once for the whole batch."""
+        libre_devices = [
+            {"device_id": 1, "hostname": "sw-01", "serial": "ABC"},
+            {"device_id": 2, "hostname": "sw-02", "serial": "-"},
+        ]
+
+        _, mock_device, mock_vm = self._build([], [], libre_devices, use_sysname=False)
+
+        assert mock_device.objects.select_related.return_value.annotate.return_value.filter.call_count == 1
+        assert mock_vm.objects.select_related.return_value.annotate.return_value.filter.call_count == 1
+        mock_device.objects.select_related.assert_called_once_with("role", "device_type")
+        mock_vm.objects.select_related.assert_called_once_with("role")
+
+    def test_resolves_by_librenms_id_name_and_serial(self):
+        """Objects are bucketed by librenms_id, lower-cased name and serial."""
+        by_id = self._obj(1, "core-01", librenms_id=10)
+        by_name = self._obj(2, "SW-02")
+        by_serial = self._obj(3, "edge-03", serial="XYZ")
+        vm = self._obj(4, "vm-01", librenms_id=11)
+
+        lookup, _, _ = self._build([by_id, by_name, by_serial], [vm], [], use_sysname=False)
+
+        assert lookup.device_by_librenms_id(10) is by_id
+        assert lookup.device_by_name("sw-02") is by_name
+        assert lookup.device_by_serial("XYZ") is by_serial
+        assert lookup.vm_by_librenms_id(11) is vm
+        assert lookup.vm_by_name("VM-01") is vm
+        assert lookup.device_by_librenms_id(99) is None
+        assert lookup.device_by_serial("missing") is None
+
+    def test_other_device_with_serial_excludes_pk(self):
+        """Serial conflicts skip the device being compared against."""
+        first = self._obj(1, "sw-01", serial="DUP")
+        second = self._obj(2, "sw-02", serial="DUP")
+
+        lookup, _, _ = self._build([first, second], [], [])
+
+        assert lookup.other_device_with_serial("DUP", 1) is second
+        assert lookup.other_device_with_serial("DUP", 2) is first
+        assert lookup.device_by_serial("DUP") is first
+
+    def test_process_device_filters_prefetches_uncached_devices_only(self):
+        """Only devices without a cached validation feed the shared prefetched lookup."""
+        libre_devices = [{"device_id": n, "hostname": f"sw-0{n}", "status": 1} for n in (1, 2, 3)]
+        cached_key = get_validated_device_cache_key("default", {}, 2, False)
+        api = SimpleNamespace(server_key="default", cache_timeout=300)
+
+        with (
+            patch(
+                "netbox_librenms_plugin.import_utils.get_librenms_devices_for_import",
+                return_value=(libre_devices, True),
+            ),
+            patch("netbox_librenms_plugin.import_utils.cache") as mock_cache,
+            patch("netbox_librenms_plugin.import_utils._refresh_existing_device"),
+            patch("netbox_librenms_plugin.import_utils.PrefetchedExistingObjectLookup") as mock_lookup_cls,
+            patch("netbox_librenms_plugin.import_utils.validate_device_for_import") as mock_validate,
+        ):
+            mock_cache.get_many.return_value = {cached_key: {"_validation": {"existing_device": None}}}
+            mock_validate.side_effect = lambda device, **kwargs: {"existing_device": None}
+            results = process_device_filters(api, {}, vc_detection_enabled=False, clear_cache=False, show_disabled=True)
+
+        assert [device["device_id"] for device in results] == [1, 2, 3]
+        mock_cache.get_many.assert_called_once()
+        mock_lookup_cls.assert_called_once_with(
+            [libre_devices[0], libre_devices[2]], use_sysname=True, strip_domain=False
+        )
+        assert [call.args[0]["device_id"] for call in mock_validate.call_args_list] == [1, 3]
+        for call in mock_validate.call_args_list:
+            assert call.kwargs["existing_lookup"] is mock_lookup_cls.return_value
+
+
+class TestValidationResultCache:
+    """Test caching of whole validate_device_for_import results."""
+
+    @patch("netbox_librenms_plugin.import_utils.cache")
+    def test_cache_key_tracks_data_options_and_version(self, mock_cache):
+        """Key changes with the device data, the options and the cache version."""
+        mock_cache.get.return_value = 0
+        base = get_validation_result_cache_key({"device_id": 1, "hostname": "sw-01"}, use_sysname=True)
+        reordered = get_validation_result_cache_key({"hostname": "sw-01", "device_id": 1}, use_sysname=True)
+        other_data = get_validation_result_cache_key({"device_id": 1, "hostname": "sw-02"}, use_sysname=True)
+        other_option = get_validation_result_cache_key({"device_id": 1, "hostname": "sw-01"}, use_sysname=False)
+        mock_cache.get.return_value = 1
+        next_version = get_validation_result_cache_key({"device_id": 1, "hostname": "sw-01"}, use_sysname=True)
+
+        assert base.startswith("librenms_import_validation_v0_")
+        assert base == reordered
+        assert len({base, other_data, other_option, next_version}) == 4
+
+    @patch("netbox_librenms_plugin.import_utils.find_matching_site")
+    @patch("netbox_librenms_plugin.import_utils.cache")
+    def test_cached_result_skips_validation(self, mock_cache, mock_find_site):
+        """A cached result is returned without running any matching."""
+        cached = {"can_import": True, "issues": []}
+        mock_cache.get.side_effect = lambda key, default=None: 0 if key.endswith("version") else cached
+
+        result = validate_without_vc({"device_id": 1, "hostname": "sw-01"}, cache_result=True)
+
+        assert result is cached
+        mock_find_site.assert_not_called()
+
+    def test_result_stored_on_miss(self, patch_device_ops):
+        """A fresh result is cached under the current version with the short validation timeout."""
+        patch_device_ops.cache.get.side_effect = lambda key, default=None: (
+            3 if key == VALIDATION_RESULT_CACHE_VERSION_KEY else None
+        )
+        libre_device = {"device_id": 1, "hostname": "sw-01"}
+        result = validate_without_vc(libre_device, cache_result=True)
+
+        key, value, timeout = patch_device_ops.cache.set.call_args_list[-1].args
+        expected_key = get_validation_result_cache_key(
+            libre_device, import_as_vm=False, include_vc_detection=False, use_sysname=True, strip_domain=False
+        )
+        assert key == expected_key
+        assert key.startswith("librenms_import_validation_v3_")
+        assert value is result
+        assert timeout == VALIDATION_RESULT_CACHE_TIMEOUT
+
+    def test_result_not_cached_by_default(self, patch_device_ops):
+        """Without cache_result, validation neither reads nor writes a result cache entry."""
+        validate_without_vc({"device_id": 1, "hostname": "sw-01"})
+
+        keys = [c.args[0] for c in patch_device_ops.cache.set.call_args_list]
+        assert not any(k.startswith("librenms_import_validation_v") for k in keys)
+
+    @patch("netbox_librenms_plugin.import_utils.cache")
+    def test_bump_version_increments_or_seeds(self, mock_cache):
+        """The version bump increments the key, seeding it when missing."""
+        _bump_validation_cache_version()
+        mock_cache.incr.assert_called_once_with(VALIDATION_RESULT_CACHE_VERSION_KEY)
+
+        mock_cache.incr.side_effect = ValueError
+        _bump_validation_cache_version()
+        mock_cache.set.assert_called_once_with(VALIDATION_RESULT_CACHE_VERSION_KEY, 1, None)
+
+    @patch("netbox_librenms_plugin.import_utils.transaction")
+    def test_invalidate_defers_bump_to_commit(self, mock_transaction):
+        """Invalidation schedules the version bump for when the transaction commits."""
+        mock_transaction.get_connection.return_value.run_on_commit = []
+
+        invalidate_validation_results(sender=None, using="default")
+
+        mock_transaction.on_commit.assert_called_once_with(_bump_validation_cache_version, using="default")
+
+    @patch("netbox_librenms_plugin.import_utils.transaction")
+    def test_invalidate_bumps_once_per_transaction(self, mock_transaction):
+        """A bump already pending in the transaction is not scheduled again."""
+        mock_transaction.get_connection.return_value.run_on_commit = [(set(), _bump_validation_cache_version, False)]
+
+        invalidate_validation_results(sender=None, using="default")
+
+        mock_transaction.on_commit.assert_not_called()
+
+    @patch("netbox_librenms_plugin.import_utils.transaction")
+    def test_invalidate_ignores_raw_saves(self, mock_transaction):
+        """Fixture loading (raw saves) does not invalidate cached results."""
+        invalidate_validation_results(sender=None, raw=True)
+
+        mock_transaction.on_commit.assert_not_called()
+
+
 class TestDeviceNamingPreferences:
     """Test that validation honours use_sysname and strip_domain user preferences."""
 
@@ -1119,53 +834,50 @@ class TestDeviceNamingPreferences:
         "virtualization.models.VirtualMachine",
     ]
 
-    def _setup_no_existing(self, mocks):
+    @pytest.fixture(autouse=True)
+    def _patched(self):
+        """Patch validation dependencies for each test; no existing device is found."""
+        with contextlib.ExitStack() as stack:
+            (
+                self.mock_site_model,
+                self.mock_rack,
+                self.mock_cluster,
+                self.mock_role,
+                self.mock_match_type,
+                self.mock_find_platform,
+                self.mock_find_site,
+                self.mock_device,
+                self.mock_vm,
+            ) = [stack.enter_context(patch(p)) for p in self.COMMON_PATCHES]
+            self._setup_no_existing()
+            yield
+
+    def _setup_no_existing(self):
         """Configure mocks so no existing device is found."""
-        mock_vm = mocks[-1]  # VirtualMachine
-        mock_device = mocks[-2]  # Device
-        mock_find_site = mocks[-3]
-        mock_find_platform = mocks[-4]
-        mock_match_type = mocks[-5]
-        mock_role = mocks[-6]
-        mock_rack = mocks[-8]
-        mock_site_model = mocks[-9]
-
-        mock_vm.objects.filter.return_value.first.return_value = None
-        mock_device.objects.filter.return_value.first.return_value = None
-        mock_find_site.return_value = {
+        self.mock_vm.objects.filter.return_value.first.return_value = None
+        self.mock_device.objects.filter.return_value.first.return_value = None
+        self.mock_find_site.return_value = {
             "found": False,
             "site": None,
             "match_type": None,
             "confidence": 0.0,
         }
-        mock_find_platform.return_value = {
+        self.mock_find_platform.return_value = {
             "found": False,
             "platform": None,
             "match_type": None,
         }
-        mock_match_type.return_value = {
+        self.mock_match_type.return_value = {
             "matched": False,
             "device_type": None,
             "match_type": None,
         }
-        mock_role.objects.all.return_value = []
-        mock_rack.objects.filter.return_value = []
-        mock_site_model.objects.all.return_value = []
+        self.mock_role.objects.all.return_value = []
+        self.mock_rack.objects.filter.return_value = []
+        self.mock_site_model.objects.all.return_value = []
 
-    @patch("virtualization.models.VirtualMachine")
-    @patch("netbox_librenms_plugin.import_utils.Device")
-    @patch("netbox_librenms_plugin.import_utils.find_matching_site")
-    @patch("netbox_librenms_plugin.import_utils.find_matching_platform")
-    @patch("netbox_librenms_plugin.import_utils.match_librenms_hardware_to_device_type")
-    @patch("netbox_librenms_plugin.import_utils.DeviceRole")
-    @patch("netbox_librenms_plugin.import_utils.Cluster")
-    @patch("netbox_librenms_plugin.import_utils.Rack")
-    @patch("netbox_librenms_plugin.import_utils.Site")
-    def test_resolved_name_uses_sysname_by_default(self, *mocks):
+    def test_resolved_name_uses_sysname_by_default(self):
         """Default use_sysname=True uses sysName for resolved_name."""
-        self._setup_no_existing(mocks)
-        from netbox_librenms_plugin.import_utils import validate_device_for_import
-
         device_data = {
             "device_id": 1,
             "hostname": "10.0.0.1",
@@ -1174,20 +886,8 @@ class TestDeviceNamingPreferences:
         result = validate_device_for_import(device_data, include_vc_detection=False)
         assert result["resolved_name"] == "core-switch"
 
-    @patch("virtualization.models.VirtualMachine")
-    @patch("netbox_librenms_plugin.import_utils.Device")
-    @patch("netbox_librenms_plugin.import_utils.find_matching_site")
-    @patch("netbox_librenms_plugin.import_utils.find_matching_platform")
-    @patch("netbox_librenms_plugin.import_utils.match_librenms_hardware_to_device_type")
-    @patch("netbox_librenms_plugin.import_utils.DeviceRole")
-    @patch("netbox_librenms_plugin.import_utils.Cluster")
-    @patch("netbox_librenms_plugin.import_utils.Rack")
-    @patch("netbox_librenms_plugin.import_utils.Site")
-    def test_resolved_name_uses_hostname_when_sysname_disabled(self, *mocks):
+    def test_resolved_name_uses_hostname_when_sysname_disabled(self):
         """use_sysname=False uses hostname for resolved_name."""
-        self._setup_no_existing(mocks)
-        from netbox_librenms_plugin.import_utils import validate_device_for_import
-
         device_data = {
             "device_id": 1,
             "hostname": "10.0.0.1",
@@ -1200,20 +900,8 @@ class TestDeviceNamingPreferences:
         )
         assert result["resolved_name"] == "10.0.0.1"
 
-    @patch("virtualization.models.VirtualMachine")
-    @patch("netbox_librenms_plugin.import_utils.Device")
-    @patch("netbox_librenms_plugin.import_utils.find_matching_site")
-    @patch("netbox_librenms_plugin.import_utils.find_matching_platform")
-    @patch("netbox_librenms_plugin.import_utils.match_librenms_hardware_to_device_type")
-    @patch("netbox_librenms_plugin.import_utils.DeviceRole")
-    @patch("netbox_librenms_plugin.import_utils.Cluster")
-    @patch("netbox_librenms_plugin.import_utils.Rack")
-    @patch("netbox_librenms_plugin.import_utils.Site")
-    def test_resolved_name_strips_domain(self, *mocks):
+    def test_resolved_name_strips_domain(self):
         """strip_domain=True strips the domain suffix."""
-        self._setup_no_existing(mocks)
-        from netbox_librenms_plugin.import_utils import validate_device_for_import
-
         device_data = {
             "device_id": 1,
             "hostname": "switch-01.example.com",
@@ -1226,28 +914,12 @@ class TestDeviceNamingPreferences:
         )
         assert result["resolved_name"] == "switch-01"
 
-    @patch("virtualization.models.VirtualMachine")
-    @patch("netbox_librenms_plugin.import_utils.Device")
-    @patch("netbox_librenms_plugin.import_utils.find_matching_site")
-    @patch("netbox_librenms_plugin.import_utils.find_matching_platform")
-    @patch("netbox_librenms_plugin.import_utils.match_librenms_hardware_to_device_type")
-    @patch("netbox_librenms_plugin.import_utils.DeviceRole")
-    @patch("netbox_librenms_plugin.import_utils.Cluster")
-    @patch("netbox_librenms_plugin.import_utils.Rack")
-    @patch("netbox_librenms_plugin.import_utils.Site")
-    def test_duplicate_detection_uses_resolved_name(self, *mocks):
+    def test_duplicate_detection_uses_resolved_name(self):
         """Duplicate detection should match against the resolved name, not raw hostname."""
-        self._setup_no_existing(mocks)
-
-        mock_device = mocks[-2]  # Device
         # The first filter call (librenms_id) returns None,
         # the second filter call (name__iexact) returns the existing device.
-        existing = MagicMock()
-        existing.name = "core-switch"
-        existing.serial = ""
-        mock_device.objects.filter.return_value.first.side_effect = [None, existing]
-
-        from netbox_librenms_plugin.import_utils import validate_device_for_import
+        existing = SimpleNamespace(pk=1, name="core-switch", serial="")
+        self.mock_device.objects.filter.return_value.first.side_effect = [None, existing]
 
         device_data = {
             "device_id": 999,
@@ -1261,20 +933,8 @@ class TestDeviceNamingPreferences:
         assert result["existing_device"] == existing
         assert result["existing_match_type"] == "hostname"
 
-    @patch("virtualization.models.VirtualMachine")
-    @patch("netbox_librenms_plugin.import_utils.Device")
-    @patch("netbox_librenms_plugin.import_utils.find_matching_site")
-    @patch("netbox_librenms_plugin.import_utils.find_matching_platform")
-    @patch("netbox_librenms_plugin.import_utils.match_librenms_hardware_to_device_type")
-    @patch("netbox_librenms_plugin.import_utils.DeviceRole")
-    @patch("netbox_librenms_plugin.import_utils.Cluster")
-    @patch("netbox_librenms_plugin.import_utils.Rack")
-    @patch("netbox_librenms_plugin.import_utils.Site")
-    def test_backward_compatible_defaults(self, *mocks):
+    def test_backward_compatible_defaults(self):
         """Calling without naming params produces resolved_name in result."""
-        self._setup_no_existing(mocks)
-        from netbox_librenms_plugin.import_utils import validate_device_for_import
-
         device_data = {
             "device_id": 1,
             "hostname": "switch-01",
@@ -1350,15 +1010,7 @@ class TestNameMatchesWithNamingPreferences:
         else:
             self.mock_vm.objects.filter.return_value.first.return_value = None
 
-            def device_filter(**kwargs):
-                result = MagicMock()
-                if "custom_field_data__librenms_id" in kwargs:
-                    result.first.return_value = existing_device
-                else:
-                    result.first.return_value = None
-                return result
-
-            self.mock_device.objects.filter.side_effect = device_filter
+            self.mock_device.objects.filter.side_effect = _make_device_filter(librenms_hit=existing_device)
 
     def setup_method(self):
         """Set up common patches."""
@@ -1370,17 +1022,11 @@ class TestNameMatchesWithNamingPreferences:
 
     def test_name_matches_with_strip_domain(self):
         """strip_domain=True: FQDN in LibreNMS matches short name in NetBox."""
-        existing = MagicMock()
-        existing.name = "router"
-        existing.serial = ""
-        existing.virtual_chassis = None
-        existing.vc_position = None
+        existing = SimpleNamespace(pk=1, name="router", serial="", virtual_chassis=None, vc_position=None)
 
         self._setup_librenms_id_match(existing)
         self._configure_standard_mocks()
 
-        from netbox_librenms_plugin.import_utils import validate_device_for_import
-
         device_data = {
             "device_id": 1,
             "hostname": "router.example.com",
@@ -1398,17 +1044,11 @@ class TestNameMatchesWithNamingPreferences:
 
     def test_name_matches_uses_hostname_when_sysname_disabled(self):
         """use_sysname=False: matches against hostname instead of sysName."""
-        existing = MagicMock()
-        existing.name = "10.0.0.1"
-        existing.serial = ""
-        existing.virtual_chassis = None
-        existing.vc_position = None
+        existing = SimpleNamespace(pk=1, name="10.0.0.1", serial="", virtual_chassis=None, vc_position=None)
 
         self._setup_librenms_id_match(existing)
         self._configure_standard_mocks()
 
-        from netbox_librenms_plugin.import_utils import validate_device_for_import
-
         device_data = {
             "device_id": 1,
             "hostname": "10.0.0.1",
@@ -1425,17 +1065,11 @@ class TestNameMatchesWithNamingPreferences:
 
     def test_name_mismatch_offers_sync_with_resolved_name(self):
         """When names don't match, suggested_name is the resolved name, not raw sysName."""
-        existing = MagicMock()
-        existing.name = "old-device"
-        existing.serial = ""
-        existing.virtual_chassis = None
-        existing.vc_position = None
+        existing = SimpleNamespace(pk=1, name="old-device", serial="", virtual_chassis=None, vc_position=None)
 
         self._setup_librenms_id_match(existing)
         self._configure_standard_mocks()
 
-        from netbox_librenms_plugin.import_utils import validate_device_for_import
-
         device_data = {
             "device_id": 1,
             "hostname": "new-switch.example.com",
@@ -1456,17 +1090,12 @@ class TestNameMatchesWithNamingPreferences:
         """VC member: name matches when existing device name matches generated VC name."""
         mock_vc_name.return_value = "switch-M2"
 
-        existing = MagicMock()
-        existing.name = "switch-M2"
-        existing.serial = "SN123"
-        existing.virtual_chassis = MagicMock()  # Not None → device is a VC member
-        existing.vc_position = 2
+        # virtual_chassis is not None, so the device is a VC member
+        existing = SimpleNamespace(pk=1, name="switch-M2", serial="SN123", virtual_chassis=_Ref(1), vc_position=2)
 
         self._setup_librenms_id_match(existing)
         self._configure_standard_mocks()
 
-        from netbox_librenms_plugin.import_utils import validate_device_for_import
-
         device_data = {
             "device_id": 1,
             "hostname": "switch",
@@ -1487,17 +1116,13 @@ class TestNameMatchesWithNamingPreferences:
         """VC member + strip_domain: FQDN resolved to short name matches VC pattern."""
         mock_vc_name.return_value = "siteA-9300-1 (2)"
 
-        existing = MagicMock()
-        existing.name = "siteA-9300-1 (2)"
-        existing.serial = "SN456"
-        existing.virtual_chassis = MagicMock()
-        existing.vc_position = 2
+        existing = SimpleNamespace(
+            pk=1, name="siteA-9300-1 (2)", serial="SN456", virtual_chassis=_Ref(1), vc_position=2
+        )
 
         self._setup_librenms_id_match(existing)
         self._configure_standard_mocks()
 
-        from netbox_librenms_plugin.import_utils import validate_device_for_import
-
         device_data = {
             "device_id": 555,
             "hostname": "siteA-9300-1.example.net.com",
@@ -1519,17 +1144,11 @@ class TestNameMatchesWithNamingPreferences:
         """VC member name mismatch: suggested_name should be the expected VC name."""
         mock_vc_name.return_value = "new-switch-M2"
 
-        existing = MagicMock()
-        existing.name = "old-switch-M2"
-        existing.serial = "SN789"
-        existing.virtual_chassis = MagicMock()
-        existing.vc_position = 2
+        existing = SimpleNamespace(pk=1, name="old-switch-M2", serial="SN789", virtual_chassis=_Ref(1), vc_position=2)
 
         self._setup_librenms_id_match(existing)
         self._configure_standard_mocks()
 
-        from netbox_librenms_plugin.import_utils import validate_device_for_import
-
         device_data = {
             "device_id": 1,
             "hostname": "new-switch",
@@ -1546,14 +1165,11 @@ class TestNameMatchesWithNamingPreferences:
 
     def test_vm_name_matches_with_strip_domain(self):
         """VM name comparison also uses resolved name, not raw sysName."""
-        existing_vm = MagicMock()
-        existing_vm.name = "vm-server"
+        existing_vm = SimpleNamespace(pk=1, name="vm-server")
 
         self._setup_librenms_id_match(existing_vm, as_vm=True)
         self._configure_standard_mocks()
 
-        from netbox_librenms_plugin.import_utils import validate_device_for_import
-
         device_data = {
             "device_id": 1,
             "hostname": "vm-server.example.com",
@@ -1570,17 +1186,11 @@ class TestNameMatchesWithNamingPreferences:
 
     def test_name_matches_exact_without_vc(self):
         """Standalone device: exact name match works without VC check."""
-        existing = MagicMock()
-        existing.name = "core-router"
-        existing.serial = ""
-        existing.virtual_chassis = None
-        existing.vc_position = None
+        existing = SimpleNamespace(pk=1, name="core-router", serial="", virtual_chassis=None, vc_position=None)
 
         self._setup_librenms_id_match(existing)
         self._configure_standard_mocks()
 
-        from netbox_librenms_plugin.import_utils import validate_device_for_import
-
         device_data = {
             "device_id": 1,
             "hostname": "core-router",
@@ -1610,10 +1220,21 @@ class TestSerialNumberMatching:
         "virtualization.models.VirtualMachine",
     ]
 
-    def _start_patches(self):
-        """Start all common patches and return mocks in standard order."""
-        self._patchers = [patch(p) for p in self.SERIAL_PATCHES]
-        mocks = [p.start() for p in self._patchers]
+    @classmethod
+    def setup_class(cls):
+        """Start the common patches once for the whole class."""
+        cls._stack = contextlib.ExitStack()
+        cls._mocks = [cls._stack.enter_context(patch(p)) for p in cls.SERIAL_PATCHES]
+
+    @classmethod
+    def teardown_class(cls):
+        """Stop the class-wide patches."""
+        cls._stack.close()
+
+    def setup_method(self):
+        """Reset the shared mocks and bind them in standard order."""
+        for mock in self._mocks:
+            mock.reset_mock(return_value=True, side_effect=True)
         (
             self.mock_site_model,
             self.mock_rack,
@@ -1624,40 +1245,15 @@ class TestSerialNumberMatching:
             self.mock_find_site,
             self.mock_device,
             self.mock_vm,
-        ) = mocks
-
-    def _stop_patches(self):
-        """Stop all patches."""
-        for p in self._patchers:
-            p.stop()
-
-    def setup_method(self):
-        """Set up common patches for serial number tests."""
-        self._start_patches()
-
-    def teardown_method(self):
-        """Tear down patches."""
-        self._stop_patches()
+        ) = self._mocks
 
     def test_serial_match_blocks_import(self):
         """Device with matching serial blocks import."""
-        existing = MagicMock()
-        existing.name = "existing-device"
-        existing.serial = "ABC123"
+        existing = SimpleNamespace(pk=1, name="existing-device", serial="ABC123")
 
         self.mock_vm.objects.filter.return_value.first.return_value = None
 
-        def device_filter(**kwargs):
-            result = MagicMock()
-            if "serial" in kwargs:
-                result.first.return_value = existing
-            else:
-                result.first.return_value = None
-            return result
-
-        self.mock_device.objects.filter.side_effect = device_filter
-
-        from netbox_librenms_plugin.import_utils import validate_device_for_import
+        self.mock_device.objects.filter.side_effect = _make_device_filter(serial_hit=existing)
 
         device_data = {"device_id": 1, "hostname": "new-hostname", "serial": "ABC123"}
         result = validate_device_for_import(device_data, include_vc_detection=False)
@@ -1668,23 +1264,11 @@ class TestSerialNumberMatching:
 
     def test_serial_match_same_hostname_offers_link(self):
         """Serial + hostname match offers link action."""
-        existing = MagicMock()
-        existing.name = "switch-01"
-        existing.serial = "ABC123"
+        existing = SimpleNamespace(pk=1, name="switch-01", serial="ABC123")
 
         self.mock_vm.objects.filter.return_value.first.return_value = None
 
-        def device_filter(**kwargs):
-            result = MagicMock()
-            if "serial" in kwargs:
-                result.first.return_value = existing
-            else:
-                result.first.return_value = None
-            return result
-
-        self.mock_device.objects.filter.side_effect = device_filter
-
-        from netbox_librenms_plugin.import_utils import validate_device_for_import
+        self.mock_device.objects.filter.side_effect = _make_device_filter(serial_hit=existing)
 
         device_data = {"device_id": 1, "hostname": "switch-01", "serial": "ABC123"}
         result = validate_device_for_import(device_data, include_vc_detection=False)
@@ -1695,23 +1279,11 @@ class TestSerialNumberMatching:
 
     def test_serial_match_diff_hostname_offers_hostname_differs(self):
         """Serial matches but hostname differs offers hostname_differs action."""
-        existing = MagicMock()
-        existing.name = "old-hostname"
-        existing.serial = "ABC123"
+        existing = SimpleNamespace(pk=1, name="old-hostname", serial="ABC123")
 
         self.mock_vm.objects.filter.return_value.first.return_value = None
 
-        def device_filter(**kwargs):
-            result = MagicMock()
-            if "serial" in kwargs:
-                result.first.return_value = existing
-            else:
-                result.first.return_value = None
-            return result
-
-        self.mock_device.objects.filter.side_effect = device_filter
-
-        from netbox_librenms_plugin.import_utils import validate_device_for_import
+        self.mock_device.objects.filter.side_effect = _make_device_filter(serial_hit=existing)
 
         device_data = {"device_id": 1, "hostname": "new-hostname", "serial": "ABC123"}
         result = validate_device_for_import(device_data, include_vc_detection=False)
@@ -1722,26 +1294,11 @@ class TestSerialNumberMatching:
 
     def test_hostname_match_diff_serial_offers_update(self):
         """Hostname matches but serial differs offers update_serial action."""
-        existing = MagicMock()
-        existing.name = "switch-01"
-        existing.serial = "OLD_SERIAL"
+        existing = SimpleNamespace(pk=1, name="switch-01", serial="OLD_SERIAL")
 
         self.mock_vm.objects.filter.return_value.first.return_value = None
 
-        def device_filter(**kwargs):
-            result = MagicMock()
-            if "name__iexact" in kwargs:
-                result.first.return_value = existing
-            elif "serial" in kwargs:
-                result.first.return_value = None
-                result.exclude.return_value.first.return_value = None
-            else:
-                result.first.return_value = None
-            return result
-
-        self.mock_device.objects.filter.side_effect = device_filter
-
-        from netbox_librenms_plugin.import_utils import validate_device_for_import
+        self.mock_device.objects.filter.side_effect = _make_device_filter(name_hit=existing)
 
         device_data = {"device_id": 1, "hostname": "switch-01", "serial": "NEW_SERIAL"}
         result = validate_device_for_import(device_data, include_vc_detection=False)
@@ -1750,78 +1307,66 @@ class TestSerialNumberMatching:
         assert result["existing_match_type"] == "hostname"
         assert "Hardware may have been replaced" in result["warnings"][0]
 
-    def _setup_no_match_mocks(self):
-        """Configure mocks for tests where no device match is expected."""
+    def _setup_validation_mocks(self, site=None, device_type=None, roles=()):
+        """
+        Configure the site/platform/type matchers and choice querysets.
+
+        Nothing matches unless ``site`` or ``device_type`` is given; tests that
+        expect an existing device set ``mock_device.objects.filter.side_effect``.
+        """
         self.mock_vm.objects.filter.return_value.first.return_value = None
         self.mock_device.objects.filter.return_value.first.return_value = None
-        self.mock_find_site.return_value = {"found": False, "site": None, "match_type": None, "confidence": 0}
+        self.mock_find_site.return_value = {
+            "found": site is not None,
+            "site": site,
+            "match_type": "exact" if site is not None else None,
+            "confidence": 1.0 if site is not None else 0,
+        }
         self.mock_find_platform.return_value = {"found": False, "platform": None, "match_type": None}
-        self.mock_match_type.return_value = {"matched": False, "device_type": None, "match_type": None}
-        self.mock_role.objects.all.return_value = []
+        self.mock_match_type.return_value = {
+            "matched": device_type is not None,
+            "device_type": device_type,
+            "match_type": "exact" if device_type is not None else None,
+        }
+        self.mock_role.objects.all.return_value = list(roles)
         self.mock_cluster.objects.all.return_value = []
         self.mock_rack.objects.filter.return_value = []
         self.mock_site_model.objects.all.return_value = []
 
-    def test_serial_dash_ignored(self):
-        """Serial '-' is not treated as a match."""
-        self._setup_no_match_mocks()
-
-        from netbox_librenms_plugin.import_utils import validate_device_for_import
-
-        device_data = {"device_id": 1, "hostname": "switch-01", "serial": "-"}
-        result = validate_device_for_import(device_data, include_vc_detection=False)
-
-        assert result["existing_match_type"] is None
-        assert result["serial_action"] is None
-
-    def test_serial_empty_ignored(self):
-        """Empty serial skips serial matching."""
-        self._setup_no_match_mocks()
-
-        from netbox_librenms_plugin.import_utils import validate_device_for_import
-
-        device_data = {"device_id": 1, "hostname": "switch-01", "serial": ""}
-        result = validate_device_for_import(device_data, include_vc_detection=False)
-
-        assert result["existing_match_type"] is None
-        assert result["serial_action"] is None
-
-    def test_serial_none_ignored(self):
-        """None serial skips serial matching."""
-        self._setup_no_match_mocks()
-
-        from netbox_librenms_plugin.import_utils import validate_device_for_import
-
-        device_data = {"device_id": 1, "hostname": "switch-01", "serial": None}
+    @pytest.mark.parametrize(
+        "serial",
+        [
+            pytest.param("-", id="dash"),
+            pytest.param("", id="empty"),
+            pytest.param(None, id="none"),
+            pytest.param("N/A", id="n/a"),
+            pytest.param(" unknown ", id="unknown-padded"),
+            pytest.param("None", id="none-string"),
+            pytest.param("  ", id="whitespace"),
+        ],
+    )
+    def test_serial_placeholder_ignored(self, serial):
+        """Missing and placeholder serials skip serial matching."""
+        self._setup_validation_mocks()
+
+        device_data = {"device_id": 1, "hostname": "switch-01", "serial": serial}
         result = validate_device_for_import(device_data, include_vc_detection=False)
 
         assert result["existing_match_type"] is None
         assert result["serial_action"] is None
+        assert not any("serial" in c.kwargs for c in self.mock_device.objects.filter.call_args_list)
 
     def test_hostname_match_serial_conflict_warns(self):
         """Hostname matches, incoming serial already on another device warns about conflict."""
-        hostname_device = MagicMock()
-        hostname_device.name = "switch-01"
-        hostname_device.serial = "OLD_SERIAL"
+        hostname_device = SimpleNamespace(pk=1, name="switch-01", serial="OLD_SERIAL")
 
-        serial_conflict_device = MagicMock()
-        serial_conflict_device.name = "other-device"
+        serial_conflict_device = SimpleNamespace(pk=2, name="other-device")
 
         self.mock_vm.objects.filter.return_value.first.return_value = None
 
-        def device_filter(**kwargs):
-            result = MagicMock()
-            if "name__iexact" in kwargs:
-                result.first.return_value = hostname_device
-            elif "serial" in kwargs:
-                result.exclude.return_value.first.return_value = serial_conflict_device
-            else:
-                result.first.return_value = None
-            return result
-
-        self.mock_device.objects.filter.side_effect = device_filter
-
-        from netbox_librenms_plugin.import_utils import validate_device_for_import
+        self.mock_device.objects.filter.side_effect = _make_device_filter(
+            name_hit=hostname_device, serial_conflict=serial_conflict_device
+        )
 
         device_data = {"device_id": 1, "hostname": "switch-01", "serial": "CONFLICTING_SERIAL"}
         result = validate_device_for_import(device_data, include_vc_detection=False)
@@ -1830,116 +1375,50 @@ class TestSerialNumberMatching:
         assert result["existing_match_type"] == "hostname"
         assert "Serial conflict" in result["warnings"][0]
 
-    def test_librenms_id_match_shows_serial_confirmed(self):
-        """librenms_id match with matching serial shows confirmation."""
-        existing = MagicMock()
-        existing.name = "switch-01"
-        existing.serial = "ABC123"
-
-        self.mock_vm.objects.filter.return_value.first.return_value = None
-
-        def device_filter(**kwargs):
-            result = MagicMock()
-            if "custom_field_data__librenms_id" in kwargs:
-                result.first.return_value = existing
-            else:
-                result.first.return_value = None
-            return result
-
-        self.mock_device.objects.filter.side_effect = device_filter
-        self.mock_find_site.return_value = {
-            "found": True,
-            "site": MagicMock(),
-            "match_type": "exact",
-            "confidence": 1.0,
-        }
-        self.mock_find_platform.return_value = {"found": False, "platform": None, "match_type": None}
-        self.mock_match_type.return_value = {"matched": False, "device_type": None, "match_type": None}
-        self.mock_role.objects.all.return_value = []
-        self.mock_cluster.objects.all.return_value = []
-        self.mock_rack.objects.filter.return_value = []
-        self.mock_site_model.objects.all.return_value = []
+    @pytest.mark.parametrize(
+        "existing_serial, serial_conflict, expected_confirmed, expected_action, expected_warning",
+        [
+            pytest.param("NEW_SERIAL", None, True, None, None, id="confirmed"),
+            pytest.param("OLD_SERIAL", None, False, "update_serial", "Hardware may have been replaced", id="drift"),
+            pytest.param(
+                "OLD_SERIAL",
+                SimpleNamespace(pk=2, name="other-device"),
+                False,
+                "conflict",
+                "Serial conflict",
+                id="conflict",
+            ),
+        ],
+    )
+    def test_librenms_id_match_serial_check(
+        self, existing_serial, serial_conflict, expected_confirmed, expected_action, expected_warning
+    ):
+        """librenms_id match compares serials: confirmed, drifted, or owned by another device."""
+        existing = SimpleNamespace(pk=1, name="switch-01", serial=existing_serial)
 
-        from netbox_librenms_plugin.import_utils import validate_device_for_import
+        self._setup_validation_mocks(site=MagicMock())
+        self.mock_device.objects.filter.side_effect = _make_device_filter(
+            librenms_hit=existing, serial_conflict=serial_conflict
+        )
 
-        device_data = {"device_id": 1, "hostname": "switch-01", "sysName": "switch-01", "serial": "ABC123"}
+        device_data = {"device_id": 1, "hostname": "switch-01", "sysName": "switch-01", "serial": "NEW_SERIAL"}
         result = validate_device_for_import(device_data, include_vc_detection=False)
 
         assert result["existing_match_type"] == "librenms_id"
         assert result["can_import"] is False
-        assert result["serial_confirmed"] is True
         assert result["name_matches"] is True
-
-    def test_librenms_id_match_detects_serial_drift(self):
-        """librenms_id match with different serial warns about drift."""
-        existing = MagicMock()
-        existing.name = "switch-01"
-        existing.serial = "OLD_SERIAL"
-
-        self.mock_vm.objects.filter.return_value.first.return_value = None
-
-        def device_filter(**kwargs):
-            result = MagicMock()
-            if "custom_field_data__librenms_id" in kwargs:
-                result.first.return_value = existing
-            elif "serial" in kwargs:
-                result.first.return_value = None
-                result.exclude.return_value.first.return_value = None
-            else:
-                result.first.return_value = None
-            return result
-
-        self.mock_device.objects.filter.side_effect = device_filter
-        self.mock_find_site.return_value = {
-            "found": True,
-            "site": MagicMock(),
-            "match_type": "exact",
-            "confidence": 1.0,
-        }
-        self.mock_find_platform.return_value = {"found": False, "platform": None, "match_type": None}
-        self.mock_match_type.return_value = {"matched": False, "device_type": None, "match_type": None}
-        self.mock_role.objects.all.return_value = []
-        self.mock_cluster.objects.all.return_value = []
-        self.mock_rack.objects.filter.return_value = []
-        self.mock_site_model.objects.all.return_value = []
-
-        from netbox_librenms_plugin.import_utils import validate_device_for_import
-
-        device_data = {"device_id": 1, "hostname": "switch-01", "serial": "NEW_SERIAL"}
-        result = validate_device_for_import(device_data, include_vc_detection=False)
-
-        assert result["existing_match_type"] == "librenms_id"
-        assert result["serial_action"] == "update_serial"
-        assert any("Hardware may have been replaced" in w for w in result["warnings"])
+        assert result["serial_confirmed"] is expected_confirmed
+        assert result["serial_action"] == expected_action
+        if expected_warning:
+            assert any(expected_warning in w for w in result["warnings"])
 
     def test_librenms_id_match_still_validates_site(self):
         """librenms_id match continues to populate site/type validation."""
-        existing = MagicMock()
-        existing.name = "switch-01"
-        existing.serial = ""
+        existing = SimpleNamespace(pk=1, name="switch-01", serial="")
 
-        self.mock_vm.objects.filter.return_value.first.return_value = None
-
-        def device_filter(**kwargs):
-            result = MagicMock()
-            if "custom_field_data__librenms_id" in kwargs:
-                result.first.return_value = existing
-            else:
-                result.first.return_value = None
-            return result
-
-        self.mock_device.objects.filter.side_effect = device_filter
         mock_site = MagicMock(id=1, name="DC1")
-        self.mock_find_site.return_value = {"found": True, "site": mock_site, "match_type": "exact", "confidence": 1.0}
-        self.mock_find_platform.return_value = {"found": False, "platform": None, "match_type": None}
-        mock_dt = MagicMock()
-        self.mock_match_type.return_value = {"matched": True, "device_type": mock_dt, "match_type": "exact"}
-        self.mock_role.objects.all.return_value = []
-        self.mock_cluster.objects.all.return_value = []
-        self.mock_rack.objects.filter.return_value = []
-        self.mock_site_model.objects.all.return_value = []
-
-        from netbox_librenms_plugin.import_utils import validate_device_for_import
+        self._setup_validation_mocks(site=mock_site, device_type=MagicMock())
+        self.mock_device.objects.filter.side_effect = _make_device_filter(librenms_hit=existing)
 
         device_data = {"device_id": 1, "hostname": "switch-01", "location": "DC1", "hardware": "WS-C4900M"}
         result = validate_device_for_import(device_data, include_vc_detection=False)
@@ -1954,45 +1433,20 @@ class TestSerialNumberMatching:
 
     def test_existing_device_role_populated(self):
         """Existing device's role should be shown in validation details."""
-        existing = MagicMock()
-        existing.name = "switch-01"
-        existing.serial = "ABC123"
-        mock_existing_role = MagicMock()
-        mock_existing_role.name = "Access Switch"
-        existing.role = mock_existing_role
-
-        self.mock_vm.objects.filter.return_value.first.return_value = None
+        mock_existing_role = SimpleNamespace(name="Access Switch")
+        existing = SimpleNamespace(pk=1, name="switch-01", serial="ABC123", role=mock_existing_role)
 
-        def device_filter(**kwargs):
-            result = MagicMock()
-            if "serial" in kwargs:
-                result.first.return_value = existing
-            else:
-                result.first.return_value = None
-            return result
+        self._setup_validation_mocks(device_type=MagicMock(), roles=[mock_existing_role])
+        self.mock_device.objects.filter.side_effect = _make_device_filter(serial_hit=existing)
 
-        self.mock_device.objects.filter.side_effect = device_filter
-        self.mock_find_site.return_value = {"found": False, "site": None, "match_type": None, "confidence": 0}
-        self.mock_find_platform.return_value = {"found": False, "platform": None, "match_type": None}
-        self.mock_match_type.return_value = {"matched": True, "device_type": MagicMock(), "match_type": "exact"}
-        self.mock_role.objects.all.return_value = [mock_existing_role]
-        self.mock_cluster.objects.all.return_value = []
-        self.mock_rack.objects.filter.return_value = []
-        self.mock_site_model.objects.all.return_value = []
-
-        with patch("netbox_librenms_plugin.import_utils.cache") as mock_cache:
-            mock_cache.get.return_value = None
-
-            from netbox_librenms_plugin.import_utils import validate_device_for_import
-
-            device_data = {
-                "device_id": 1,
-                "hostname": "switch-01",
-                "serial": "ABC123",
-                "location": "",
-                "hardware": "",
-            }
-            result = validate_device_for_import(device_data, include_vc_detection=False)
+        device_data = {
+            "device_id": 1,
+            "hostname": "switch-01",
+            "serial": "ABC123",
+            "location": "",
+            "hardware": "",
+        }
+        result = validate_device_for_import(device_data, include_vc_detection=False)
 
         assert result["existing_device"] == existing
         assert result["device_role"]["found"] is True
@@ -2000,101 +1454,52 @@ class TestSerialNumberMatching:
 
     def test_device_type_mismatch_flagged(self):
         """Device type mismatch between existing device and LibreNMS should be flagged."""
-        existing = MagicMock()
-        existing.name = "switch-01"
-        existing.serial = "ABC123"
-        existing_device_type = MagicMock()
-        existing_device_type.pk = 1
-        existing_device_type.__str__ = lambda self: "Old Type"
-        existing.device_type = existing_device_type
-        existing.role = MagicMock()
-
-        librenms_device_type = MagicMock()
-        librenms_device_type.pk = 2
-        librenms_device_type.__str__ = lambda self: "New Type"
-
-        self.mock_vm.objects.filter.return_value.first.return_value = None
+        existing = SimpleNamespace(
+            pk=1,
+            name="switch-01",
+            serial="ABC123",
+            device_type=_Ref(1),
+            role=SimpleNamespace(name="Access Switch"),
+        )
+        librenms_device_type = _Ref(2)
 
-        def device_filter(**kwargs):
-            result = MagicMock()
-            if "serial" in kwargs:
-                result.first.return_value = existing
-            else:
-                result.first.return_value = None
-            return result
+        self._setup_validation_mocks(device_type=librenms_device_type)
+        self.mock_device.objects.filter.side_effect = _make_device_filter(serial_hit=existing)
 
-        self.mock_device.objects.filter.side_effect = device_filter
-        self.mock_find_site.return_value = {"found": False, "site": None, "match_type": None, "confidence": 0}
-        self.mock_find_platform.return_value = {"found": False, "platform": None, "match_type": None}
-        self.mock_match_type.return_value = {
-            "matched": True,
-            "device_type": librenms_device_type,
-            "match_type": "exact",
+        device_data = {
+            "device_id": 1,
+            "hostname": "switch-01",
+            "serial": "ABC123",
+            "location": "",
+            "hardware": "New Type",
         }
-        self.mock_role.objects.all.return_value = []
-        self.mock_cluster.objects.all.return_value = []
-        self.mock_rack.objects.filter.return_value = []
-        self.mock_site_model.objects.all.return_value = []
-
-        with patch("netbox_librenms_plugin.import_utils.cache") as mock_cache:
-            mock_cache.get.return_value = None
-
-            from netbox_librenms_plugin.import_utils import validate_device_for_import
-
-            device_data = {
-                "device_id": 1,
-                "hostname": "switch-01",
-                "serial": "ABC123",
-                "location": "",
-                "hardware": "New Type",
-            }
-            result = validate_device_for_import(device_data, include_vc_detection=False)
+        result = validate_device_for_import(device_data, include_vc_detection=False)
 
         assert result["device_type_mismatch"] is True
         assert any("Device type mismatch" in w for w in result["warnings"])
 
     def test_no_device_type_mismatch_when_types_match(self):
         """No mismatch flag when existing device type matches LibreNMS."""
-        existing = MagicMock()
-        existing.name = "switch-01"
-        existing.serial = "ABC123"
-        same_device_type = MagicMock()
-        same_device_type.pk = 1
-        existing.device_type = same_device_type
-        existing.role = MagicMock()
-
-        self.mock_vm.objects.filter.return_value.first.return_value = None
-
-        def device_filter(**kwargs):
-            result = MagicMock()
-            if "serial" in kwargs:
-                result.first.return_value = existing
-            else:
-                result.first.return_value = None
-            return result
-
-        self.mock_device.objects.filter.side_effect = device_filter
-        self.mock_find_site.return_value = {"found": False, "site": None, "match_type": None, "confidence": 0}
-        self.mock_find_platform.return_value = {"found": False, "platform": None, "match_type": None}
-        self.mock_match_type.return_value = {"matched": True, "device_type": same_device_type, "match_type": "exact"}
-        self.mock_role.objects.all.return_value = []
-        self.mock_cluster.objects.all.return_value = []
-        self.mock_rack.objects.filter.return_value = []
-        self.mock_site_model.objects.all.return_value = []
-
-        with patch("netbox_librenms_plugin.import_utils.cache") as mock_cache:
-            mock_cache.get.return_value = None
+        same_device_type = _Ref(1)
+        existing = SimpleNamespace(
+            pk=1,
+            name="switch-01",
+            serial="ABC123",
+            device_type=same_device_type,
+            role=SimpleNamespace(name="Access Switch"),
+        )
 
-            from netbox_librenms_plugin.import_utils import validate_device_for_import
+        self._setup_validation_mocks(device_type=same_device_type)
+        self.mock_device.objects.filter.side_effect = _make_device_filter(serial_hit=existing)
 
-            device_data = {
-                "device_id": 1,
-                "hostname": "switch-01",
-                "serial": "ABC123",
-                "location": "",
-                "hardware": "Same Type",
-            }
-            result = validate_device_for_import(device_data, include_vc_detection=False)
+        device_data = {
+            "device_id": 1,
+            "hostname": "switch-01",
+            "serial": "ABC123",
+            "location": "",
+            "hardware": "Same Type",
+        }
+        result = validate_device_for_import(device_data, include_vc_detection=False)
 
         assert result["device_type_mismatch"] is False
 
@@ -2102,10 +1507,23 @@ class TestSerialNumberMatching:
 class TestDeviceConflictActionView:
     """Test DeviceConflictActionView conflict resolution actions."""
 
+    @pytest.fixture(autouse=True)
+    def _common_patches(self, monkeypatch):
+        """Patch the collaborators every conflict action touches; these tests have no database."""
+        monkeypatch.setattr(import_actions, "cache", MagicMock())
+        monkeypatch.setattr(import_actions, "get_import_device_cache_key", MagicMock())
+        with contextlib.ExitStack() as stack:
+            self.mock_transaction = stack.enter_context(
+                patch("netbox_librenms_plugin.views.imports.actions.transaction")
+            )
+            self.mock_render = stack.enter_context(patch.object(DeviceConflictActionView, "render_device_row"))
+            self.mock_device_cls = stack.enter_context(patch("dcim.models.Device"))
+            # No other device holds the LibreNMS ID or serial unless a test says so
+            self.mock_device_cls.objects.filter.return_value.exclude.return_value.first.return_value = None
+            yield
+
     def _create_view(self):
         """Create a DeviceConflictActionView instance with mocked dependencies."""
-        from netbox_librenms_plugin.views.imports.actions import DeviceConflictActionView
-
         view = object.__new__(DeviceConflictActionView)
         view._librenms_api = MagicMock()
         view._librenms_api.server_key = "default"
@@ -2113,582 +1531,351 @@ class TestDeviceConflictActionView:
         view.request.user.has_perm.return_value = True
         return view
 
-    def _create_request(self, action, existing_device_id, use_sysname=False, strip_domain=False):
-        """Create a mock request with POST data."""
-        request = MagicMock()
+    def _create_request(self, action, existing_device_id, use_sysname=False, strip_domain=False, force=False):
+        """Create a request double carrying only POST data; the view reads nothing else."""
         post_data = {"action": action, "existing_device_id": str(existing_device_id)}
         if use_sysname:
             post_data["use-sysname-toggle"] = "on"
         if strip_domain:
             post_data["strip-domain-toggle"] = "on"
-        request.POST = post_data
-        return request
+        if force:
+            post_data["force"] = "on"
+        return SimpleNamespace(POST=post_data)
+
+    def _run_action(self, action, existing_device, libre_device, validation=None, **request_kwargs):
+        """
+        POST ``action`` against ``existing_device`` and return the response.
+
+        Re-validation returns ``libre_device`` with ``validation`` (by default a
+        confirmed conflict with ``existing_device``). ``request_kwargs`` are
+        passed to _create_request.
+        """
+        if validation is None:
+            validation = {**_VALIDATION_CONFLICT, "existing_device": existing_device}
+        request = self._create_request(action, existing_device.pk, **request_kwargs)
+        self.mock_device_cls.objects.select_related.return_value.get.return_value = existing_device
+        with patch.object(
+            DeviceConflictActionView,
+            "get_validated_device_with_selections",
+            return_value=(libre_device, validation, {}),
+        ):
+            return self._create_view().post(request, device_id=10)
 
-    @patch("netbox_librenms_plugin.views.imports.actions.cache")
-    @patch("netbox_librenms_plugin.views.imports.actions.get_import_device_cache_key")
-    def test_link_action_sets_librenms_id_and_name(self, mock_cache_key, mock_cache):
+    def test_link_action_sets_librenms_id_and_name(self):
         """Link action should set librenms_id and update name from sysName."""
-        from netbox_librenms_plugin.views.imports.actions import DeviceConflictActionView
-
-        view = self._create_view()
-        existing_device = MagicMock()
-        existing_device.pk = 42
-        existing_device.custom_field_data = {}
-        existing_device.name = "84.116.251.35"
-
-        libre_device = {
-            "device_id": 10,
-            "hostname": "84.116.251.35",
-            "sysName": "switch-01.example.com",
-            "serial": "ABC123",
-        }
-        validation = {"can_import": False, "existing_device": existing_device}
-        selections = {}
-
-        request = self._create_request("link", 42, use_sysname=True)
-
-        with (
-            patch.object(DeviceConflictActionView, "get_validated_device_with_selections") as mock_validate,
-            patch.object(DeviceConflictActionView, "render_device_row") as mock_render,
-            patch("dcim.models.Device") as mock_device_cls,
-        ):
-            mock_device_cls.objects.get.return_value = existing_device
-            mock_device_cls.objects.filter.return_value.exclude.return_value.first.return_value = None
-            mock_validate.return_value = (libre_device, validation, selections)
-            mock_render.return_value = MagicMock()
+        existing_device = _make_existing_device(pk=42, name="84.116.251.35")
+        libre_device = {**_CONFLICT_LIBRE_DEVICE, "hostname": "84.116.251.35"}
 
-            view.post(request, device_id=10)
+        self._run_action("link", existing_device, libre_device, use_sysname=True)
 
         assert existing_device.custom_field_data["librenms_id"] == 10
         assert existing_device.name == "switch-01.example.com"
-        existing_device.save.assert_called_once()
-
-    @patch("netbox_librenms_plugin.views.imports.actions.cache")
-    @patch("netbox_librenms_plugin.views.imports.actions.get_import_device_cache_key")
-    def test_update_action_sets_hostname_serial_and_librenms_id(self, mock_cache_key, mock_cache):
+        existing_device.save.assert_called_once_with(update_fields=["custom_field_data", "name", "last_updated"])
+        # The device row is locked (FOR NO KEY UPDATE) and reloaded inside the transaction
+        self.mock_transaction.atomic.assert_called_once()
+        self.mock_device_cls.objects.select_related.assert_called_once_with(*_CONFLICT_DEVICE_RELATED)
+        self.mock_device_cls.objects.select_for_update.assert_called_once_with(of=("self",), no_key=True)
+        lock_qs = self.mock_device_cls.objects.select_for_update.return_value
+        lock_qs.select_related.assert_called_once_with(*_CONFLICT_DEVICE_RELATED)
+        existing_device.refresh_from_db.assert_called_once_with(from_queryset=lock_qs.select_related.return_value)
+
+    def test_update_action_sets_hostname_serial_and_librenms_id(self):
         """Update action should set hostname, serial, and librenms_id."""
-        from netbox_librenms_plugin.views.imports.actions import DeviceConflictActionView
-
-        view = self._create_view()
-        existing_device = MagicMock()
-        existing_device.pk = 42
-        existing_device.custom_field_data = {}
-        existing_device.name = "old-name"
-        existing_device.serial = "OLD-SERIAL"
-
+        existing_device = _make_existing_device(pk=42, name="old-name", serial="OLD-SERIAL")
         libre_device = {
-            "device_id": 10,
+            **_CONFLICT_LIBRE_DEVICE,
             "hostname": "84.116.251.35",
             "sysName": "new-name.example.com",
             "serial": "NEW-SERIAL",
         }
-        validation = {"can_import": False, "existing_device": existing_device}
-        selections = {}
-
-        request = self._create_request("update", 42, use_sysname=True)
-
-        with (
-            patch.object(DeviceConflictActionView, "get_validated_device_with_selections") as mock_validate,
-            patch.object(DeviceConflictActionView, "render_device_row") as mock_render,
-            patch("dcim.models.Device") as mock_device_cls,
-        ):
-            mock_device_cls.objects.get.return_value = existing_device
-            mock_device_cls.objects.filter.return_value.exclude.return_value.first.return_value = None
-            mock_validate.return_value = (libre_device, validation, selections)
-            mock_render.return_value = MagicMock()
 
-            view.post(request, device_id=10)
+        self._run_action("update", existing_device, libre_device, use_sysname=True)
 
         assert existing_device.custom_field_data["librenms_id"] == 10
         assert existing_device.serial == "NEW-SERIAL"
         assert existing_device.name == "new-name.example.com"
-        existing_device.save.assert_called_once()
+        existing_device.save.assert_called_once_with(
+            update_fields=["custom_field_data", "serial", "name", "last_updated"]
+        )
 
-    @patch("netbox_librenms_plugin.views.imports.actions.cache")
-    @patch("netbox_librenms_plugin.views.imports.actions.get_import_device_cache_key")
-    def test_update_serial_action_updates_serial_only(self, mock_cache_key, mock_cache):
+    def test_update_serial_action_updates_serial_only(self):
         """Update serial action should update serial and librenms_id but not hostname."""
-        from netbox_librenms_plugin.views.imports.actions import DeviceConflictActionView
+        existing_device = _make_existing_device(pk=42, name="switch-01", serial="OLD-SERIAL")
 
-        view = self._create_view()
-        existing_device = MagicMock()
-        existing_device.pk = 42
-        existing_device.custom_field_data = {}
-        existing_device.name = "switch-01"
-        existing_device.serial = "OLD-SERIAL"
-
-        libre_device = {"device_id": 10, "hostname": "switch-01", "serial": "NEW-SERIAL"}
-        validation = {"can_import": False, "existing_device": existing_device}
-        selections = {}
-
-        request = self._create_request("update_serial", 42)
-
-        with (
-            patch.object(DeviceConflictActionView, "get_validated_device_with_selections") as mock_validate,
-            patch.object(DeviceConflictActionView, "render_device_row") as mock_render,
-            patch("dcim.models.Device") as mock_device_cls,
-        ):
-            mock_device_cls.objects.get.return_value = existing_device
-            mock_device_cls.objects.filter.return_value.exclude.return_value.first.return_value = None
-            mock_validate.return_value = (libre_device, validation, selections)
-            mock_render.return_value = MagicMock()
-
-            view.post(request, device_id=10)
+        self._run_action("update_serial", existing_device, {**_CONFLICT_LIBRE_DEVICE, "serial": "NEW-SERIAL"})
 
         assert existing_device.custom_field_data["librenms_id"] == 10
         assert existing_device.serial == "NEW-SERIAL"
         # Name should NOT be changed by update_serial
         assert existing_device.name == "switch-01"
-        existing_device.save.assert_called_once()
+        existing_device.save.assert_called_once_with(update_fields=["custom_field_data", "serial", "last_updated"])
 
-    @patch("netbox_librenms_plugin.views.imports.actions.cache")
-    @patch("netbox_librenms_plugin.views.imports.actions.get_import_device_cache_key")
-    def test_update_skips_dash_serial(self, mock_cache_key, mock_cache):
-        """Update should not set serial to '-' (LibreNMS placeholder)."""
-        from netbox_librenms_plugin.views.imports.actions import DeviceConflictActionView
+    @pytest.mark.parametrize("placeholder", ["-", "N/A", "  unknown  "])
+    def test_update_skips_placeholder_serial(self, placeholder):
+        """Update should not write a LibreNMS placeholder serial or check it for conflicts."""
+        existing_device = _make_existing_device(pk=42, name="switch-01", serial="EXISTING")
 
-        view = self._create_view()
-        existing_device = MagicMock()
-        existing_device.pk = 42
-        existing_device.custom_field_data = {}
-        existing_device.name = "switch-01"
-        existing_device.serial = "EXISTING"
+        self._run_action("update_serial", existing_device, {**_CONFLICT_LIBRE_DEVICE, "serial": placeholder})
 
-        libre_device = {"device_id": 10, "hostname": "switch-01", "serial": "-"}
-        validation = {"can_import": False, "existing_device": existing_device}
-        selections = {}
+        assert existing_device.serial == "EXISTING"
+        serial_lookups = [c for c in self.mock_device_cls.objects.filter.call_args_list if "serial" in c.kwargs]
+        assert serial_lookups == []
 
-        request = self._create_request("update_serial", 42)
+    def test_update_serial_strips_whitespace(self):
+        """A padded LibreNMS serial is stripped before the conflict check and the write."""
+        existing_device = _make_existing_device(pk=42, name="switch-01", serial="OLD-SERIAL")
 
-        with (
-            patch.object(DeviceConflictActionView, "get_validated_device_with_selections") as mock_validate,
-            patch.object(DeviceConflictActionView, "render_device_row") as mock_render,
-            patch("dcim.models.Device") as mock_device_cls,
-        ):
-            mock_device_cls.objects.get.return_value = existing_device
-            mock_validate.return_value = (libre_device, validation, selections)
-            mock_render.return_value = MagicMock()
+        self._run_action("update_serial", existing_device, {**_CONFLICT_LIBRE_DEVICE, "serial": " NEW-SERIAL "})
+
+        assert existing_device.serial == "NEW-SERIAL"
+        self.mock_device_cls.objects.filter.assert_any_call(serial="NEW-SERIAL")
+
+    def test_sync_serial_rejects_placeholder(self):
+        """sync_serial treats a placeholder serial as missing and saves nothing."""
+        existing_device = _make_existing_device(pk=42, name="switch-01", serial="EXISTING")
 
-            view.post(request, device_id=10)
+        response = self._run_action("sync_serial", existing_device, {**_CONFLICT_LIBRE_DEVICE, "serial": "N/A"})
 
-        # Serial should NOT be updated to '-'
+        assert response.status_code == 400
         assert existing_device.serial == "EXISTING"
+        existing_device.save.assert_not_called()
 
     def test_missing_action_returns_400(self):
         """Missing action or existing_device_id should return 400."""
         view = self._create_view()
-        request = MagicMock()
-        request.POST = {}
+        request = SimpleNamespace(POST={})
 
         response = view.post(request, device_id=10)
         assert response.status_code == 400
 
     def test_unknown_action_returns_400(self):
         """Unknown action should return 400."""
-        from netbox_librenms_plugin.views.imports.actions import DeviceConflictActionView
-
-        view = self._create_view()
-        request = self._create_request("invalid_action", 42)
+        existing_device = _make_existing_device(pk=42)
 
-        existing_device = MagicMock()
-        libre_device = {"device_id": 10, "hostname": "switch-01", "serial": "ABC"}
-
-        with (
-            patch.object(DeviceConflictActionView, "get_validated_device_with_selections") as mock_validate,
-            patch("dcim.models.Device") as mock_device_cls,
-        ):
-            mock_device_cls.objects.get.return_value = existing_device
-            mock_validate.return_value = (libre_device, {}, {})
-
-            response = view.post(request, device_id=10)
+        response = self._run_action("invalid_action", existing_device, dict(_CONFLICT_LIBRE_DEVICE))
 
         assert response.status_code == 400
+        assert b"Unknown action" in response.content
+        existing_device.save.assert_not_called()
 
-    @patch("netbox_librenms_plugin.views.imports.actions.cache")
-    @patch("netbox_librenms_plugin.views.imports.actions.get_import_device_cache_key")
-    def test_sync_name_action_updates_name(self, mock_cache_key, mock_cache):
-        """Sync name action should update device name using sysName."""
-        from netbox_librenms_plugin.views.imports.actions import DeviceConflictActionView
-
-        view = self._create_view()
-        existing_device = MagicMock()
-        existing_device.pk = 42
-        existing_device.custom_field_data = {"librenms_id": 10}
-        existing_device.name = "84.116.251.35"
-
-        libre_device = {
-            "device_id": 10,
-            "hostname": "84.116.251.35",
-            "sysName": "switch-01.example.com",
-            "serial": "ABC123",
-        }
-        validation = {"can_import": False, "existing_device": existing_device}
-        selections = {}
-
-        request = self._create_request("sync_name", 42, use_sysname=True)
-
-        with (
-            patch.object(DeviceConflictActionView, "get_validated_device_with_selections") as mock_validate,
-            patch.object(DeviceConflictActionView, "render_device_row") as mock_render,
-            patch("dcim.models.Device") as mock_device_cls,
-        ):
-            mock_device_cls.objects.get.return_value = existing_device
-            mock_validate.return_value = (libre_device, validation, selections)
-            mock_render.return_value = MagicMock()
-
-            view.post(request, device_id=10)
+    @pytest.fixture
+    def existing_device(self, request):
+        """Already-linked device in the pre-sync state, with the row's ``request.param`` overrides applied."""
+        attrs = {"name": "84.116.251.35", "serial": "OLD123", "platform": None, "device_type": _Ref(1)}
+        return _make_existing_device(pk=42, custom_field_data={"librenms_id": 10}, **{**attrs, **request.param})
+
+    @pytest.mark.parametrize(
+        "existing_device, action, libre_extra, validation_extra, request_kwargs, patches, field, expected",
+        [
+            pytest.param(
+                {"name": "old-name"},
+                "sync_name",
+                {"sysName": "switch-01.example.com"},
+                {},
+                {"use_sysname": True},
+                {},
+                "name",
+                "switch-01.example.com",
+                id="sync_name",
+            ),
+            pytest.param(
+                {"device_type": _Ref(1)},
+                "update_type",
+                {},
+                {**_VALIDATION_MISMATCH, "device_type": {"device_type": _NEW_DEVICE_TYPE}},
+                {"force": True},
+                {},
+                "device_type",
+                _NEW_DEVICE_TYPE,
+                id="update_type",
+            ),
+            pytest.param(
+                {"serial": "OLD123"},
+                "sync_serial",
+                {"serial": "NEW456"},
+                {},
+                {},
+                {},
+                "serial",
+                "NEW456",
+                id="sync_serial",
+            ),
+            pytest.param(
+                {"platform": None},
+                "sync_platform",
+                {"os": "ios"},
+                {},
+                {},
+                {"netbox_librenms_plugin.utils.find_matching_platform": {"found": True, "platform": _NEW_PLATFORM}},
+                "platform",
+                _NEW_PLATFORM,
+                id="sync_platform",
+            ),
+            pytest.param(
+                {"device_type": _Ref(1)},
+                "sync_device_type",
+                {"hardware": "Catalyst C4900M"},
+                {},
+                {},
+                {
+                    "netbox_librenms_plugin.utils.match_librenms_hardware_to_device_type": {
+                        "matched": True,
+                        "device_type": _NEW_DEVICE_TYPE,
+                    }
+                },
+                "device_type",
+                _NEW_DEVICE_TYPE,
+                id="sync_device_type",
+            ),
+        ],
+        indirect=["existing_device"],
+    )
+    def test_sync_action_updates_single_field(
+        self, existing_device, action, libre_extra, validation_extra, request_kwargs, patches, field, expected
+    ):
+        """Each sync/update action writes one field from LibreNMS data and saves only that field."""
+        libre_device = {**_CONFLICT_LIBRE_DEVICE, "hostname": "84.116.251.35", **libre_extra}
+        validation = {**_VALIDATION_CONFLICT, "existing_device": existing_device, **validation_extra}
+
+        with contextlib.ExitStack() as stack:
+            for target, return_value in patches.items():
+                stack.enter_context(patch(target, return_value=return_value))
+            self._run_action(action, existing_device, libre_device, validation, **request_kwargs)
+
+        assert getattr(existing_device, field) == expected
+        existing_device.save.assert_called_once_with(update_fields=[field, "last_updated"])
+
+    @pytest.mark.parametrize(
+        "model_fields, expected_update_fields",
+        [
+            pytest.param(("name",), ["name", "last_updated"], id="no_natural_ordering_column"),
+            pytest.param(("name", "_name"), ["name", "last_updated", "_name"], id="natural_ordering_column"),
+        ],
+    )
+    def test_rename_writes_natural_ordering_column(self, model_fields, expected_update_fields):
+        """A rename also saves _name when the Device model still has that natural-ordering column."""
+        existing_device = _make_existing_device(pk=42, name="84.116.251.35")
+        existing_device._meta.concrete_fields = [SimpleNamespace(name=name) for name in model_fields]
+
+        self._run_action("sync_name", existing_device, dict(_CONFLICT_LIBRE_DEVICE), use_sysname=True)
 
         assert existing_device.name == "switch-01.example.com"
-        existing_device.save.assert_called_once()
+        existing_device.save.assert_called_once_with(update_fields=expected_update_fields)
 
-    @patch("netbox_librenms_plugin.views.imports.actions.cache")
-    @patch("netbox_librenms_plugin.views.imports.actions.get_import_device_cache_key")
-    def test_device_type_mismatch_blocked_without_force(self, mock_cache_key, mock_cache):
+    def test_device_type_mismatch_blocked_without_force(self):
         """Action should be blocked when device_type_mismatch is True and force is not set."""
-        from netbox_librenms_plugin.views.imports.actions import DeviceConflictActionView
-
-        view = self._create_view()
-        existing_device = MagicMock()
-        existing_device.pk = 42
-        existing_device.custom_field_data = {}
+        existing_device = _make_existing_device(pk=42)
+        validation = {**_VALIDATION_MISMATCH, "existing_device": existing_device}
 
-        libre_device = {"device_id": 10, "hostname": "switch-01", "serial": "ABC123"}
-        validation = {"can_import": False, "device_type_mismatch": True, "existing_device": existing_device}
-        selections = {}
-
-        request = self._create_request("link", 42, use_sysname=True)
-
-        with (
-            patch.object(DeviceConflictActionView, "get_validated_device_with_selections") as mock_validate,
-            patch("dcim.models.Device") as mock_device_cls,
-        ):
-            mock_device_cls.objects.get.return_value = existing_device
-            mock_validate.return_value = (libre_device, validation, selections)
-
-            response = view.post(request, device_id=10)
+        response = self._run_action("link", existing_device, dict(_CONFLICT_LIBRE_DEVICE), validation, use_sysname=True)
 
         assert response.status_code == 400
         existing_device.save.assert_not_called()
 
-    @patch("netbox_librenms_plugin.views.imports.actions.cache")
-    @patch("netbox_librenms_plugin.views.imports.actions.get_import_device_cache_key")
-    def test_device_type_mismatch_allowed_with_force(self, mock_cache_key, mock_cache):
+    def test_device_type_mismatch_allowed_with_force(self):
         """Action should proceed when device_type_mismatch is True and force is set."""
-        from netbox_librenms_plugin.views.imports.actions import DeviceConflictActionView
-
-        view = self._create_view()
-        existing_device = MagicMock()
-        existing_device.pk = 42
-        existing_device.custom_field_data = {}
-        existing_device.name = "old-name"
-
-        libre_device = {
-            "device_id": 10,
-            "hostname": "switch-01",
-            "sysName": "switch-01.example.com",
-            "serial": "ABC123",
-        }
-        validation = {"can_import": False, "device_type_mismatch": True, "existing_device": existing_device}
-        selections = {}
-
-        request = self._create_request("link", 42, use_sysname=True)
-        request.POST["force"] = "on"
-
-        with (
-            patch.object(DeviceConflictActionView, "get_validated_device_with_selections") as mock_validate,
-            patch.object(DeviceConflictActionView, "render_device_row") as mock_render,
-            patch("dcim.models.Device") as mock_device_cls,
-        ):
-            mock_device_cls.objects.get.return_value = existing_device
-            mock_device_cls.objects.filter.return_value.exclude.return_value.first.return_value = None
-            mock_validate.return_value = (libre_device, validation, selections)
-            mock_render.return_value = MagicMock()
+        existing_device = _make_existing_device(pk=42, name="old-name")
+        validation = {**_VALIDATION_MISMATCH, "existing_device": existing_device}
 
-            view.post(request, device_id=10)
+        self._run_action(
+            "link", existing_device, dict(_CONFLICT_LIBRE_DEVICE), validation, use_sysname=True, force=True
+        )
 
         assert existing_device.custom_field_data["librenms_id"] == 10
         existing_device.save.assert_called_once()
 
-    @patch("netbox_librenms_plugin.views.imports.actions.cache")
-    @patch("netbox_librenms_plugin.views.imports.actions.get_import_device_cache_key")
-    def test_force_with_mismatch_updates_device_type(self, mock_cache_key, mock_cache):
+    def test_force_with_mismatch_updates_device_type(self):
         """Force with device_type_mismatch should update existing device's device_type."""
-        from netbox_librenms_plugin.views.imports.actions import DeviceConflictActionView
-
-        view = self._create_view()
-        existing_device = MagicMock()
-        existing_device.pk = 42
-        existing_device.custom_field_data = {}
-        existing_device.name = "old-name"
-
-        librenms_device_type = MagicMock()
-        librenms_device_type.pk = 99
-        libre_device = {
-            "device_id": 10,
-            "hostname": "switch-01",
-            "sysName": "switch-01.example.com",
-            "serial": "ABC123",
-        }
+        existing_device = _make_existing_device(pk=42, name="old-name")
+        librenms_device_type = _Ref(99)
         validation = {
-            "can_import": False,
-            "device_type_mismatch": True,
+            **_VALIDATION_MISMATCH,
             "device_type": {"device_type": librenms_device_type},
             "existing_device": existing_device,
         }
-        selections = {}
-
-        request = self._create_request("link", 42, use_sysname=True)
-        request.POST["force"] = "on"
-
-        with (
-            patch.object(DeviceConflictActionView, "get_validated_device_with_selections") as mock_validate,
-            patch.object(DeviceConflictActionView, "render_device_row") as mock_render,
-            patch("dcim.models.Device") as mock_device_cls,
-        ):
-            mock_device_cls.objects.get.return_value = existing_device
-            mock_device_cls.objects.filter.return_value.exclude.return_value.first.return_value = None
-            mock_validate.return_value = (libre_device, validation, selections)
-            mock_render.return_value = MagicMock()
 
-            view.post(request, device_id=10)
+        self._run_action(
+            "link", existing_device, dict(_CONFLICT_LIBRE_DEVICE), validation, use_sysname=True, force=True
+        )
 
         assert existing_device.device_type == librenms_device_type
         assert existing_device.custom_field_data["librenms_id"] == 10
         existing_device.save.assert_called_once()
 
-    @patch("netbox_librenms_plugin.views.imports.actions.cache")
-    @patch("netbox_librenms_plugin.views.imports.actions.get_import_device_cache_key")
-    def test_update_type_action_changes_device_type(self, mock_cache_key, mock_cache):
-        """update_type action should change device type on existing device."""
-        from netbox_librenms_plugin.views.imports.actions import DeviceConflictActionView
-
-        view = self._create_view()
-        existing_device = MagicMock()
-        existing_device.pk = 42
-        existing_device.custom_field_data = {"librenms_id": 10}
-        existing_device.name = "switch-01"
-        old_device_type = MagicMock()
-        existing_device.device_type = old_device_type
-
-        new_device_type = MagicMock()
-        new_device_type.pk = 99
-        libre_device = {
-            "device_id": 10,
-            "hostname": "switch-01",
-            "serial": "ABC123",
-        }
-        validation = {
-            "can_import": False,
-            "device_type_mismatch": True,
-            "device_type": {"device_type": new_device_type},
-            "existing_device": existing_device,
-        }
-        selections = {}
-
-        request = self._create_request("update_type", 42)
-        request.POST["force"] = "on"
-
-        with (
-            patch.object(DeviceConflictActionView, "get_validated_device_with_selections") as mock_validate,
-            patch.object(DeviceConflictActionView, "render_device_row") as mock_render,
-            patch("dcim.models.Device") as mock_device_cls,
-        ):
-            mock_device_cls.objects.get.return_value = existing_device
-            mock_validate.return_value = (libre_device, validation, selections)
-            mock_render.return_value = MagicMock()
-
-            view.post(request, device_id=10)
-
-        assert existing_device.device_type == new_device_type
-        existing_device.save.assert_called_once()
-
-    @patch("netbox_librenms_plugin.views.imports.actions.cache")
-    @patch("netbox_librenms_plugin.views.imports.actions.get_import_device_cache_key")
-    def test_sync_serial_action(self, mock_cache_key, mock_cache):
-        """sync_serial action should update serial from LibreNMS."""
-        from netbox_librenms_plugin.views.imports.actions import DeviceConflictActionView
-
-        view = self._create_view()
-        existing_device = MagicMock()
-        existing_device.serial = "OLD123"
-        libre_device = {"device_id": 10, "serial": "NEW456", "sysName": "test"}
-        validation = {"existing_device": existing_device, "device_type_mismatch": False}
-        selections = {}
-
-        request = self._create_request("sync_serial", 42)
-
-        with (
-            patch.object(DeviceConflictActionView, "get_validated_device_with_selections") as mock_validate,
-            patch.object(DeviceConflictActionView, "render_device_row") as mock_render,
-            patch("dcim.models.Device") as mock_device_cls,
-        ):
-            mock_device_cls.objects.get.return_value = existing_device
-            mock_device_cls.objects.filter.return_value.exclude.return_value.first.return_value = None
-            mock_validate.return_value = (libre_device, validation, selections)
-            mock_render.return_value = MagicMock()
-
-            view.post(request, device_id=10)
-
-        assert existing_device.serial == "NEW456"
-        existing_device.save.assert_called_once()
-
-    @patch("netbox_librenms_plugin.views.imports.actions.cache")
-    @patch("netbox_librenms_plugin.views.imports.actions.get_import_device_cache_key")
-    def test_sync_platform_action(self, mock_cache_key, mock_cache):
-        """sync_platform action should update platform from LibreNMS OS."""
-        from netbox_librenms_plugin.views.imports.actions import DeviceConflictActionView
-
-        view = self._create_view()
-        existing_device = MagicMock()
-        existing_device.platform = None
-        libre_device = {"device_id": 10, "os": "ios", "sysName": "test"}
-        validation = {"existing_device": existing_device, "device_type_mismatch": False}
-        selections = {}
-
-        mock_platform = MagicMock()
-        request = self._create_request("sync_platform", 42)
-
-        with (
-            patch.object(DeviceConflictActionView, "get_validated_device_with_selections") as mock_validate,
-            patch.object(DeviceConflictActionView, "render_device_row") as mock_render,
-            patch("dcim.models.Device") as mock_device_cls,
-            patch("dcim.models.Platform") as mock_platform_cls,
-        ):
-            mock_device_cls.objects.get.return_value = existing_device
-            mock_platform_cls.objects.get.return_value = mock_platform
-            mock_validate.return_value = (libre_device, validation, selections)
-            mock_render.return_value = MagicMock()
-
-            view.post(request, device_id=10)
-
-        assert existing_device.platform == mock_platform
-        existing_device.save.assert_called_once()
-
-    @patch("netbox_librenms_plugin.views.imports.actions.cache")
-    @patch("netbox_librenms_plugin.views.imports.actions.get_import_device_cache_key")
-    def test_sync_device_type_action(self, mock_cache_key, mock_cache):
-        """sync_device_type action should update device type from LibreNMS hardware match."""
-        from netbox_librenms_plugin.views.imports.actions import DeviceConflictActionView
-
-        view = self._create_view()
-        existing_device = MagicMock()
-        new_device_type = MagicMock()
-        libre_device = {"device_id": 10, "hardware": "Catalyst C4900M", "sysName": "test"}
-        validation = {"existing_device": existing_device, "device_type_mismatch": False}
-        selections = {}
-
-        request = self._create_request("sync_device_type", 42)
-
-        with (
-            patch.object(DeviceConflictActionView, "get_validated_device_with_selections") as mock_validate,
-            patch.object(DeviceConflictActionView, "render_device_row") as mock_render,
-            patch("dcim.models.Device") as mock_device_cls,
-            patch("netbox_librenms_plugin.utils.match_librenms_hardware_to_device_type") as mock_hw_match,
-        ):
-            mock_device_cls.objects.get.return_value = existing_device
-            mock_hw_match.return_value = {"matched": True, "device_type": new_device_type}
-            mock_validate.return_value = (libre_device, validation, selections)
-            mock_render.return_value = MagicMock()
-
-            view.post(request, device_id=10)
-
-        assert existing_device.device_type == new_device_type
-        existing_device.save.assert_called_once()
-
 
 class TestBuildSyncInfo:
     """Test DeviceValidationDetailsView._build_sync_info method."""
 
-    def test_all_synced(self):
-        """When serial, platform, device type all match, all_synced is True."""
-        from netbox_librenms_plugin.views.imports.actions import DeviceValidationDetailsView
-
-        existing = MagicMock()
-        existing.serial = "ABC123"
-        platform = MagicMock()
-        platform.pk = 1
-        existing.platform = platform
-        device_type = MagicMock()
-        device_type.pk = 5
-        existing.device_type = device_type
-
-        libre_device = {"serial": "ABC123", "os": "ios", "hardware": "Catalyst C4900M"}
+    @pytest.mark.parametrize(
+        "existing_platform_pk, libre_device, platform_match_pk, device_type_match_pk, expected",
+        [
+            pytest.param(
+                1,
+                {"serial": "ABC123", "os": "ios", "hardware": "Catalyst C4900M"},
+                1,
+                5,
+                {"serial_synced": True, "platform_synced": True, "device_type_synced": True, "all_synced": True},
+                id="all_synced",
+            ),
+            pytest.param(
+                None,
+                {"serial": "NEW456", "os": "-", "hardware": "-"},
+                None,
+                None,
+                {"serial_synced": False, "all_synced": False},
+                id="serial_out_of_sync",
+            ),
+            pytest.param(
+                None,
+                {"serial": "N/A", "os": "-", "hardware": "-"},
+                None,
+                None,
+                {"serial_synced": True},
+                id="placeholder_serial_counts_as_synced",
+            ),
+            pytest.param(
+                1,
+                {"serial": "ABC123", "os": "junos", "hardware": "-"},
+                2,
+                None,
+                {"platform_synced": False, "all_synced": False},
+                id="platform_out_of_sync",
+            ),
+            pytest.param(
+                None,
+                {"serial": "ABC123", "os": "-", "hardware": "UnknownHardwareXYZ"},
+                None,
+                None,
+                {"device_type_synced": False, "all_synced": False},
+                id="hardware_without_device_type_match",
+            ),
+        ],
+    )
+    def test_sync_flags(self, existing_platform_pk, libre_device, platform_match_pk, device_type_match_pk, expected):
+        """Each *_synced flag is False when the NetBox value differs from (or can't be matched to) LibreNMS."""
+        existing = _make_existing_device(
+            serial="ABC123",
+            platform=_Ref(existing_platform_pk) if existing_platform_pk else None,
+            device_type=_Ref(5),
+        )
+        platform_match = (
+            {"found": True, "platform": _Ref(platform_match_pk)}
+            if platform_match_pk
+            else {"found": False, "platform": None}
+        )
+        device_type_match = (
+            {"matched": True, "device_type": _Ref(device_type_match_pk)}
+            if device_type_match_pk
+            else {"matched": False, "device_type": None}
+        )
 
         with (
-            patch("netbox_librenms_plugin.utils.find_matching_platform") as mock_platform_match,
-            patch("netbox_librenms_plugin.utils.match_librenms_hardware_to_device_type") as mock_hw_match,
+            patch("netbox_librenms_plugin.utils.find_matching_platform", return_value=platform_match),
+            patch(
+                "netbox_librenms_plugin.utils.match_librenms_hardware_to_device_type", return_value=device_type_match
+            ),
         ):
-            mock_platform_match.return_value = {"found": True, "platform": platform}
-            mock_hw_match.return_value = {"matched": True, "device_type": device_type}
-
-            result = DeviceValidationDetailsView._build_sync_info(libre_device, existing)
-
-        assert result["all_synced"] is True
-        assert result["serial_synced"] is True
-        assert result["platform_synced"] is True
-        assert result["device_type_synced"] is True
-
-    def test_serial_out_of_sync(self):
-        """When serial differs, serial_synced is False."""
-        from netbox_librenms_plugin.views.imports.actions import DeviceValidationDetailsView
-
-        existing = MagicMock()
-        existing.serial = "OLD123"
-        existing.platform = None
-        device_type = MagicMock()
-        device_type.pk = 5
-        existing.device_type = device_type
-
-        libre_device = {"serial": "NEW456", "os": "-", "hardware": "-"}
-
-        result = DeviceValidationDetailsView._build_sync_info(libre_device, existing)
-
-        assert result["serial_synced"] is False
-        assert result["all_synced"] is False
-
-    def test_platform_out_of_sync(self):
-        """When platform differs, platform_synced is False."""
-        from netbox_librenms_plugin.views.imports.actions import DeviceValidationDetailsView
-
-        existing = MagicMock()
-        existing.serial = "ABC123"
-        old_platform = MagicMock()
-        old_platform.pk = 1
-        existing.platform = old_platform
-        device_type = MagicMock()
-        device_type.pk = 5
-        existing.device_type = device_type
-
-        new_platform = MagicMock()
-        new_platform.pk = 2
-
-        libre_device = {"serial": "ABC123", "os": "junos", "hardware": "-"}
-
-        with patch("netbox_librenms_plugin.utils.find_matching_platform") as mock_platform_match:
-            mock_platform_match.return_value = {"found": True, "platform": new_platform}
-
-            result = DeviceValidationDetailsView._build_sync_info(libre_device, existing)
-
-        assert result["platform_synced"] is False
-        assert result["all_synced"] is False
-
-    def test_hardware_no_match_device_type_out_of_sync(self):
-        """When hardware is present but no device type match found, device_type_synced is False."""
-        from netbox_librenms_plugin.views.imports.actions import DeviceValidationDetailsView
-
-        existing = MagicMock()
-        existing.serial = "ABC123"
-        existing.platform = None
-        device_type = MagicMock()
-        device_type.pk = 5
-        existing.device_type = device_type
-
-        libre_device = {"serial": "ABC123", "os": "-", "hardware": "UnknownHardwareXYZ"}
-
-        with patch("netbox_librenms_plugin.utils.match_librenms_hardware_to_device_type") as mock_hw_match:
-            mock_hw_match.return_value = {"matched": False, "device_type": None}
-
             result = DeviceValidationDetailsView._build_sync_info(libre_device, existing)
 
-        assert result["device_type_synced"] is False
-        assert result["all_synced"] is False
+        for flag, value in expected.items():
+            assert result[flag] is value, flag
@@ -6,6 +6,16 @@ and selection extraction functions.
 
 from unittest.mock import MagicMock
 
+from netbox_librenms_plugin.import_validation_helpers import (
+    apply_cluster_to_validation,
+    apply_rack_to_validation,
+    apply_role_to_validation,
+    extract_device_selections,
+    fetch_model_by_id,
+    recalculate_validation_status,
+    remove_validation_issue,
+)
+
 # =============================================================================
 # TestGetModelById - 4 tests
 # =============================================================================
@@ -20,8 +30,6 @@ class TestFetchModelById:
         mock_instance = MagicMock(id=1, name="Access Switch")
         mock_model_class.objects.get.return_value = mock_instance
 
-        from netbox_librenms_plugin.import_validation_helpers import fetch_model_by_id
-
         result = fetch_model_by_id(mock_model_class, 1)
 
         assert result == mock_instance
@@ -33,8 +41,6 @@ class TestFetchModelById:
         mock_model_class.DoesNotExist = Exception
         mock_model_class.objects.get.side_effect = mock_model_class.DoesNotExist
 
-        from netbox_librenms_plugin.import_validation_helpers import fetch_model_by_id
-
         result = fetch_model_by_id(mock_model_class, 999)
 
         assert result is None
@@ -44,8 +50,6 @@ class TestFetchModelById:
         mock_model_class = MagicMock()
         mock_model_class.DoesNotExist = type("DoesNotExist", (Exception,), {})
 
-        from netbox_librenms_plugin.import_validation_helpers import fetch_model_by_id
-
         result = fetch_model_by_id(mock_model_class, "not-a-number")
 
         assert result is None
@@ -54,8 +58,6 @@ class TestFetchModelById:
         """Handle None ID gracefully."""
         mock_model_class = MagicMock()
 
-        from netbox_librenms_plugin.import_validation_helpers import fetch_model_by_id
-
         result = fetch_model_by_id(mock_model_class, None)
 
         assert result is None
@@ -72,10 +74,6 @@ class TestExtractDeviceSelections:
 
     def test_extract_selections_all_present(self):
         """All selections extracted from POST request."""
-        from netbox_librenms_plugin.import_validation_helpers import (
-            extract_device_selections,
-        )
-
         mock_request = MagicMock()
         mock_request.method = "POST"
         mock_request.POST = {
@@ -92,10 +90,6 @@ class TestExtractDeviceSelections:
 
     def test_extract_selections_partial(self):
         """Missing fields return None."""
-        from netbox_librenms_plugin.import_validation_helpers import (
-            extract_device_selections,
-        )
-
         mock_request = MagicMock()
         mock_request.method = "POST"
         mock_request.POST = {
@@ -110,10 +104,6 @@ class TestExtractDeviceSelections:
 
     def test_extract_selections_from_get(self):
         """Selections extracted from GET request."""
-        from netbox_librenms_plugin.import_validation_helpers import (
-            extract_device_selections,
-        )
-
         mock_request = MagicMock()
         mock_request.method = "GET"
         mock_request.GET = {
@@ -130,10 +120,6 @@ class TestExtractDeviceSelections:
 
     def test_extract_selections_empty_values(self):
         """Empty strings handled correctly."""
-        from netbox_librenms_plugin.import_validation_helpers import (
-            extract_device_selections,
-        )
-
         mock_request = MagicMock()
         mock_request.method = "POST"
         mock_request.POST = {
@@ -160,10 +146,6 @@ class TestValidationStateUpdates:
 
     def test_apply_role_to_validation_success(self):
         """Role selection updates state correctly."""
-        from netbox_librenms_plugin.import_validation_helpers import (
-            apply_role_to_validation,
-        )
-
         mock_role = MagicMock(id=1, name="Access Switch")
         validation = {
             "device_role": {"found": False, "role": None},
@@ -181,10 +163,6 @@ class TestValidationStateUpdates:
 
     def test_apply_role_to_validation_clears_issue(self):
         """Selecting role should clear 'role' related validation issue."""
-        from netbox_librenms_plugin.import_validation_helpers import (
-            apply_role_to_validation,
-        )
-
         mock_role = MagicMock(id=1, name="Access Switch")
         validation = {
             "device_role": {"found": False, "role": None},
@@ -201,10 +179,6 @@ class TestValidationStateUpdates:
 
     def test_apply_cluster_to_validation_success(self):
         """Cluster selection updates state for VM import."""
-        from netbox_librenms_plugin.import_validation_helpers import (
-            apply_cluster_to_validation,
-        )
-
         mock_cluster = MagicMock(id=1, name="VMware Cluster 1")
         validation = {
             "cluster": {"found": False, "cluster": None},
@@ -220,10 +194,6 @@ class TestValidationStateUpdates:
 
     def test_apply_rack_to_validation_success(self):
         """Rack selection updates state for device import."""
-        from netbox_librenms_plugin.import_validation_helpers import (
-            apply_rack_to_validation,
-        )
-
         mock_rack = MagicMock(id=1, name="Rack A1")
         validation = {
             "issues": [],
@@ -238,10 +208,6 @@ class TestValidationStateUpdates:
 
     def test_remove_validation_issue_single(self):
         """Remove single issue by keyword."""
-        from netbox_librenms_plugin.import_validation_helpers import (
-            remove_validation_issue,
-        )
-
         validation = {
             "issues": [
                 "Device role must be manually selected before import",
@@ -256,10 +222,6 @@ class TestValidationStateUpdates:
 
     def test_remove_validation_issue_multiple(self):
         """Remove multiple matching issues."""
-        from netbox_librenms_plugin.import_validation_helpers import (
-            remove_validation_issue,
-        )
-
         validation = {
             "issues": [
                 "Device role must be selected",
@@ -275,10 +237,6 @@ class TestValidationStateUpdates:
 
     def test_remove_validation_issue_no_match(self):
         """No change when keyword not found."""
-        from netbox_librenms_plugin.import_validation_helpers import (
-            remove_validation_issue,
-        )
-
         validation = {
             "issues": [
                 "Site not found for location 'DC1'",
@@ -292,10 +250,6 @@ class TestValidationStateUpdates:
 
     def test_recalculate_can_import_all_ready_device(self):
         """can_import=True when all requirements met for device."""
-        from netbox_librenms_plugin.import_validation_helpers import (
-            recalculate_validation_status,
-        )
-
         validation = {
             "issues": [],
             "can_import": False,
@@ -312,10 +266,6 @@ class TestValidationStateUpdates:
 
     def test_recalculate_can_import_missing_required_device(self):
         """can_import=False when required field missing for device."""
-        from netbox_librenms_plugin.import_validation_helpers import (
-            recalculate_validation_status,
-        )
-
         validation = {
             "issues": ["Site not found"],
             "can_import": True,  # Should become False
@@ -332,10 +282,6 @@ class TestValidationStateUpdates:
 
     def test_recalculate_can_import_vm_cluster_required(self):
         """VM import requires cluster to be ready."""
-        from netbox_librenms_plugin.import_validation_helpers import (
-            recalculate_validation_status,
-        )
-
         validation = {
             "issues": [],
             "can_import": False,
@@ -350,10 +296,6 @@ class TestValidationStateUpdates:
 
     def test_recalculate_can_import_vm_missing_cluster(self):
         """VM import not ready without cluster."""
-        from netbox_librenms_plugin.import_validation_helpers import (
-            recalculate_validation_status,
-        )
-
         validation = {
             "issues": [],
             "can_import": False,
@@ -7,34 +7,96 @@ Tests cover:
 - VLAN sync action
 """
 
+from types import MappingProxyType, SimpleNamespace
 from unittest.mock import MagicMock, patch
 
-# Import the autouse fixture from helpers
-pytest_plugins = ["netbox_librenms_plugin.tests.test_librenms_api_helpers"]
+import pytest
+
+from netbox_librenms_plugin.utils import (
+    check_vlan_group_matches,
+    get_tagged_vlan_css_class,
+    get_untagged_vlan_css_class,
+)
+from netbox_librenms_plugin.views.mixins import VlanAssignmentMixin
+
+
+@pytest.fixture
+def mock_librenms_config():
+    """
+    Override the autouse API config patches from test_librenms_api_helpers.
+
+    Nothing here reads plugin configuration (librenms_api patches its own), so
+    these pure-logic tests skip that fixture's setup.
+    """
+
+
+# Lookup maps as built by _build_vlan_lookup_maps() when NetBox has no VLANs
+_EMPTY_LOOKUP_MAPS = MappingProxyType({"vid_group_to_vlan": MappingProxyType({}), "vid_to_vlans": MappingProxyType({})})
+
+
+def _build_lookup_maps(entries):
+    """Build lookup maps like _build_vlan_lookup_maps() from ``(vid, group_id, vlan)`` entries."""
+    vid_group_to_vlan, vid_to_vlans = {}, {}
+    for vid, group_id, vlan in entries:
+        vid_group_to_vlan[(vid, group_id)] = vlan
+        vid_to_vlans.setdefault(vid, []).append(vlan)
+    return {"vid_group_to_vlan": vid_group_to_vlan, "vid_to_vlans": vid_to_vlans}
+
+
+class _TaggedVlansRecorder:
+    """Stand-in for an interface's tagged_vlans manager that records set()/clear() calls."""
+
+    def __init__(self):
+        self.set_calls = []
+        self.clear_calls = 0
+
+    def set(self, vlans):
+        self.set_calls.append(list(vlans))
+
+    def clear(self):
+        self.clear_calls += 1
+
+
+def _make_device(*, site=None, rack=None, location=None):
+    """Build a plain NetBox device stand-in with the scope attributes VLAN group lookups read."""
+    return SimpleNamespace(site=site, rack=rack, location=location)
+
+
+def _make_site(pk=1, region=None, group=None):
+    """Build a plain NetBox site stand-in."""
+    return SimpleNamespace(pk=pk, region=region, group=group)
+
+
+@pytest.fixture(scope="module")
+def vlan_mocks():
+    """Global NetBox VLAN stand-ins keyed by VID; tests only compare them by identity."""
+    return {vid: SimpleNamespace(vid=vid) for vid in (100, 200, 300)}
+
+
+@pytest.fixture(scope="module")
+def patched_contenttype():
+    """ContentType double resolving Rack to content type 100 and any other model to 101."""
+    with patch("django.contrib.contenttypes.models.ContentType") as mock_ct:
+        mock_ct.objects.get_for_model.side_effect = lambda model: MagicMock(pk=100 if "Rack" in str(model) else 101)
+        yield mock_ct
+
+
+@pytest.fixture(scope="module")
+def mixin():
+    """Stateless VlanAssignmentMixin shared by the tests in this module."""
+    return VlanAssignmentMixin()
 
 
 class TestVlanAssignmentMixin:
     """Tests for VlanAssignmentMixin methods."""
 
-    def test_get_vlan_groups_for_device_includes_site_scoped(self, mock_librenms_config):
+    def test_get_vlan_groups_for_device_includes_site_scoped(self, mixin):
         """Test that VLAN groups scoped to device's site are included."""
-        from netbox_librenms_plugin.views.mixins import VlanAssignmentMixin
-
-        mixin = VlanAssignmentMixin()
-
-        # Create mock device with site
-        mock_device = MagicMock()
-        mock_device.site = MagicMock()
-        mock_device.site.pk = 1
-        mock_device.site.region = None
-        mock_device.site.group = None
-        mock_device.location = None
-        mock_device.rack = None
+        mock_device = _make_device(site=_make_site(pk=1))
 
         # Mock the VLAN group query
-        mock_site_group = MagicMock()
-        mock_site_group.name = "Site VLANs"
-        mock_site_group.pk = 10
+        mock_site_group = MagicMock(pk=10)
+        mock_site_group.name = "Site VLANs"  # ``name`` is reserved as a MagicMock kwarg
 
         with patch.object(mixin, "_get_vlan_groups_for_scope") as mock_get_scope:
             mock_get_scope.return_value = [mock_site_group]
@@ -46,24 +108,16 @@ class TestVlanAssignmentMixin:
                 # Verify site scope was queried
                 assert mock_get_scope.called
 
-    def test_get_vlan_groups_for_device_includes_global(self, mock_librenms_config):
+    def test_get_vlan_groups_for_device_includes_global(self, mixin):
         """Test that global VLAN groups (no scope) are included."""
-        from netbox_librenms_plugin.views.mixins import VlanAssignmentMixin
-
-        mixin = VlanAssignmentMixin()
-
-        # Create mock device with no location context
-        mock_device = MagicMock()
-        mock_device.site = None
-        mock_device.location = None
-        mock_device.rack = None
+        # Device with no location context
+        mock_device = _make_device()
 
         with patch.object(mixin, "_get_vlan_groups_for_scope") as mock_get_scope:
             mock_get_scope.return_value = []
             with patch("ipam.models.VLANGroup") as mock_vlan_group_class:
-                mock_global_group = MagicMock()
+                mock_global_group = MagicMock(pk=20)
                 mock_global_group.name = "Global VLANs"
-                mock_global_group.pk = 20
                 mock_vlan_group_class.objects.filter.return_value = [mock_global_group]
 
                 mixin.get_vlan_groups_for_device(mock_device)
@@ -71,91 +125,33 @@ class TestVlanAssignmentMixin:
                 # Verify global scope was queried
                 mock_vlan_group_class.objects.filter.assert_called_with(scope_type__isnull=True)
 
-    def test_select_most_specific_group_prefers_rack(self, mock_librenms_config):
-        """Test that rack-scoped groups are preferred over site-scoped."""
-        from netbox_librenms_plugin.views.mixins import VlanAssignmentMixin
-
-        mixin = VlanAssignmentMixin()
-
-        # Create mock device with rack
-        mock_device = MagicMock()
-        mock_device.rack = MagicMock()
-        mock_device.rack.pk = 1
-        mock_device.site = MagicMock()
-        mock_device.site.pk = 2
-        mock_device.site.region = None
-        mock_device.site.group = None
-        mock_device.location = None
-
-        # Create mock groups with different scopes
-        mock_rack_group = MagicMock()
-        mock_rack_group.scope_type = MagicMock()
-        mock_rack_group.scope_type.pk = 100  # Rack content type
-        mock_rack_group.scope_id = 1
-
-        mock_site_group = MagicMock()
-        mock_site_group.scope_type = MagicMock()
-        mock_site_group.scope_type.pk = 101  # Site content type
-        mock_site_group.scope_id = 2
-
-        with patch("django.contrib.contenttypes.models.ContentType") as mock_ct:
-            # Mock ContentType lookups
-            mock_ct.objects.get_for_model.side_effect = lambda model: MagicMock(pk=100 if "Rack" in str(model) else 101)
-
-            result = mixin._select_most_specific_group([mock_rack_group, mock_site_group], mock_device)
-
-            # Rack-scoped should be preferred
-            assert result == mock_rack_group
-
-    def test_select_most_specific_group_returns_none_for_ambiguous(self, mock_librenms_config):
-        """Test that None is returned when multiple groups have same priority."""
-        from netbox_librenms_plugin.views.mixins import VlanAssignmentMixin
-
-        mixin = VlanAssignmentMixin()
-
-        # Create mock device
-        mock_device = MagicMock()
-        mock_device.site = MagicMock()
-        mock_device.site.pk = 1
-        mock_device.site.region = None
-        mock_device.site.group = None
-        mock_device.rack = None
-        mock_device.location = None
-
-        # Create two groups with same scope (both site-scoped to same site)
-        mock_group1 = MagicMock()
-        mock_group1.scope_type = MagicMock()
-        mock_group1.scope_type.pk = 101
-        mock_group1.scope_id = 1
-
-        mock_group2 = MagicMock()
-        mock_group2.scope_type = MagicMock()
-        mock_group2.scope_type.pk = 101
-        mock_group2.scope_id = 1
-
-        with patch("django.contrib.contenttypes.models.ContentType") as mock_ct:
-            mock_ct.objects.get_for_model.return_value = MagicMock(pk=101)
-
-            result = mixin._select_most_specific_group([mock_group1, mock_group2], mock_device)
-
-            # Ambiguous - should return None
-            assert result is None
-
-    def test_get_ancestors_returns_hierarchy(self, mock_librenms_config):
+    @pytest.mark.parametrize(
+        "rack_pk, site_pk, group_scopes, expected_index",
+        [
+            # Rack content type is 100, Site is 101
+            pytest.param(1, 2, [(100, 1), (101, 2)], 0, id="prefers_rack"),
+            pytest.param(None, 1, [(101, 1), (101, 1)], None, id="returns_none_for_ambiguous"),
+        ],
+    )
+    def test_select_most_specific_group(
+        self, mixin, patched_contenttype, rack_pk, site_pk, group_scopes, expected_index
+    ):
+        """The most specific scope wins; two groups at the same priority give no winner."""
+        device = _make_device(site=_make_site(pk=site_pk), rack=SimpleNamespace(pk=rack_pk) if rack_pk else None)
+        groups = [
+            SimpleNamespace(scope_type=SimpleNamespace(pk=ct_pk), scope_id=scope_id) for ct_pk, scope_id in group_scopes
+        ]
+
+        result = mixin._select_most_specific_group(groups, device)
+
+        assert result is (groups[expected_index] if expected_index is not None else None)
+
+    def test_get_ancestors_returns_hierarchy(self, mixin):
         """Test that _get_ancestors returns full parent chain."""
-        from netbox_librenms_plugin.views.mixins import VlanAssignmentMixin
-
-        mixin = VlanAssignmentMixin()
-
-        # Create mock location hierarchy
-        mock_grandparent = MagicMock()
-        mock_grandparent.parent = None
-
-        mock_parent = MagicMock()
-        mock_parent.parent = mock_grandparent
-
-        mock_location = MagicMock()
-        mock_location.parent = mock_parent
+        # Location hierarchy
+        mock_grandparent = SimpleNamespace(parent=None)
+        mock_parent = SimpleNamespace(parent=mock_grandparent)
+        mock_location = SimpleNamespace(parent=mock_parent)
 
         ancestors = mixin._get_ancestors(mock_location)
 
@@ -164,79 +160,30 @@ class TestVlanAssignmentMixin:
         assert ancestors[1] == mock_parent
         assert ancestors[2] == mock_grandparent
 
-    def test_find_vlan_in_group_prefers_specified_group(self, mock_librenms_config):
-        """Test that _find_vlan_in_group prefers the specified group."""
-        from netbox_librenms_plugin.views.mixins import VlanAssignmentMixin
-
-        mixin = VlanAssignmentMixin()
-
-        mock_vlan_in_group = MagicMock()
-        mock_vlan_global = MagicMock()
-
-        lookup_maps = {
-            "vid_group_to_vlan": {
-                (100, 5): mock_vlan_in_group,
-                (100, None): mock_vlan_global,
-            },
-            "vid_to_vlans": {
-                100: [mock_vlan_in_group, mock_vlan_global],
-            },
-        }
-
-        result = mixin._find_vlan_in_group(100, 5, lookup_maps)
-
-        assert result == mock_vlan_in_group
-
-    def test_find_vlan_in_group_falls_back_to_global(self, mock_librenms_config):
-        """Test that _find_vlan_in_group falls back to global VLAN."""
-        from netbox_librenms_plugin.views.mixins import VlanAssignmentMixin
-
-        mixin = VlanAssignmentMixin()
-
-        mock_vlan_global = MagicMock()
-
-        lookup_maps = {
-            "vid_group_to_vlan": {
-                (100, None): mock_vlan_global,
-            },
-            "vid_to_vlans": {
-                100: [mock_vlan_global],
-            },
-        }
-
-        # Request group 5 which doesn't have VLAN 100
-        result = mixin._find_vlan_in_group(100, 5, lookup_maps)
-
-        assert result == mock_vlan_global
+    @pytest.mark.parametrize(
+        "vid, group_id, present, expected",
+        [
+            pytest.param(100, 5, ("group", "global"), "group", id="prefers_specified_group"),
+            pytest.param(100, 5, ("global",), "global", id="falls_back_to_global"),
+            pytest.param(999, None, (), None, id="returns_none_if_not_found"),
+        ],
+    )
+    def test_find_vlan_in_group(self, mixin, vid, group_id, present, expected):
+        """_find_vlan_in_group prefers the requested group, then a global VLAN, else None."""
+        vlans = {"group": MagicMock(vid=100), "global": MagicMock(vid=100)}
+        vlan_groups = {"group": 5, "global": None}
+        lookup_maps = _build_lookup_maps((100, vlan_groups[key], vlans[key]) for key in present)
 
-    def test_find_vlan_in_group_returns_none_if_not_found(self, mock_librenms_config):
-        """Test that _find_vlan_in_group returns None if VLAN not found."""
-        from netbox_librenms_plugin.views.mixins import VlanAssignmentMixin
+        result = mixin._find_vlan_in_group(vid, group_id, lookup_maps)
 
-        mixin = VlanAssignmentMixin()
-
-        lookup_maps = {
-            "vid_group_to_vlan": {},
-            "vid_to_vlans": {},
-        }
-
-        result = mixin._find_vlan_in_group(999, None, lookup_maps)
-
-        assert result is None
+        assert result is (vlans[expected] if expected else None)
 
 
 class TestPortVlanEnrichment:
     """Tests for port VLAN data enrichment."""
 
-    pytest_plugins = ["tests.test_librenms_api_helpers"]
-
-    @patch("requests.get")
-    def test_parse_port_vlan_data_access_port(self, mock_get, mock_librenms_config):
+    def test_parse_port_vlan_data_access_port(self, librenms_api):
         """Test parsing access port VLAN data."""
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
-
-        api = LibreNMSAPI(server_key="default")
-
         port_data = {
             "port_id": 1234,
             "ifName": "Gi1/0/1",
@@ -245,7 +192,7 @@ class TestPortVlanEnrichment:
             "ifTrunk": None,
         }
 
-        result = api.parse_port_vlan_data(port_data, "ifName")
+        result = librenms_api.parse_port_vlan_data(port_data, "ifName")
 
         assert result["port_id"] == 1234
         assert result["interface_name"] == "Gi1/0/1"
@@ -253,13 +200,8 @@ class TestPortVlanEnrichment:
         assert result["untagged_vlan"] == 100
         assert result["tagged_vlans"] == []
 
-    @patch("requests.get")
-    def test_parse_port_vlan_data_trunk_port(self, mock_get, mock_librenms_config):
+    def test_parse_port_vlan_data_trunk_port(self, librenms_api):
         """Test parsing trunk port VLAN data."""
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
-
-        api = LibreNMSAPI(server_key="default")
-
         port_data = {
             "port_id": 5678,
             "ifName": "Te1/1/1",
@@ -273,7 +215,7 @@ class TestPortVlanEnrichment:
             ],
         }
 
-        result = api.parse_port_vlan_data(port_data, "ifName")
+        result = librenms_api.parse_port_vlan_data(port_data, "ifName")
 
         assert result["port_id"] == 5678
         assert result["interface_name"] == "Te1/1/1"
@@ -281,13 +223,8 @@ class TestPortVlanEnrichment:
         assert result["untagged_vlan"] == 90
         assert sorted(result["tagged_vlans"]) == [50, 60]
 
-    @patch("requests.get")
-    def test_parse_port_vlan_data_uses_interface_name_field(self, mock_get, mock_librenms_config):
+    def test_parse_port_vlan_data_uses_interface_name_field(self, librenms_api):
         """Test that parse_port_vlan_data respects interface_name_field parameter."""
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
-
-        api = LibreNMSAPI(server_key="default")
-
         port_data = {
             "port_id": 1234,
             "ifName": "Gi1/0/1",
@@ -296,7 +233,7 @@ class TestPortVlanEnrichment:
             "ifTrunk": None,
         }
 
-        result = api.parse_port_vlan_data(port_data, "ifDescr")
+        result = librenms_api.parse_port_vlan_data(port_data, "ifDescr")
 
         assert result["interface_name"] == "GigabitEthernet1/0/1"
 
@@ -304,24 +241,12 @@ class TestPortVlanEnrichment:
 class TestInterfaceVlanSync:
     """Tests for interface VLAN sync action."""
 
-    pytest_plugins = ["tests.test_librenms_api_helpers"]
-
-    def test_update_interface_vlan_assignment_access_mode(self, mock_librenms_config):
+    def test_update_interface_vlan_assignment_access_mode(self, mixin, vlan_mocks):
         """Test that access mode is set correctly for untagged-only ports."""
-        from netbox_librenms_plugin.views.mixins import VlanAssignmentMixin
+        mock_interface = MagicMock(tagged_vlans=_TaggedVlansRecorder())
 
-        mixin = VlanAssignmentMixin()
-
-        mock_interface = MagicMock()
-        mock_interface.tagged_vlans = MagicMock()
-
-        mock_vlan = MagicMock()
-        mock_vlan.vid = 100
-
-        lookup_maps = {
-            "vid_group_to_vlan": {(100, None): mock_vlan},
-            "vid_to_vlans": {100: [mock_vlan]},
-        }
+        mock_vlan = vlan_mocks[100]
+        lookup_maps = _build_lookup_maps([(100, None, mock_vlan)])
 
         vlan_data = {
             "untagged_vlan": 100,
@@ -332,36 +257,16 @@ class TestInterfaceVlanSync:
 
         assert mock_interface.mode == "access"
         assert mock_interface.untagged_vlan == mock_vlan
-        mock_interface.tagged_vlans.clear.assert_called_once()
+        assert mock_interface.tagged_vlans.clear_calls == 1
 
-    def test_update_interface_vlan_assignment_tagged_mode(self, mock_librenms_config):
+    def test_update_interface_vlan_assignment_tagged_mode(self, mixin, vlan_mocks):
         """Test that tagged mode is set for trunk ports."""
-        from netbox_librenms_plugin.views.mixins import VlanAssignmentMixin
-
-        mixin = VlanAssignmentMixin()
-
-        mock_interface = MagicMock()
-        mock_interface.tagged_vlans = MagicMock()
-
-        mock_vlan_100 = MagicMock()
-        mock_vlan_100.vid = 100
-        mock_vlan_200 = MagicMock()
-        mock_vlan_200.vid = 200
-        mock_vlan_300 = MagicMock()
-        mock_vlan_300.vid = 300
-
-        lookup_maps = {
-            "vid_group_to_vlan": {
-                (100, None): mock_vlan_100,
-                (200, None): mock_vlan_200,
-                (300, None): mock_vlan_300,
-            },
-            "vid_to_vlans": {
-                100: [mock_vlan_100],
-                200: [mock_vlan_200],
-                300: [mock_vlan_300],
-            },
-        }
+        mock_interface = MagicMock(tagged_vlans=_TaggedVlansRecorder())
+
+        mock_vlan_100, mock_vlan_200, mock_vlan_300 = vlan_mocks[100], vlan_mocks[200], vlan_mocks[300]
+        lookup_maps = _build_lookup_maps(
+            [(vlan.vid, None, vlan) for vlan in (mock_vlan_100, mock_vlan_200, mock_vlan_300)]
+        )
 
         vlan_data = {
             "untagged_vlan": 100,
@@ -372,57 +277,32 @@ class TestInterfaceVlanSync:
 
         assert mock_interface.mode == "tagged"
         assert mock_interface.untagged_vlan == mock_vlan_100
-        mock_interface.tagged_vlans.set.assert_called_once_with([mock_vlan_200, mock_vlan_300])
+        assert mock_interface.tagged_vlans.set_calls == [[mock_vlan_200, mock_vlan_300]]
 
-    def test_update_interface_vlan_assignment_missing_vlans(self, mock_librenms_config):
+    def test_update_interface_vlan_assignment_missing_vlans(self, mixin):
         """Test that missing VLANs are tracked in result."""
-        from netbox_librenms_plugin.views.mixins import VlanAssignmentMixin
-
-        mixin = VlanAssignmentMixin()
-
-        mock_interface = MagicMock()
-        mock_interface.tagged_vlans = MagicMock()
-
-        # Empty lookup maps - no VLANs exist in NetBox
-        lookup_maps = {
-            "vid_group_to_vlan": {},
-            "vid_to_vlans": {},
-        }
+        mock_interface = MagicMock(tagged_vlans=_TaggedVlansRecorder())
 
         vlan_data = {
             "untagged_vlan": 100,
             "tagged_vlans": [200, 300],
         }
 
-        result = mixin._update_interface_vlan_assignment(mock_interface, vlan_data, None, lookup_maps)
+        # No VLANs exist in NetBox
+        result = mixin._update_interface_vlan_assignment(mock_interface, vlan_data, None, _EMPTY_LOOKUP_MAPS)
 
         assert result["missing_vlans"] == [100, 200, 300]
         assert mock_interface.untagged_vlan is None
-        mock_interface.tagged_vlans.set.assert_called_once_with([])
+        assert mock_interface.tagged_vlans.set_calls == [[]]
 
-    def test_update_interface_vlan_assignment_respects_group_selection(self, mock_librenms_config):
+    def test_update_interface_vlan_assignment_respects_group_selection(self, mixin):
         """Test that VLAN group selection is respected."""
-        from netbox_librenms_plugin.views.mixins import VlanAssignmentMixin
-
-        mixin = VlanAssignmentMixin()
-
-        mock_interface = MagicMock()
-        mock_interface.tagged_vlans = MagicMock()
-
-        mock_vlan_group1 = MagicMock()
-        mock_vlan_group1.vid = 100
-        mock_vlan_global = MagicMock()
-        mock_vlan_global.vid = 100
-
-        lookup_maps = {
-            "vid_group_to_vlan": {
-                (100, 5): mock_vlan_group1,
-                (100, None): mock_vlan_global,
-            },
-            "vid_to_vlans": {
-                100: [mock_vlan_group1, mock_vlan_global],
-            },
-        }
+        mock_interface = MagicMock(tagged_vlans=_TaggedVlansRecorder())
+
+        mock_vlan_group1 = MagicMock(vid=100)
+        mock_vlan_global = MagicMock(vid=100)
+
+        lookup_maps = _build_lookup_maps([(100, 5, mock_vlan_group1), (100, None, mock_vlan_global)])
 
         vlan_data = {
             "untagged_vlan": 100,
@@ -446,118 +326,76 @@ class TestInterfaceCssClassGroupMatching:
 
     # -- get_untagged_vlan_css_class --
 
-    def test_untagged_vid_match_group_match_returns_green(self, mock_librenms_config):
-        from netbox_librenms_plugin.utils import get_untagged_vlan_css_class
-
+    def test_untagged_vid_match_group_match_returns_green(self):
         assert get_untagged_vlan_css_class(60, 60, True, [], group_matches=True) == "text-success"
 
-    def test_untagged_vid_match_group_mismatch_returns_orange(self, mock_librenms_config):
-        from netbox_librenms_plugin.utils import get_untagged_vlan_css_class
-
+    def test_untagged_vid_match_group_mismatch_returns_orange(self):
         assert get_untagged_vlan_css_class(60, 60, True, [], group_matches=False) == "text-warning"
 
-    def test_untagged_vid_differs_group_irrelevant(self, mock_librenms_config):
+    def test_untagged_vid_differs_group_irrelevant(self):
         """Different VIDs -> text-warning regardless of group_matches."""
-        from netbox_librenms_plugin.utils import get_untagged_vlan_css_class
-
         assert get_untagged_vlan_css_class(60, 100, True, [], group_matches=True) == "text-warning"
 
-    def test_untagged_not_in_netbox_ignores_group(self, mock_librenms_config):
-        from netbox_librenms_plugin.utils import get_untagged_vlan_css_class
-
+    def test_untagged_not_in_netbox_ignores_group(self):
         assert get_untagged_vlan_css_class(60, 60, False, [], group_matches=True) == "text-danger"
 
-    def test_untagged_missing_vlan_ignores_group(self, mock_librenms_config):
-        from netbox_librenms_plugin.utils import get_untagged_vlan_css_class
-
+    def test_untagged_missing_vlan_ignores_group(self):
         assert get_untagged_vlan_css_class(60, 60, True, [60], group_matches=True) == "text-danger"
 
-    def test_untagged_no_netbox_vlan_returns_red(self, mock_librenms_config):
-        from netbox_librenms_plugin.utils import get_untagged_vlan_css_class
-
+    def test_untagged_no_netbox_vlan_returns_red(self):
         assert get_untagged_vlan_css_class(60, None, True, [], group_matches=True) == "text-danger"
 
-    def test_untagged_default_group_matches_is_true(self, mock_librenms_config):
+    def test_untagged_default_group_matches_is_true(self):
         """Without group_matches param, defaults to True (backward compat)."""
-        from netbox_librenms_plugin.utils import get_untagged_vlan_css_class
-
         assert get_untagged_vlan_css_class(60, 60, True, []) == "text-success"
 
     # -- get_tagged_vlan_css_class --
 
-    def test_tagged_vid_present_group_match_returns_green(self, mock_librenms_config):
-        from netbox_librenms_plugin.utils import get_tagged_vlan_css_class
-
+    def test_tagged_vid_present_group_match_returns_green(self):
         assert get_tagged_vlan_css_class(60, {60, 100}, True, [], group_matches=True) == "text-success"
 
-    def test_tagged_vid_present_group_mismatch_returns_orange(self, mock_librenms_config):
-        from netbox_librenms_plugin.utils import get_tagged_vlan_css_class
-
+    def test_tagged_vid_present_group_mismatch_returns_orange(self):
         assert get_tagged_vlan_css_class(60, {60, 100}, True, [], group_matches=False) == "text-warning"
 
-    def test_tagged_vid_absent_group_irrelevant(self, mock_librenms_config):
-        from netbox_librenms_plugin.utils import get_tagged_vlan_css_class
-
+    def test_tagged_vid_absent_group_irrelevant(self):
         assert get_tagged_vlan_css_class(60, {100}, True, [], group_matches=True) == "text-danger"
 
-    def test_tagged_not_in_netbox_ignores_group(self, mock_librenms_config):
-        from netbox_librenms_plugin.utils import get_tagged_vlan_css_class
-
+    def test_tagged_not_in_netbox_ignores_group(self):
         assert get_tagged_vlan_css_class(60, {60}, False, [], group_matches=True) == "text-danger"
 
-    def test_tagged_missing_vlan_ignores_group(self, mock_librenms_config):
-        from netbox_librenms_plugin.utils import get_tagged_vlan_css_class
-
+    def test_tagged_missing_vlan_ignores_group(self):
         assert get_tagged_vlan_css_class(60, {60}, True, [60], group_matches=True) == "text-danger"
 
-    def test_tagged_default_group_matches_is_true(self, mock_librenms_config):
+    def test_tagged_default_group_matches_is_true(self):
         """Without group_matches param, defaults to True (backward compat)."""
-        from netbox_librenms_plugin.utils import get_tagged_vlan_css_class
-
         assert get_tagged_vlan_css_class(60, {60}, True, []) == "text-success"
 
     # -- check_vlan_group_matches --
 
-    def test_check_group_matches_untagged_same_group(self, mock_librenms_config):
-        from netbox_librenms_plugin.utils import check_vlan_group_matches
-
+    def test_check_group_matches_untagged_same_group(self):
         assert check_vlan_group_matches("U", 60, 5, 5, {}, 60, set()) is True
 
-    def test_check_group_matches_untagged_different_group(self, mock_librenms_config):
-        from netbox_librenms_plugin.utils import check_vlan_group_matches
-
+    def test_check_group_matches_untagged_different_group(self):
         assert check_vlan_group_matches("U", 60, 10, 5, {}, 60, set()) is False
 
-    def test_check_group_matches_untagged_vid_differs(self, mock_librenms_config):
+    def test_check_group_matches_untagged_vid_differs(self):
         """When VIDs don't match, group comparison is irrelevant -> True."""
-        from netbox_librenms_plugin.utils import check_vlan_group_matches
-
         assert check_vlan_group_matches("U", 60, 10, 5, {}, 100, set()) is True
 
-    def test_check_group_matches_tagged_same_group(self, mock_librenms_config):
-        from netbox_librenms_plugin.utils import check_vlan_group_matches
-
+    def test_check_group_matches_tagged_same_group(self):
         assert check_vlan_group_matches("T", 60, 5, None, {60: 5}, None, {60}) is True
 
-    def test_check_group_matches_tagged_different_group(self, mock_librenms_config):
-        from netbox_librenms_plugin.utils import check_vlan_group_matches
-
+    def test_check_group_matches_tagged_different_group(self):
         assert check_vlan_group_matches("T", 60, 10, None, {60: 5}, None, {60}) is False
 
-    def test_check_group_matches_tagged_vid_absent(self, mock_librenms_config):
+    def test_check_group_matches_tagged_vid_absent(self):
         """When VID is not tagged in NetBox, group comparison irrelevant -> True."""
-        from netbox_librenms_plugin.utils import check_vlan_group_matches
-
         assert check_vlan_group_matches("T", 60, 10, None, {}, None, set()) is True
 
-    def test_check_group_matches_global_to_global(self, mock_librenms_config):
+    def test_check_group_matches_global_to_global(self):
         """Both NetBox VLAN and selected have no group (global) -> match."""
-        from netbox_librenms_plugin.utils import check_vlan_group_matches
-
         assert check_vlan_group_matches("U", 60, None, None, {}, 60, set()) is True
 
-    def test_check_group_matches_global_vs_group(self, mock_librenms_config):
+    def test_check_group_matches_global_vs_group(self):
         """NetBox VLAN is global, selected is a specific group -> mismatch."""
-        from netbox_librenms_plugin.utils import check_vlan_group_matches
-
         assert check_vlan_group_matches("U", 60, 5, None, {}, 60, set()) is False
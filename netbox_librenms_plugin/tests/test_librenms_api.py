@@ -7,9 +7,12 @@ with particular focus on HTTP method correctness to prevent regression bugs.
 
 from unittest.mock import MagicMock, patch
 
+import orjson
 import pytest
 import requests
 
+from netbox_librenms_plugin.librenms_api import LibreNMSAPI
+
 # Import the autouse fixture from helpers
 pytest_plugins = ["netbox_librenms_plugin.tests.test_librenms_api_helpers"]
 
@@ -24,8 +27,6 @@ class TestLibreNMSAPIInit:
 
     def test_init_with_multi_server_config(self, mock_librenms_config):
         """Verify initialization with multi-server configuration."""
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
-
         api = LibreNMSAPI(server_key="default")
 
         assert api.librenms_url == "https://librenms.example.com"
@@ -51,8 +52,6 @@ class TestLibreNMSAPIInit:
 
         mock_config.side_effect = config_side_effect
 
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
-
         api = LibreNMSAPI()
 
         assert api.librenms_url == "https://legacy.example.com"
@@ -62,15 +61,11 @@ class TestLibreNMSAPIInit:
         mock_config = mock_librenms_config["mock_config"]
         mock_config.return_value = None
 
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
-
         with pytest.raises(ValueError):
             LibreNMSAPI(server_key="nonexistent")
 
     def test_init_nonexistent_server_key_raises_keyerror(self, mock_librenms_config):
         """Verify KeyError raised when specific server_key doesn't exist."""
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
-
         with pytest.raises(KeyError, match="nonexistent"):
             LibreNMSAPI(server_key="nonexistent")
 
@@ -84,8 +79,6 @@ class TestLibreNMSAPIInit:
             }
         }
 
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
-
         api = LibreNMSAPI(server_key="default")
         assert api.server_key == "primary"
         assert api.librenms_url == "https://primary.example.com"
@@ -108,8 +101,6 @@ class TestLibreNMSAPIConnection:
             "system": [{"local_ver": "24.1.0"}],
         }
 
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
-
         api = LibreNMSAPI(server_key="default")
         result = api.test_connection()
 
@@ -123,8 +114,6 @@ class TestLibreNMSAPIConnection:
         """Verify 401 unauthorized handling."""
         mock_get.return_value.status_code = 401
 
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
-
         api = LibreNMSAPI(server_key="default")
         result = api.test_connection()
 
@@ -135,8 +124,6 @@ class TestLibreNMSAPIConnection:
         """Verify 403 forbidden handling."""
         mock_get.return_value.status_code = 403
 
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
-
         api = LibreNMSAPI(server_key="default")
         result = api.test_connection()
 
@@ -147,8 +134,6 @@ class TestLibreNMSAPIConnection:
         """Verify timeout exception handling."""
         mock_get.side_effect = requests.exceptions.Timeout("Connection timed out")
 
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
-
         api = LibreNMSAPI(server_key="default")
         result = api.test_connection()
 
@@ -180,8 +165,6 @@ class TestLibreNMSAPIHttpMethods:
             "devices": [{"device_id": 1}],
         }
 
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
-
         api = LibreNMSAPI(server_key="default")
         api.get_device_info(device_id=1)
 
@@ -197,8 +180,6 @@ class TestLibreNMSAPIHttpMethods:
         mock_post.return_value.status_code = 200
         mock_post.return_value.json.return_value = {"status": "ok", "device_id": 42}
 
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
-
         api = LibreNMSAPI(server_key="default")
         api.add_device(
             data={
@@ -218,8 +199,6 @@ class TestLibreNMSAPIHttpMethods:
         mock_patch.return_value.status_code = 200
         mock_patch.return_value.json.return_value = {"status": "ok"}
 
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
-
         api = LibreNMSAPI(server_key="default")
         api.update_device_field(device_id=1, field_data={"field": ["location"], "data": ["DC1"]})
 
@@ -236,8 +215,6 @@ class TestLibreNMSAPIHttpMethods:
             "devices": [{"device_id": 10}],
         }
 
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
-
         api = LibreNMSAPI(server_key="default")
         api.get_device_id_by_ip("192.168.1.1")
 
@@ -254,8 +231,6 @@ class TestLibreNMSAPIHttpMethods:
             "devices": [{"device_id": 20}],
         }
 
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
-
         api = LibreNMSAPI(server_key="default")
         api.get_device_id_by_hostname("test-host")
 
@@ -269,8 +244,6 @@ class TestLibreNMSAPIHttpMethods:
         mock_get.return_value.status_code = 200
         mock_get.return_value.json.return_value = {"status": "ok", "ports": []}
 
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
-
         api = LibreNMSAPI(server_key="default")
         api.get_ports(device_id=1)
 
@@ -284,8 +257,6 @@ class TestLibreNMSAPIHttpMethods:
         mock_get.return_value.status_code = 200
         mock_get.return_value.json.return_value = {"status": "ok", "locations": []}
 
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
-
         api = LibreNMSAPI(server_key="default")
         api.get_locations()
 
@@ -302,8 +273,6 @@ class TestLibreNMSAPIHttpMethods:
             "message": "Location created #1",
         }
 
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
-
         api = LibreNMSAPI(server_key="default")
         api.add_location(location_data={"location": "DC1"})
 
@@ -320,8 +289,6 @@ class TestLibreNMSAPIHttpMethods:
             "message": "Location updated",
         }
 
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
-
         api = LibreNMSAPI(server_key="default")
         api.update_location(location_name="DC1", location_data={"location": "DC1-Updated"})
 
@@ -335,8 +302,6 @@ class TestLibreNMSAPIHttpMethods:
         mock_get.return_value.status_code = 200
         mock_get.return_value.json.return_value = {"status": "ok", "links": []}
 
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
-
         api = LibreNMSAPI(server_key="default")
         api.get_device_links(device_id=1)
 
@@ -350,8 +315,6 @@ class TestLibreNMSAPIHttpMethods:
         mock_get.return_value.status_code = 200
         mock_get.return_value.json.return_value = {"status": "ok", "addresses": []}
 
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
-
         api = LibreNMSAPI(server_key="default")
         api.get_device_ips(device_id=1)
 
@@ -365,8 +328,6 @@ class TestLibreNMSAPIHttpMethods:
         mock_get.return_value.status_code = 200
         mock_get.return_value.json.return_value = {"status": "ok", "port": [{}]}
 
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
-
         api = LibreNMSAPI(server_key="default")
         api.get_port_by_id(port_id=1)
 
@@ -380,8 +341,6 @@ class TestLibreNMSAPIHttpMethods:
         mock_get.return_value.status_code = 200
         mock_get.return_value.json.return_value = {"status": "ok", "inventory": []}
 
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
-
         api = LibreNMSAPI(server_key="default")
         api.get_device_inventory(device_id=1)
 
@@ -395,8 +354,6 @@ class TestLibreNMSAPIHttpMethods:
         mock_get.return_value.status_code = 200
         mock_get.return_value.json.return_value = {"status": "ok", "groups": []}
 
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
-
         api = LibreNMSAPI(server_key="default")
         api.get_poller_groups()
 
@@ -414,8 +371,6 @@ class TestLibreNMSAPIHttpMethods:
             "inventory": [{"entPhysicalClass": "chassis"}],
         }
 
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
-
         api = LibreNMSAPI(server_key="default")
         api.get_inventory_filtered(device_id=1, ent_physical_class="chassis")
 
@@ -427,9 +382,7 @@ class TestLibreNMSAPIHttpMethods:
     def test_list_devices_uses_get(self, mock_get, mock_delete, mock_librenms_config):
         """Verify list_devices uses GET."""
         mock_get.return_value.status_code = 200
-        mock_get.return_value.json.return_value = {"status": "ok", "devices": []}
-
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
+        mock_get.return_value.content = orjson.dumps({"status": "ok", "devices": []})
 
         api = LibreNMSAPI(server_key="default")
         api.list_devices()
@@ -443,8 +396,6 @@ class TestLibreNMSAPIHttpMethods:
         mock_get.return_value.status_code = 200
         mock_get.return_value.json.return_value = {"status": "ok"}
 
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
-
         api = LibreNMSAPI(server_key="default")
         api.test_connection()
 
@@ -461,8 +412,6 @@ class TestLibreNMSAPIDeviceLookup:
 
     def test_get_librenms_id_from_custom_field(self, mock_librenms_config):
         """Returns ID when already stored in cf['librenms_id']."""
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
-
         api = LibreNMSAPI(server_key="default")
 
         device = MagicMock()
@@ -477,8 +426,6 @@ class TestLibreNMSAPIDeviceLookup:
         """Returns ID from Django cache when not in custom field."""
         mock_cache.get.return_value = 99
 
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
-
         api = LibreNMSAPI(server_key="default")
 
         device = MagicMock()
@@ -499,8 +446,6 @@ class TestLibreNMSAPIDeviceLookup:
             "devices": [{"device_id": 55}],
         }
 
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
-
         api = LibreNMSAPI(server_key="default")
 
         device = MagicMock()
@@ -538,8 +483,6 @@ class TestLibreNMSAPIDeviceLookup:
 
         mock_get.side_effect = side_effect
 
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
-
         api = LibreNMSAPI(server_key="default")
 
         device = MagicMock()
@@ -558,8 +501,6 @@ class TestLibreNMSAPIDeviceLookup:
         mock_get.return_value.status_code = 200
         mock_get.return_value.json.return_value = {"status": "ok", "devices": []}
 
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
-
         api = LibreNMSAPI(server_key="default")
         result = api.get_device_id_by_ip("192.168.99.99")
 
@@ -571,8 +512,6 @@ class TestLibreNMSAPIDeviceLookup:
         mock_get.return_value.status_code = 200
         mock_get.return_value.json.return_value = {"status": "ok", "devices": []}
 
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
-
         api = LibreNMSAPI(server_key="default")
         result = api.get_device_id_by_hostname("nonexistent-host")
 
@@ -598,8 +537,6 @@ class TestLibreNMSAPIDeviceOperations:
             "message": "Device added successfully",
         }
 
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
-
         api = LibreNMSAPI(server_key="default")
         result = api.add_device(
             data={
@@ -621,8 +558,6 @@ class TestLibreNMSAPIDeviceOperations:
             "message": "Device added successfully",
         }
 
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
-
         api = LibreNMSAPI(server_key="default")
         result = api.add_device(
             data={
@@ -649,8 +584,6 @@ class TestLibreNMSAPIDeviceOperations:
             "message": "Device already exists",
         }
 
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
-
         api = LibreNMSAPI(server_key="default")
         result = api.add_device(
             data={
@@ -672,8 +605,6 @@ class TestLibreNMSAPIDeviceOperations:
             "message": "Device added successfully",
         }
 
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
-
         api = LibreNMSAPI(server_key="default")
         result = api.add_device(
             data={
@@ -712,8 +643,6 @@ class TestLibreNMSAPIDeviceOperations:
             "message": "Device field updated",
         }
 
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
-
         api = LibreNMSAPI(server_key="default")
         success, message = api.update_device_field(device_id=123, field_data={"field": "notes", "data": "Updated note"})
 
@@ -729,8 +658,6 @@ class TestLibreNMSAPIDeviceOperations:
             "devices": [{"device_id": 123, "hostname": "test-device"}],
         }
 
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
-
         api = LibreNMSAPI(server_key="default")
         success, device_data = api.get_device_info(device_id=123)
 
@@ -744,8 +671,6 @@ class TestLibreNMSAPIDeviceOperations:
         mock_get.return_value.status_code = 200
         mock_get.return_value.json.return_value = {"status": "ok", "devices": []}
 
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
-
         api = LibreNMSAPI(server_key="default")
 
         # Should raise IndexError when devices list is empty
@@ -756,12 +681,12 @@ class TestLibreNMSAPIDeviceOperations:
     def test_list_devices_with_filters(self, mock_get, mock_librenms_config):
         """Verify listing devices with filter parameter."""
         mock_get.return_value.status_code = 200
-        mock_get.return_value.json.return_value = {
-            "status": "ok",
-            "devices": [{"device_id": 1}, {"device_id": 2}],
-        }
-
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
+        mock_get.return_value.content = orjson.dumps(
+            {
+                "status": "ok",
+                "devices": [{"device_id": 1}, {"device_id": 2}],
+            }
+        )
 
         api = LibreNMSAPI(server_key="default")
         success, devices = api.list_devices(filters={"type": "network"})
@@ -789,8 +714,6 @@ class TestLibreNMSAPILocationOperations:
             "locations": [{"id": 1, "location": "DC1"}],
         }
 
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
-
         api = LibreNMSAPI(server_key="default")
         success, locations = api.get_locations()
 
@@ -806,8 +729,6 @@ class TestLibreNMSAPILocationOperations:
             "message": "Location created #5",
         }
 
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
-
         api = LibreNMSAPI(server_key="default")
         success, result_dict = api.add_location(location_data={"location": "DC2"})
 
@@ -824,8 +745,6 @@ class TestLibreNMSAPILocationOperations:
             "message": "Invalid location data",
         }
 
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
-
         api = LibreNMSAPI(server_key="default")
         success, error_msg = api.add_location(location_data={})
 
@@ -841,8 +760,6 @@ class TestLibreNMSAPILocationOperations:
             "message": "Location updated",
         }
 
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
-
         api = LibreNMSAPI(server_key="default")
         success, message = api.update_location(location_name="DC1", location_data={"location": "DC1-Updated"})
 
@@ -857,8 +774,6 @@ class TestLibreNMSAPILocationOperations:
             "message": "Location not found",
         }
 
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
-
         api = LibreNMSAPI(server_key="default")
         success, message = api.update_location(location_name="NonExistent", location_data={})
 
@@ -884,8 +799,6 @@ class TestLibreNMSAPIPortsAndInventory:
             "ports": [{"port_id": 1}, {"port_id": 2}],
         }
 
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
-
         api = LibreNMSAPI(server_key="default")
         success, data = api.get_ports(device_id=123)
 
@@ -902,8 +815,6 @@ class TestLibreNMSAPIPortsAndInventory:
             "port": [{"port_id": 1, "ifName": "GigabitEthernet0/1"}],
         }
 
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
-
         api = LibreNMSAPI(server_key="default")
         success, port_data = api.get_port_by_id(port_id=1)
 
@@ -915,8 +826,6 @@ class TestLibreNMSAPIPortsAndInventory:
         """Verify handling of port retrieval error."""
         mock_get.side_effect = requests.exceptions.RequestException("Connection error")
 
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
-
         api = LibreNMSAPI(server_key="default")
         success, error_msg = api.get_port_by_id(port_id=999)
 
@@ -932,8 +841,6 @@ class TestLibreNMSAPIPortsAndInventory:
             "inventory": [{"entPhysicalClass": "chassis"}],
         }
 
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
-
         api = LibreNMSAPI(server_key="default")
         success, inventory = api.get_device_inventory(device_id=123)
 
@@ -949,8 +856,6 @@ class TestLibreNMSAPIPortsAndInventory:
             "inventory": [{"entPhysicalClass": "chassis", "entPhysicalName": "Chassis"}],
         }
 
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
-
         api = LibreNMSAPI(server_key="default")
         success, inventory = api.get_inventory_filtered(device_id=123, ent_physical_class="chassis")
 
@@ -966,8 +871,6 @@ class TestLibreNMSAPIPortsAndInventory:
             "inventory": [{"entPhysicalContainedIn": "0"}],
         }
 
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
-
         api = LibreNMSAPI(server_key="default")
         success, inventory = api.get_inventory_filtered(device_id=123, ent_physical_contained_in=0)
 
@@ -982,8 +885,6 @@ class TestLibreNMSAPIPortsAndInventory:
             "links": [{"id": 1, "local_port_id": 10, "remote_port_id": 20}],
         }
 
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
-
         api = LibreNMSAPI(server_key="default")
         success, links_dict = api.get_device_links(device_id=123)
 
@@ -1000,8 +901,6 @@ class TestLibreNMSAPIPortsAndInventory:
             "addresses": [{"ipv4_address": "10.0.0.1"}],
         }
 
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
-
         api = LibreNMSAPI(server_key="default")
         success, ips = api.get_device_ips(device_id=123)
 
@@ -1014,8 +913,6 @@ class TestLibreNMSAPIPortsAndInventory:
         mock_get.return_value.status_code = 200
         mock_get.return_value.json.return_value = {"status": "ok", "addresses": []}
 
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
-
         api = LibreNMSAPI(server_key="default")
         success, ips = api.get_device_ips(device_id=123)
 
@@ -1042,8 +939,6 @@ class TestLibreNMSAPIPollerAndDevices:
             "get_poller_group": [{"id": 1, "group_name": "primary"}],
         }
 
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
-
         api = LibreNMSAPI(server_key="default")
         success, groups = api.get_poller_groups()
 
@@ -1059,8 +954,6 @@ class TestLibreNMSAPIPollerAndDevices:
             "get_poller_group": [],
         }
 
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
-
         api = LibreNMSAPI(server_key="default")
         success, groups = api.get_poller_groups()
 
@@ -1071,12 +964,12 @@ class TestLibreNMSAPIPollerAndDevices:
     def test_list_devices_all(self, mock_get, mock_librenms_config):
         """Verify listing all devices."""
         mock_get.return_value.status_code = 200
-        mock_get.return_value.json.return_value = {
-            "status": "ok",
-            "devices": [{"device_id": 1}, {"device_id": 2}, {"device_id": 3}],
-        }
-
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
+        mock_get.return_value.content = orjson.dumps(
+            {
+                "status": "ok",
+                "devices": [{"device_id": 1}, {"device_id": 2}, {"device_id": 3}],
+            }
+        )
 
         api = LibreNMSAPI(server_key="default")
         success, devices = api.list_devices()
@@ -1088,9 +981,7 @@ class TestLibreNMSAPIPollerAndDevices:
     def test_list_devices_empty(self, mock_get, mock_librenms_config):
         """Verify handling empty device list."""
         mock_get.return_value.status_code = 200
-        mock_get.return_value.json.return_value = {"status": "ok", "devices": []}
-
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
+        mock_get.return_value.content = orjson.dumps({"status": "ok", "devices": []})
 
         api = LibreNMSAPI(server_key="default")
         success, devices = api.list_devices()
@@ -1114,8 +1005,6 @@ class TestLibreNMSAPIErrorHandling:
         """Verify handling of network errors."""
         mock_get.side_effect = requests.exceptions.ConnectionError("Network unreachable")
 
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
-
         api = LibreNMSAPI(server_key="default")
         success, result = api.get_device_info(device_id=123)
 
@@ -1127,8 +1016,6 @@ class TestLibreNMSAPIErrorHandling:
         """Verify handling of timeout errors."""
         mock_get.side_effect = requests.exceptions.Timeout("Request timed out")
 
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
-
         api = LibreNMSAPI(server_key="default")
         success, result = api.get_device_info(device_id=123)
 
@@ -1141,8 +1028,6 @@ class TestLibreNMSAPIErrorHandling:
         mock_get.return_value.status_code = 200
         mock_get.return_value.json.side_effect = ValueError("Invalid JSON")
 
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
-
         api = LibreNMSAPI(server_key="default")
 
         # ValueError should be raised, not caught
@@ -1158,8 +1043,6 @@ class TestLibreNMSAPIErrorHandling:
             "message": "Internal server error",
         }
 
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
-
         api = LibreNMSAPI(server_key="default")
         success, result = api.get_device_info(device_id=123)
 
@@ -1172,8 +1055,6 @@ class TestLibreNMSAPIErrorHandling:
         mock_post.return_value.status_code = 200
         mock_post.return_value.json.return_value = {}  # Missing expected fields
 
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
-
         api = LibreNMSAPI(server_key="default")
         result = api.add_device(
             data={
@@ -1191,8 +1072,6 @@ class TestLibreNMSAPIErrorHandling:
         """Verify handling of SSL verification errors."""
         mock_get.side_effect = requests.exceptions.SSLError("SSL certificate verification failed")
 
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
-
         api = LibreNMSAPI(server_key="default")
         result = api.test_connection()
 
@@ -0,0 +1,41 @@
+"""Tests for netbox_librenms_plugin.metrics module."""
+
+import pytest
+
+prometheus_client = pytest.importorskip("prometheus_client")
+
+from netbox_librenms_plugin.metrics import instrumented_cache  # noqa: E402
+
+
+def _sample(name, label):
+    return prometheus_client.REGISTRY.get_sample_value(name, {"func": label}) or 0.0
+
+
+class TestInstrumentedCache:
+    """Test the instrumented_cache decorator."""
+
+    def test_counts_hits_and_misses(self):
+        """None counts as a miss, any other value as a hit."""
+        store = {"present": [1, 2]}
+
+        @instrumented_cache("test_hits_misses")
+        def lookup(key):
+            return store.get(key)
+
+        assert lookup("present") == [1, 2]
+        assert lookup("absent") is None
+
+        assert _sample("nlp_cache_hits_total", "test_hits_misses") == 1.0
+        assert _sample("nlp_cache_misses_total", "test_hits_misses") == 1.0
+        assert _sample("nlp_cache_get_seconds_count", "test_hits_misses") == 2.0
+
+    def test_preserves_function_metadata(self):
+        """Wrapped helper keeps its name and docstring."""
+
+        @instrumented_cache("test_metadata")
+        def lookup(key):
+            """Lookup docstring."""
+            return None
+
+        assert lookup.__name__ == "lookup"
+        assert lookup.__doc__ == "Lookup docstring."
@@ -1,13 +1,31 @@
+import json
 from unittest.mock import MagicMock, patch
 
+import pytest
+from django.core.exceptions import PermissionDenied
+from django.http import Http404
+
+from netbox_librenms_plugin.api.views import LibreNMSPluginPermission
+from netbox_librenms_plugin.constants import PERM_CHANGE_PLUGIN, PERM_VIEW_PLUGIN
+from netbox_librenms_plugin.import_utils import (
+    bulk_import_devices_shared,
+    bulk_import_vms,
+    check_user_permissions,
+    require_permissions,
+)
+from netbox_librenms_plugin.views.mixins import (
+    LibreNMSPermissionMixin,
+    NetBoxObjectPermissionMixin,
+    _get_safe_redirect_url,
+)
+from netbox_librenms_plugin.views.sync.interfaces import DeleteNetBoxInterfacesView, SyncInterfacesView
+
 
 class TestLibreNMSPermissionMixin:
     """Tests for permission mixin functionality."""
 
     def test_has_write_permission_granted(self):
         """User with change permission has write access."""
-        from netbox_librenms_plugin.views.mixins import LibreNMSPermissionMixin
-
         mixin = LibreNMSPermissionMixin()
         mixin.request = MagicMock()
         mixin.request.user.has_perm.return_value = True
@@ -16,8 +34,6 @@ class TestLibreNMSPermissionMixin:
 
     def test_has_write_permission_denied(self):
         """User without change permission lacks write access."""
-        from netbox_librenms_plugin.views.mixins import LibreNMSPermissionMixin
-
         mixin = LibreNMSPermissionMixin()
         mixin.request = MagicMock()
         mixin.request.user.has_perm.return_value = False
@@ -26,8 +42,6 @@ class TestLibreNMSPermissionMixin:
 
     def test_require_write_permission_allowed(self):
         """User with write permission gets None (allowed to proceed)."""
-        from netbox_librenms_plugin.views.mixins import LibreNMSPermissionMixin
-
         mixin = LibreNMSPermissionMixin()
         mixin.request = MagicMock()
         mixin.request.user.has_perm.return_value = True
@@ -37,8 +51,6 @@ class TestLibreNMSPermissionMixin:
 
     def test_require_write_permission_denied(self):
         """User without write permission gets redirect response to referrer."""
-        from netbox_librenms_plugin.views.mixins import LibreNMSPermissionMixin
-
         mixin = LibreNMSPermissionMixin()
         mixin.request = MagicMock()
         mixin.request.user.has_perm.return_value = False
@@ -57,8 +69,6 @@ class TestLibreNMSPermissionMixin:
 
     def test_require_write_permission_denied_htmx(self):
         """HTMX request without write permission gets HX-Redirect response."""
-        from netbox_librenms_plugin.views.mixins import LibreNMSPermissionMixin
-
         mixin = LibreNMSPermissionMixin()
         mixin.request = MagicMock()
         mixin.request.user.has_perm.return_value = False
@@ -77,8 +87,6 @@ class TestLibreNMSPermissionMixin:
 
     def test_require_write_permission_json_allowed(self):
         """User with write permission gets None (allowed to proceed)."""
-        from netbox_librenms_plugin.views.mixins import LibreNMSPermissionMixin
-
         mixin = LibreNMSPermissionMixin()
         mixin.request = MagicMock()
         mixin.request.user.has_perm.return_value = True
@@ -88,9 +96,6 @@ class TestLibreNMSPermissionMixin:
 
     def test_require_write_permission_json_denied(self):
         """User without write permission gets JsonResponse with 403."""
-        import json
-        from netbox_librenms_plugin.views.mixins import LibreNMSPermissionMixin
-
         mixin = LibreNMSPermissionMixin()
         mixin.request = MagicMock()
         mixin.request.user.has_perm.return_value = False
@@ -104,9 +109,6 @@ class TestLibreNMSPermissionMixin:
 
     def test_require_write_permission_json_custom_message(self):
         """Custom error message is returned in JsonResponse."""
-        import json
-        from netbox_librenms_plugin.views.mixins import LibreNMSPermissionMixin
-
         mixin = LibreNMSPermissionMixin()
         mixin.request = MagicMock()
         mixin.request.user.has_perm.return_value = False
@@ -124,9 +126,6 @@ class TestAPIPermissions:
 
     def test_get_requires_view_permission(self):
         """GET requests require view permission."""
-        from netbox_librenms_plugin.api.views import LibreNMSPluginPermission
-        from netbox_librenms_plugin.constants import PERM_VIEW_PLUGIN
-
         permission = LibreNMSPluginPermission()
         request = MagicMock()
         request.method = "GET"
@@ -137,9 +136,6 @@ class TestAPIPermissions:
 
     def test_post_requires_change_permission(self):
         """POST requests require change permission."""
-        from netbox_librenms_plugin.api.views import LibreNMSPluginPermission
-        from netbox_librenms_plugin.constants import PERM_CHANGE_PLUGIN
-
         permission = LibreNMSPluginPermission()
         request = MagicMock()
         request.method = "POST"
@@ -150,9 +146,6 @@ class TestAPIPermissions:
 
     def test_put_requires_change_permission(self):
         """PUT requests require change permission."""
-        from netbox_librenms_plugin.api.views import LibreNMSPluginPermission
-        from netbox_librenms_plugin.constants import PERM_CHANGE_PLUGIN
-
         permission = LibreNMSPluginPermission()
         request = MagicMock()
         request.method = "PUT"
@@ -163,9 +156,6 @@ class TestAPIPermissions:
 
     def test_delete_requires_change_permission(self):
         """DELETE requests require change permission."""
-        from netbox_librenms_plugin.api.views import LibreNMSPluginPermission
-        from netbox_librenms_plugin.constants import PERM_CHANGE_PLUGIN
-
         permission = LibreNMSPluginPermission()
         request = MagicMock()
         request.method = "DELETE"
@@ -176,8 +166,6 @@ class TestAPIPermissions:
 
     def test_get_denied_without_view_permission(self):
         """GET requests denied without view permission."""
-        from netbox_librenms_plugin.api.views import LibreNMSPluginPermission
-
         permission = LibreNMSPluginPermission()
         request = MagicMock()
         request.method = "GET"
@@ -187,8 +175,6 @@ class TestAPIPermissions:
 
     def test_post_denied_without_change_permission(self):
         """POST requests denied without change permission."""
-        from netbox_librenms_plugin.api.views import LibreNMSPluginPermission
-
         permission = LibreNMSPluginPermission()
         request = MagicMock()
         request.method = "POST"
@@ -202,14 +188,10 @@ class TestPermissionConstants:
 
     def test_view_permission_constant(self):
         """View permission constant is correct."""
-        from netbox_librenms_plugin.constants import PERM_VIEW_PLUGIN
-
         assert PERM_VIEW_PLUGIN == "netbox_librenms_plugin.view_librenmssettings"
 
     def test_change_permission_constant(self):
         """Change permission constant is correct."""
-        from netbox_librenms_plugin.constants import PERM_CHANGE_PLUGIN
-
         assert PERM_CHANGE_PLUGIN == "netbox_librenms_plugin.change_librenmssettings"
 
 
@@ -223,8 +205,6 @@ class TestObjectPermissionHelpers:
 
     def test_check_user_permissions_all_granted(self):
         """Returns True when user has all permissions."""
-        from netbox_librenms_plugin.import_utils import check_user_permissions
-
         user = MagicMock()
         user.has_perm.return_value = True
 
@@ -236,8 +216,6 @@ class TestObjectPermissionHelpers:
 
     def test_check_user_permissions_some_missing(self):
         """Returns False with list of missing permissions."""
-        from netbox_librenms_plugin.import_utils import check_user_permissions
-
         user = MagicMock()
         user.has_perm.side_effect = lambda p: p != "dcim.add_interface"
 
@@ -248,8 +226,6 @@ class TestObjectPermissionHelpers:
 
     def test_check_user_permissions_all_missing(self):
         """Returns False with all permissions listed as missing."""
-        from netbox_librenms_plugin.import_utils import check_user_permissions
-
         user = MagicMock()
         user.has_perm.return_value = False
 
@@ -261,18 +237,11 @@ class TestObjectPermissionHelpers:
 
     def test_check_user_permissions_no_user(self):
         """Raises PermissionDenied when user is None."""
-        import pytest
-        from django.core.exceptions import PermissionDenied
-
-        from netbox_librenms_plugin.import_utils import check_user_permissions
-
         with pytest.raises(PermissionDenied, match="No user context"):
             check_user_permissions(None, ["dcim.add_device"])
 
     def test_require_permissions_passes_when_granted(self):
         """Does not raise when user has all permissions."""
-        from netbox_librenms_plugin.import_utils import require_permissions
-
         user = MagicMock()
         user.has_perm.return_value = True
 
@@ -281,11 +250,6 @@ class TestObjectPermissionHelpers:
 
     def test_require_permissions_raises_on_missing(self):
         """Raises PermissionDenied with descriptive message."""
-        import pytest
-        from django.core.exceptions import PermissionDenied
-
-        from netbox_librenms_plugin.import_utils import require_permissions
-
         user = MagicMock()
         user.has_perm.return_value = False
 
@@ -298,11 +262,6 @@ class TestObjectPermissionHelpers:
 
     def test_require_permissions_lists_multiple_missing(self):
         """Error message includes all missing permissions."""
-        import pytest
-        from django.core.exceptions import PermissionDenied
-
-        from netbox_librenms_plugin.import_utils import require_permissions
-
         user = MagicMock()
         user.has_perm.return_value = False
 
@@ -323,8 +282,6 @@ class TestNetBoxObjectPermissionMixin:
 
     def test_check_object_permissions_all_granted(self):
         """Returns True when user has all object permissions."""
-        from netbox_librenms_plugin.views.mixins import NetBoxObjectPermissionMixin
-
         mixin = NetBoxObjectPermissionMixin()
         mixin.request = MagicMock()
         mixin.request.user.has_perm.return_value = True
@@ -343,8 +300,6 @@ class TestNetBoxObjectPermissionMixin:
 
     def test_check_object_permissions_some_missing(self):
         """Returns False with missing permission strings."""
-        from netbox_librenms_plugin.views.mixins import NetBoxObjectPermissionMixin
-
         mixin = NetBoxObjectPermissionMixin()
         mixin.request = MagicMock()
         mixin.request.user.has_perm.side_effect = lambda p: p != "dcim.add_interface"
@@ -363,8 +318,6 @@ class TestNetBoxObjectPermissionMixin:
 
     def test_check_object_permissions_no_requirements(self):
         """Returns True when no permissions required for method."""
-        from netbox_librenms_plugin.views.mixins import NetBoxObjectPermissionMixin
-
         mixin = NetBoxObjectPermissionMixin()
         mixin.request = MagicMock()
         mixin.required_object_permissions = {}  # No requirements
@@ -376,8 +329,6 @@ class TestNetBoxObjectPermissionMixin:
 
     def test_require_object_permissions_returns_none_when_granted(self):
         """Returns None when all permissions are granted."""
-        from netbox_librenms_plugin.views.mixins import NetBoxObjectPermissionMixin
-
         mixin = NetBoxObjectPermissionMixin()
         mixin.request = MagicMock()
         mixin.request.user.has_perm.return_value = True
@@ -395,8 +346,6 @@ class TestNetBoxObjectPermissionMixin:
 
     def test_require_object_permissions_returns_redirect_response(self):
         """Returns redirect response with message when permissions missing."""
-        from netbox_librenms_plugin.views.mixins import NetBoxObjectPermissionMixin
-
         mixin = NetBoxObjectPermissionMixin()
         mixin.request = MagicMock()
         mixin.request.user.has_perm.return_value = False
@@ -427,8 +376,6 @@ class TestNetBoxObjectPermissionMixin:
 
     def test_require_object_permissions_htmx_returns_hx_redirect(self):
         """HTMX request returns HX-Redirect header when permissions missing."""
-        from netbox_librenms_plugin.views.mixins import NetBoxObjectPermissionMixin
-
         mixin = NetBoxObjectPermissionMixin()
         mixin.request = MagicMock()
         mixin.request.user.has_perm.return_value = False
@@ -453,8 +400,6 @@ class TestNetBoxObjectPermissionMixin:
 
     def test_require_object_permissions_json_allowed(self):
         """Returns None when all object permissions are granted."""
-        from netbox_librenms_plugin.views.mixins import NetBoxObjectPermissionMixin
-
         mixin = NetBoxObjectPermissionMixin()
         mixin.request = MagicMock()
         mixin.request.user.has_perm.return_value = True
@@ -472,10 +417,6 @@ class TestNetBoxObjectPermissionMixin:
 
     def test_require_object_permissions_json_denied(self):
         """Returns JsonResponse with 403 when object permissions missing."""
-        import json
-
-        from netbox_librenms_plugin.views.mixins import NetBoxObjectPermissionMixin
-
         mixin = NetBoxObjectPermissionMixin()
         mixin.request = MagicMock()
         mixin.request.user.has_perm.return_value = False
@@ -496,10 +437,6 @@ class TestNetBoxObjectPermissionMixin:
 
     def test_require_all_permissions_allowed(self):
         """Returns None when both write and object permissions granted."""
-        from netbox_librenms_plugin.views.mixins import (
-            LibreNMSPermissionMixin,
-            NetBoxObjectPermissionMixin,
-        )
 
         class TestView(LibreNMSPermissionMixin, NetBoxObjectPermissionMixin):
             pass
@@ -521,10 +458,6 @@ class TestNetBoxObjectPermissionMixin:
 
     def test_require_all_permissions_denied_write(self):
         """Returns error when write permission denied (doesn't check object perms)."""
-        from netbox_librenms_plugin.views.mixins import (
-            LibreNMSPermissionMixin,
-            NetBoxObjectPermissionMixin,
-        )
 
         class TestView(LibreNMSPermissionMixin, NetBoxObjectPermissionMixin):
             pass
@@ -549,10 +482,6 @@ class TestNetBoxObjectPermissionMixin:
 
     def test_require_all_permissions_denied_object(self):
         """Returns error when object permissions denied (write passes)."""
-        from netbox_librenms_plugin.views.mixins import (
-            LibreNMSPermissionMixin,
-            NetBoxObjectPermissionMixin,
-        )
 
         class TestView(LibreNMSPermissionMixin, NetBoxObjectPermissionMixin):
             pass
@@ -583,10 +512,6 @@ class TestNetBoxObjectPermissionMixin:
 
     def test_require_all_permissions_json_allowed(self):
         """Returns None when both write and object permissions granted (JSON variant)."""
-        from netbox_librenms_plugin.views.mixins import (
-            LibreNMSPermissionMixin,
-            NetBoxObjectPermissionMixin,
-        )
 
         class TestView(LibreNMSPermissionMixin, NetBoxObjectPermissionMixin):
             pass
@@ -608,12 +533,6 @@ class TestNetBoxObjectPermissionMixin:
 
     def test_require_all_permissions_json_denied_write(self):
         """Returns JSON 403 when write permission denied (JSON variant)."""
-        import json
-
-        from netbox_librenms_plugin.views.mixins import (
-            LibreNMSPermissionMixin,
-            NetBoxObjectPermissionMixin,
-        )
 
         class TestView(LibreNMSPermissionMixin, NetBoxObjectPermissionMixin):
             pass
@@ -637,8 +556,6 @@ class TestBulkImportPermissions:
     @patch("netbox_librenms_plugin.import_utils.LibreNMSAPI")
     def test_bulk_import_devices_checks_permissions(self, mock_api_class, mock_require):
         """bulk_import_devices_shared calls require_permissions."""
-        from netbox_librenms_plugin.import_utils import bulk_import_devices_shared
-
         user = MagicMock()
         mock_api = MagicMock()
         mock_api_class.return_value = mock_api
@@ -662,8 +579,6 @@ class TestBulkImportPermissions:
     @patch("netbox_librenms_plugin.import_utils.LibreNMSAPI")
     def test_bulk_import_devices_extracts_user_from_job(self, mock_api_class, mock_require):
         """bulk_import_devices_shared extracts user from job if not provided."""
-        from netbox_librenms_plugin.import_utils import bulk_import_devices_shared
-
         job_user = MagicMock()
         job = MagicMock()
         job.job.user = job_user
@@ -685,8 +600,6 @@ class TestBulkImportPermissions:
     @patch("netbox_librenms_plugin.import_utils.require_permissions")
     def test_bulk_import_vms_checks_permissions(self, mock_require):
         """bulk_import_vms calls require_permissions."""
-        from netbox_librenms_plugin.import_utils import bulk_import_vms
-
         user = MagicMock()
         api = MagicMock()
         api.server_key = "default"
@@ -706,8 +619,6 @@ class TestBulkImportPermissions:
     @patch("netbox_librenms_plugin.import_utils.require_permissions")
     def test_bulk_import_vms_extracts_user_from_job(self, mock_require):
         """bulk_import_vms extracts user from job if not provided."""
-        from netbox_librenms_plugin.import_utils import bulk_import_vms
-
         job_user = MagicMock()
         job = MagicMock()
         job.job.user = job_user
@@ -732,11 +643,6 @@ class TestBulkImportPermissionDenied:
     @patch("netbox_librenms_plugin.import_utils.check_user_permissions")
     def test_bulk_import_devices_raises_on_missing_permissions(self, mock_check):
         """bulk_import_devices_shared raises PermissionDenied when permissions missing."""
-        import pytest
-        from django.core.exceptions import PermissionDenied
-
-        from netbox_librenms_plugin.import_utils import bulk_import_devices_shared
-
         mock_check.return_value = (False, ["dcim.add_device"])
 
         user = MagicMock()
@@ -751,11 +657,6 @@ class TestBulkImportPermissionDenied:
     @patch("netbox_librenms_plugin.import_utils.check_user_permissions")
     def test_bulk_import_vms_raises_on_missing_permissions(self, mock_check):
         """bulk_import_vms raises PermissionDenied when permissions missing."""
-        import pytest
-        from django.core.exceptions import PermissionDenied
-
-        from netbox_librenms_plugin.import_utils import bulk_import_vms
-
         mock_check.return_value = (False, ["virtualization.add_virtualmachine"])
 
         user = MagicMock()
@@ -774,8 +675,6 @@ class TestSafeRedirectUrl:
 
     def test_internal_referrer_is_accepted(self):
         """Internal referrer URL is returned when host matches."""
-        from netbox_librenms_plugin.views.mixins import _get_safe_redirect_url
-
         request = MagicMock()
         request.META = {"HTTP_REFERER": "http://testserver/some/page/"}
         request.get_host.return_value = "testserver"
@@ -787,8 +686,6 @@ class TestSafeRedirectUrl:
 
     def test_external_referrer_is_rejected(self):
         """External referrer URL is rejected, falls back to request.path."""
-        from netbox_librenms_plugin.views.mixins import _get_safe_redirect_url
-
         request = MagicMock()
         request.META = {"HTTP_REFERER": "http://evil.com/attack"}
         request.get_host.return_value = "testserver"
@@ -800,8 +697,6 @@ class TestSafeRedirectUrl:
 
     def test_no_referrer_falls_back_to_path(self):
         """Missing referrer falls back to request.path."""
-        from netbox_librenms_plugin.views.mixins import _get_safe_redirect_url
-
         request = MagicMock()
         request.META = {}
         request.path = "/current/page/"
@@ -811,8 +706,6 @@ class TestSafeRedirectUrl:
 
     def test_no_referrer_no_path_falls_back_to_slash(self):
         """Missing referrer and no path attribute falls back to '/'."""
-        from netbox_librenms_plugin.views.mixins import _get_safe_redirect_url
-
         request = MagicMock(spec=[])  # No attributes at all
         request.META = {}
 
@@ -821,8 +714,6 @@ class TestSafeRedirectUrl:
 
     def test_relative_referrer_is_accepted(self):
         """Relative referrer path is accepted (no host to mismatch)."""
-        from netbox_librenms_plugin.views.mixins import _get_safe_redirect_url
-
         request = MagicMock()
         request.META = {"HTTP_REFERER": "/original/page/"}
         request.get_host.return_value = "testserver"
@@ -834,8 +725,6 @@ class TestSafeRedirectUrl:
 
     def test_write_permission_denied_rejects_external_referrer(self):
         """Write permission denial with external referrer falls back to request.path."""
-        from netbox_librenms_plugin.views.mixins import LibreNMSPermissionMixin
-
         mixin = LibreNMSPermissionMixin()
         mixin.request = MagicMock()
         mixin.request.user.has_perm.return_value = False
@@ -853,8 +742,6 @@ class TestSafeRedirectUrl:
 
     def test_htmx_rejects_external_referrer(self):
         """HTMX request with external referrer uses fallback in HX-Redirect."""
-        from netbox_librenms_plugin.views.mixins import LibreNMSPermissionMixin
-
         mixin = LibreNMSPermissionMixin()
         mixin.request = MagicMock()
         mixin.request.user.has_perm.return_value = False
@@ -877,8 +764,6 @@ class TestBulkImportVCPermission:
     @patch("netbox_librenms_plugin.import_utils.LibreNMSAPI")
     def test_bulk_import_devices_checks_vc_permission(self, mock_api_class, mock_require):
         """bulk_import_devices_shared includes dcim.add_virtualchassis in required perms."""
-        from netbox_librenms_plugin.import_utils import bulk_import_devices_shared
-
         user = MagicMock()
         mock_api = MagicMock()
         mock_api_class.return_value = mock_api
@@ -900,54 +785,36 @@ class TestObjectTypeValidation:
 
     def test_sync_interfaces_device_type(self):
         """SyncInterfacesView returns correct perms for device type."""
-        from netbox_librenms_plugin.views.sync.interfaces import SyncInterfacesView
-
         view = SyncInterfacesView()
         perms = view.get_required_permissions_for_object_type("device")
         assert len(perms) == 2
 
     def test_sync_interfaces_vm_type(self):
         """SyncInterfacesView returns correct perms for virtualmachine type."""
-        from netbox_librenms_plugin.views.sync.interfaces import SyncInterfacesView
-
         view = SyncInterfacesView()
         perms = view.get_required_permissions_for_object_type("virtualmachine")
         assert len(perms) == 2
 
     def test_sync_interfaces_invalid_type_raises_404(self):
         """SyncInterfacesView raises Http404 for invalid object type."""
-        import pytest
-        from django.http import Http404
-
-        from netbox_librenms_plugin.views.sync.interfaces import SyncInterfacesView
-
         view = SyncInterfacesView()
         with pytest.raises(Http404):
             view.get_required_permissions_for_object_type("invalid")
 
     def test_delete_interfaces_device_type(self):
         """DeleteNetBoxInterfacesView returns correct perms for device type."""
-        from netbox_librenms_plugin.views.sync.interfaces import DeleteNetBoxInterfacesView
-
         view = DeleteNetBoxInterfacesView()
         perms = view.get_required_permissions_for_object_type("device")
         assert len(perms) == 1
 
     def test_delete_interfaces_vm_type(self):
         """DeleteNetBoxInterfacesView returns correct perms for virtualmachine type."""
-        from netbox_librenms_plugin.views.sync.interfaces import DeleteNetBoxInterfacesView
-
         view = DeleteNetBoxInterfacesView()
         perms = view.get_required_permissions_for_object_type("virtualmachine")
         assert len(perms) == 1
 
     def test_delete_interfaces_invalid_type_raises_404(self):
         """DeleteNetBoxInterfacesView raises Http404 for invalid object type."""
-        import pytest
-        from django.http import Http404
-
-        from netbox_librenms_plugin.views.sync.interfaces import DeleteNetBoxInterfacesView
-
         view = DeleteNetBoxInterfacesView()
         with pytest.raises(Http404):
             view.get_required_permissions_for_object_type("invalid")
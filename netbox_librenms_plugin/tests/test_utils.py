@@ -5,8 +5,25 @@ platform matching, and conversion helper functions.
 """
 
 import json
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
+import pytest
+
+from netbox_librenms_plugin.utils import (
+    convert_speed_to_kbps,
+    find_matching_platform,
+    find_matching_site,
+    format_mac_address,
+    get_interface_name_field,
+    get_librenms_sync_device,
+    get_table_paginate_count,
+    get_virtual_chassis_member,
+    match_librenms_hardware_to_device_type,
+)
+from netbox_librenms_plugin.views.imports.actions import SaveUserPrefView
+from netbox_librenms_plugin.views.mixins import LibreNMSPermissionMixin
+
 # =============================================================================
 # TestDeviceTypeMatching - 5 tests
 # =============================================================================
@@ -21,8 +38,6 @@ class TestDeviceTypeMatching:
         mock_dt = MagicMock(id=1, model="C9300-48P")
         mock_device_type.objects.get.return_value = mock_dt
 
-        from netbox_librenms_plugin.utils import match_librenms_hardware_to_device_type
-
         result = match_librenms_hardware_to_device_type("C9300-48P")
 
         assert result["matched"] is True
@@ -33,17 +48,19 @@ class TestDeviceTypeMatching:
     def test_match_device_type_exact_match_by_model(self, mock_device_type):
         """Exact model string should match when part_number fails."""
         mock_dt = MagicMock(id=1, model="WS-C3750X-48P")
-        # Part number lookup fails, model lookup succeeds
         mock_device_type.DoesNotExist = Exception
-        mock_device_type.objects.get.side_effect = [
-            mock_device_type.DoesNotExist,  # part_number lookup fails
-            mock_dt,  # model lookup succeeds
-        ]
 
-        from netbox_librenms_plugin.utils import match_librenms_hardware_to_device_type
+        def get_by_lookup(**lookup):
+            # Part number lookup fails, model lookup succeeds
+            if "part_number__iexact" in lookup:
+                raise mock_device_type.DoesNotExist
+            return mock_dt
+
+        mock_device_type.objects.get.side_effect = get_by_lookup
 
         result = match_librenms_hardware_to_device_type("WS-C3750X-48P")
 
+        assert mock_device_type.objects.get.call_count == 2
         assert result["matched"] is True
         assert result["device_type"] == mock_dt
         assert result["match_type"] == "exact"
@@ -54,8 +71,6 @@ class TestDeviceTypeMatching:
         mock_device_type.DoesNotExist = Exception
         mock_device_type.objects.get.side_effect = mock_device_type.DoesNotExist
 
-        from netbox_librenms_plugin.utils import match_librenms_hardware_to_device_type
-
         result = match_librenms_hardware_to_device_type("NonexistentHardware")
 
         assert result["matched"] is False
@@ -64,8 +79,6 @@ class TestDeviceTypeMatching:
 
     def test_match_device_type_empty_hardware(self):
         """Empty string returns None."""
-        from netbox_librenms_plugin.utils import match_librenms_hardware_to_device_type
-
         result = match_librenms_hardware_to_device_type("")
 
         assert result["matched"] is False
@@ -73,8 +86,6 @@ class TestDeviceTypeMatching:
 
     def test_match_device_type_dash_hardware(self):
         """Dash placeholder returns None."""
-        from netbox_librenms_plugin.utils import match_librenms_hardware_to_device_type
-
         result = match_librenms_hardware_to_device_type("-")
 
         assert result["matched"] is False
@@ -95,8 +106,6 @@ class TestSiteMatching:
         mock_site = MagicMock(id=1, name="DC1")
         mock_site_model.objects.get.return_value = mock_site
 
-        from netbox_librenms_plugin.utils import find_matching_site
-
         result = find_matching_site("DC1")
 
         assert result["found"] is True
@@ -110,8 +119,6 @@ class TestSiteMatching:
         mock_site_model.DoesNotExist = Exception
         mock_site_model.objects.get.side_effect = mock_site_model.DoesNotExist
 
-        from netbox_librenms_plugin.utils import find_matching_site
-
         result = find_matching_site("Unknown Location")
 
         assert result["found"] is False
@@ -120,8 +127,6 @@ class TestSiteMatching:
 
     def test_find_site_for_location_empty(self):
         """Empty location returns None."""
-        from netbox_librenms_plugin.utils import find_matching_site
-
         result = find_matching_site("")
 
         assert result["found"] is False
@@ -129,8 +134,6 @@ class TestSiteMatching:
 
     def test_find_site_for_location_dash(self):
         """Dash placeholder returns None."""
-        from netbox_librenms_plugin.utils import find_matching_site
-
         result = find_matching_site("-")
 
         assert result["found"] is False
@@ -151,8 +154,6 @@ class TestPlatformMatching:
         mock_platform = MagicMock(id=1, name="ios")
         mock_platform_model.objects.get.return_value = mock_platform
 
-        from netbox_librenms_plugin.utils import find_matching_platform
-
         result = find_matching_platform("ios")
 
         assert result["found"] is True
@@ -165,8 +166,6 @@ class TestPlatformMatching:
         mock_platform_model.DoesNotExist = Exception
         mock_platform_model.objects.get.side_effect = mock_platform_model.DoesNotExist
 
-        from netbox_librenms_plugin.utils import find_matching_platform
-
         result = find_matching_platform("unknown_os")
 
         assert result["found"] is False
@@ -174,8 +173,6 @@ class TestPlatformMatching:
 
     def test_find_platform_for_os_empty(self):
         """Empty OS returns None."""
-        from netbox_librenms_plugin.utils import find_matching_platform
-
         result = find_matching_platform("")
 
         assert result["found"] is False
@@ -183,8 +180,6 @@ class TestPlatformMatching:
 
     def test_find_platform_for_os_dash(self):
         """Dash placeholder returns None."""
-        from netbox_librenms_plugin.utils import find_matching_platform
-
         result = find_matching_platform("-")
 
         assert result["found"] is False
@@ -192,84 +187,40 @@ class TestPlatformMatching:
 
 
 # =============================================================================
-# TestConversionHelpers - 4 tests
+# TestConversionHelpers - 2 tests
 # =============================================================================
 
 
 class TestConversionHelpers:
     """Test data conversion helper functions."""
 
-    def test_convert_speed_to_kbps_basic(self):
-        """Convert bps to kbps."""
-        from netbox_librenms_plugin.utils import convert_speed_to_kbps
-
-        # 1 Gbps = 1,000,000,000 bps = 1,000,000 kbps
-        result = convert_speed_to_kbps(1000000000)
-        assert result == 1000000
-
-    def test_convert_speed_to_kbps_megabit(self):
-        """Convert megabit speed to kbps."""
-        from netbox_librenms_plugin.utils import convert_speed_to_kbps
-
-        # 100 Mbps = 100,000,000 bps = 100,000 kbps
-        result = convert_speed_to_kbps(100000000)
-        assert result == 100000
-
-    def test_convert_speed_to_kbps_zero(self):
-        """Zero handled correctly."""
-        from netbox_librenms_plugin.utils import convert_speed_to_kbps
-
-        result = convert_speed_to_kbps(0)
-        assert result == 0
-
-    def test_convert_speed_to_kbps_none(self):
-        """None returns None."""
-        from netbox_librenms_plugin.utils import convert_speed_to_kbps
-
-        result = convert_speed_to_kbps(None)
-        assert result is None
-
-    def test_format_mac_address_valid(self):
-        """Format valid MAC address."""
-        from netbox_librenms_plugin.utils import format_mac_address
-
-        result = format_mac_address("aabbccddeeff")
-        assert result == "AA:BB:CC:DD:EE:FF"
-
-    def test_format_mac_address_with_colons(self):
-        """Format MAC address that already has colons."""
-        from netbox_librenms_plugin.utils import format_mac_address
-
-        result = format_mac_address("aa:bb:cc:dd:ee:ff")
-        assert result == "AA:BB:CC:DD:EE:FF"
-
-    def test_format_mac_address_with_dashes(self):
-        """Format MAC address with dashes."""
-        from netbox_librenms_plugin.utils import format_mac_address
-
-        result = format_mac_address("aa-bb-cc-dd-ee-ff")
-        assert result == "AA:BB:CC:DD:EE:FF"
-
-    def test_format_mac_address_invalid(self):
-        """Returns error message for invalid MAC."""
-        from netbox_librenms_plugin.utils import format_mac_address
-
-        result = format_mac_address("invalid")
-        assert result == "Invalid MAC Address"
-
-    def test_format_mac_address_empty(self):
-        """Empty string returns empty string."""
-        from netbox_librenms_plugin.utils import format_mac_address
-
-        result = format_mac_address("")
-        assert result == ""
-
-    def test_format_mac_address_none(self):
-        """None returns empty string."""
-        from netbox_librenms_plugin.utils import format_mac_address
-
-        result = format_mac_address(None)
-        assert result == ""
+    @pytest.mark.parametrize(
+        "speed_bps, expected",
+        [
+            pytest.param(1_000_000_000, 1_000_000, id="gigabit"),
+            pytest.param(100_000_000, 100_000, id="megabit"),
+            pytest.param(0, 0, id="zero"),
+            pytest.param(None, None, id="none"),
+        ],
+    )
+    def test_convert_speed_to_kbps(self, speed_bps, expected):
+        """Convert a LibreNMS bps speed to kbps; None passes through."""
+        assert convert_speed_to_kbps(speed_bps) == expected
+
+    @pytest.mark.parametrize(
+        "mac, expected",
+        [
+            pytest.param("aabbccddeeff", "AA:BB:CC:DD:EE:FF", id="bare"),
+            pytest.param("aa:bb:cc:dd:ee:ff", "AA:BB:CC:DD:EE:FF", id="colons"),
+            pytest.param("aa-bb-cc-dd-ee-ff", "AA:BB:CC:DD:EE:FF", id="dashes"),
+            pytest.param("invalid", "Invalid MAC Address", id="invalid"),
+            pytest.param("", "", id="empty"),
+            pytest.param(None, "", id="none"),
+        ],
+    )
+    def test_format_mac_address(self, mac, expected):
+        """Normalise MAC addresses to upper-case colon form; invalid input returns an error string."""
+        assert format_mac_address(mac) == expected
 
 
 # =============================================================================
@@ -282,8 +233,6 @@ class TestVirtualChassisHelpers:
 
     def test_get_virtual_chassis_member_no_vc(self, mock_netbox_device):
         """Device without VC returns original device."""
-        from netbox_librenms_plugin.utils import get_virtual_chassis_member
-
         mock_netbox_device.virtual_chassis = None
 
         result = get_virtual_chassis_member(mock_netbox_device, "Ethernet1")
@@ -292,8 +241,6 @@ class TestVirtualChassisHelpers:
 
     def test_get_virtual_chassis_member_with_vc(self):
         """Device with VC returns correct member."""
-        from netbox_librenms_plugin.utils import get_virtual_chassis_member
-
         mock_device = MagicMock()
         mock_member = MagicMock(name="member-1")
         mock_device.virtual_chassis = MagicMock()
@@ -307,8 +254,6 @@ class TestVirtualChassisHelpers:
 
     def test_get_virtual_chassis_member_invalid_port(self):
         """Invalid port name returns original device."""
-        from netbox_librenms_plugin.utils import get_virtual_chassis_member
-
         mock_device = MagicMock()
         mock_device.virtual_chassis = MagicMock()
 
@@ -318,8 +263,6 @@ class TestVirtualChassisHelpers:
 
     def test_get_librenms_sync_device_no_vc(self, mock_netbox_device):
         """Device without VC returns itself."""
-        from netbox_librenms_plugin.utils import get_librenms_sync_device
-
         mock_netbox_device.virtual_chassis = None
 
         result = get_librenms_sync_device(mock_netbox_device)
@@ -328,8 +271,6 @@ class TestVirtualChassisHelpers:
 
     def test_get_librenms_sync_device_with_librenms_id(self):
         """VC member with librenms_id is returned."""
-        from netbox_librenms_plugin.utils import get_librenms_sync_device
-
         mock_device = MagicMock()
         mock_member_with_id = MagicMock()
         mock_member_with_id.cf = {"librenms_id": 123}
@@ -356,11 +297,8 @@ class TestPaginationHelpers:
     """Test pagination helper functions."""
 
     @patch("netbox_librenms_plugin.utils.get_config")
-    @patch("netbox_librenms_plugin.utils.netbox_get_paginate_count")
-    def test_get_table_paginate_count_from_request(self, mock_netbox_paginate, mock_config):
+    def test_get_table_paginate_count_from_request(self, mock_config):
         """Custom per_page from request is used."""
-        from netbox_librenms_plugin.utils import get_table_paginate_count
-
         mock_config.return_value.MAX_PAGE_SIZE = 1000
         mock_request = MagicMock()
         mock_request.GET = {"table1_per_page": "50"}
@@ -373,8 +311,6 @@ class TestPaginationHelpers:
     @patch("netbox_librenms_plugin.utils.netbox_get_paginate_count")
     def test_get_table_paginate_count_default(self, mock_netbox_paginate, mock_config):
         """Default pagination used when no override."""
-        from netbox_librenms_plugin.utils import get_table_paginate_count
-
         mock_netbox_paginate.return_value = 25
         mock_request = MagicMock()
         mock_request.GET = {}
@@ -393,27 +329,23 @@ class TestPaginationHelpers:
 class TestInterfaceNameField:
     """Test interface name field retrieval."""
 
-    @patch("netbox_librenms_plugin.utils.get_plugin_config")
-    def test_get_interface_name_field_from_get(self, mock_plugin_config):
-        """Override from GET request parameter."""
-        from netbox_librenms_plugin.utils import get_interface_name_field
+    def _make_request(self, get=None, post=None, user_pref=None):
+        """Create a request with GET/POST params; only user.config is a mock, for reading and saving the pref."""
+        config = MagicMock()
+        config.get.return_value = user_pref
+        return SimpleNamespace(GET=get or {}, POST=post or {}, user=SimpleNamespace(config=config))
 
-        mock_request = MagicMock()
-        mock_request.GET = {"interface_name_field": "ifDescr"}
-        mock_request.POST = {}
+    def test_get_interface_name_field_from_get(self):
+        """Override from GET request parameter."""
+        mock_request = self._make_request(get={"interface_name_field": "ifDescr"})
 
         result = get_interface_name_field(mock_request)
 
         assert result == "ifDescr"
 
-    @patch("netbox_librenms_plugin.utils.get_plugin_config")
-    def test_get_interface_name_field_from_post(self, mock_plugin_config):
+    def test_get_interface_name_field_from_post(self):
         """Override from POST request parameter."""
-        from netbox_librenms_plugin.utils import get_interface_name_field
-
-        mock_request = MagicMock()
-        mock_request.GET = {}
-        mock_request.POST = {"interface_name_field": "ifName"}
+        mock_request = self._make_request(post={"interface_name_field": "ifName"})
 
         result = get_interface_name_field(mock_request)
 
@@ -422,13 +354,8 @@ class TestInterfaceNameField:
     @patch("netbox_librenms_plugin.utils.get_plugin_config")
     def test_get_interface_name_field_from_config(self, mock_plugin_config):
         """Falls back to plugin config."""
-        from netbox_librenms_plugin.utils import get_interface_name_field
-
         mock_plugin_config.return_value = "ifAlias"
-        mock_request = MagicMock()
-        mock_request.GET = {}
-        mock_request.POST = {}
-        mock_request.user.config.get.return_value = None
+        mock_request = self._make_request()
 
         result = get_interface_name_field(mock_request)
 
@@ -438,26 +365,16 @@ class TestInterfaceNameField:
     @patch("netbox_librenms_plugin.utils.get_plugin_config")
     def test_get_interface_name_field_from_user_pref(self, mock_plugin_config):
         """Falls back to user preference before plugin config."""
-        from netbox_librenms_plugin.utils import get_interface_name_field
-
-        mock_request = MagicMock()
-        mock_request.GET = {}
-        mock_request.POST = {}
-        mock_request.user.config.get.return_value = "ifName"
+        mock_request = self._make_request(user_pref="ifName")
 
         result = get_interface_name_field(mock_request)
 
         assert result == "ifName"
         mock_plugin_config.assert_not_called()
 
-    @patch("netbox_librenms_plugin.utils.get_plugin_config")
-    def test_get_interface_name_field_persists_to_user_pref(self, mock_plugin_config):
+    def test_get_interface_name_field_persists_to_user_pref(self):
         """Explicit GET param should be persisted to user preferences."""
-        from netbox_librenms_plugin.utils import get_interface_name_field
-
-        mock_request = MagicMock()
-        mock_request.GET = {"interface_name_field": "ifDescr"}
-        mock_request.POST = {}
+        mock_request = self._make_request(get={"interface_name_field": "ifDescr"})
 
         result = get_interface_name_field(mock_request)
 
@@ -476,18 +393,12 @@ class TestSaveUserPrefView:
     """Test SaveUserPrefView endpoint for JS-driven preference persistence."""
 
     def _make_request(self, body, has_perm=True):
-        """Create a mock POST request with JSON body."""
-        request = MagicMock()
-        request.body = json.dumps(body).encode()
-        request.user.has_perm.return_value = has_perm
-        request.user.config = MagicMock()
-        request.method = "POST"
-        return request
+        """Create a POST request with JSON body; only user.config is a mock, for asserting saves."""
+        user = SimpleNamespace(config=MagicMock(), has_perm=lambda perm, obj=None: has_perm)
+        return SimpleNamespace(method="POST", body=json.dumps(body).encode(), user=user)
 
     def test_save_valid_boolean_pref(self):
         """Saving a valid boolean preference returns ok."""
-        from netbox_librenms_plugin.views.imports.actions import SaveUserPrefView
-
         view = SaveUserPrefView()
         request = self._make_request({"key": "use_sysname", "value": True})
         view.request = request
@@ -501,8 +412,6 @@ class TestSaveUserPrefView:
 
     def test_save_string_pref(self):
         """Saving interface_name_field string value works."""
-        from netbox_librenms_plugin.views.imports.actions import SaveUserPrefView
-
         view = SaveUserPrefView()
         request = self._make_request({"key": "interface_name_field", "value": "ifDescr"})
         view.request = request
@@ -516,8 +425,6 @@ class TestSaveUserPrefView:
 
     def test_reject_invalid_key(self):
         """Invalid preference key returns 400."""
-        from netbox_librenms_plugin.views.imports.actions import SaveUserPrefView
-
         view = SaveUserPrefView()
         request = self._make_request({"key": "malicious_key", "value": True})
         view.request = request
@@ -531,11 +438,8 @@ class TestSaveUserPrefView:
 
     def test_reject_invalid_json(self):
         """Invalid JSON body returns 400."""
-        from netbox_librenms_plugin.views.imports.actions import SaveUserPrefView
-
         view = SaveUserPrefView()
-        request = MagicMock()
-        request.body = b"not valid json"
+        request = SimpleNamespace(body=b"not valid json")
         view.request = request
 
         response = view.post(request)
@@ -546,8 +450,6 @@ class TestSaveUserPrefView:
 
     def test_save_false_value(self):
         """Saving False for a toggle works correctly."""
-        from netbox_librenms_plugin.views.imports.actions import SaveUserPrefView
-
         view = SaveUserPrefView()
         request = self._make_request({"key": "strip_domain", "value": False})
         view.request = request
@@ -561,7 +463,4 @@ class TestSaveUserPrefView:
 
     def test_uses_permission_mixin(self):
         """SaveUserPrefView inherits from LibreNMSPermissionMixin."""
-        from netbox_librenms_plugin.views.imports.actions import SaveUserPrefView
-        from netbox_librenms_plugin.views.mixins import LibreNMSPermissionMixin
-
         assert issubclass(SaveUserPrefView, LibreNMSPermissionMixin)
@@ -8,8 +8,14 @@ Tests cover:
 - Port VLAN data parsing
 """
 
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
+import pytest
+from requests.exceptions import HTTPError
+
+from netbox_librenms_plugin.utils import get_vlan_sync_css_class
+
 # Import the autouse fixture from helpers
 pytest_plugins = ["netbox_librenms_plugin.tests.test_librenms_api_helpers"]
 
@@ -99,38 +105,14 @@ MOCK_PORT_VLAN_DETAILS_ACCESS = {
 }
 
 
-def create_mock_device():
-    """Create a mock NetBox device."""
-    device = MagicMock()
-    device.pk = 123
-    device.name = "test-switch"
-    device._meta.model_name = "device"
-    device.site = MagicMock()
-    device.site.pk = 1
-    device.site.name = "Test Site"
-    return device
-
-
-def create_mock_interface(name, mode=None, untagged_vlan=None, tagged_vlans=None):
-    """Create a mock NetBox interface."""
-    interface = MagicMock()
-    interface.pk = hash(name)
-    interface.name = name
-    interface.mode = mode
-    interface.untagged_vlan = untagged_vlan
-    interface.tagged_vlans = MagicMock()
-    interface.tagged_vlans.all.return_value = tagged_vlans or []
-    return interface
+def create_mock_vlan(vid, name, group=None):
+    """Create a plain NetBox VLAN stand-in."""
+    return SimpleNamespace(pk=vid * 100, vid=vid, name=name, group=group)
 
 
-def create_mock_vlan(vid, name, group=None):
-    """Create a mock NetBox VLAN."""
-    vlan = MagicMock()
-    vlan.pk = vid * 100
-    vlan.vid = vid
-    vlan.name = name
-    vlan.group = group
-    return vlan
+def _ok_response(payload):
+    """Create a plain HTTP 200 response stand-in whose json() returns ``payload``."""
+    return SimpleNamespace(status_code=200, json=lambda: payload, raise_for_status=lambda: None)
 
 
 # ============================================
@@ -142,16 +124,11 @@ class TestVLANAPIClient:
     """Tests for LibreNMS VLAN API methods."""
 
     @patch("requests.get")
-    def test_get_device_vlans_success(self, mock_get, mock_librenms_config):
+    def test_get_device_vlans_success(self, mock_get, librenms_api):
         """Test successful VLAN fetch from /resources/vlans endpoint."""
-        mock_get.return_value.status_code = 200
-        mock_get.return_value.json.return_value = MOCK_DEVICE_VLANS
-
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
+        mock_get.return_value = _ok_response(MOCK_DEVICE_VLANS)
 
-        api = LibreNMSAPI(server_key="default")
-
-        success, data = api.get_device_vlans(123)
+        success, data = librenms_api.get_device_vlans(123)
 
         assert success is True
         assert len(data) == 3
@@ -161,7 +138,7 @@ class TestVLANAPIClient:
         assert data[1]["vlan_id"] == 102
 
     @patch("requests.get")
-    def test_get_device_vlans_filters_by_device_id(self, mock_get, mock_librenms_config):
+    def test_get_device_vlans_filters_by_device_id(self, mock_get, librenms_api):
         """Test that VLANs are filtered by device_id."""
         # Response includes VLANs from multiple devices
         mock_response_data = {
@@ -172,64 +149,44 @@ class TestVLANAPIClient:
                 {"vlan_id": 102, "device_id": 123, "vlan_vlan": 50, "vlan_name": "DATA"},
             ],
         }
-        mock_get.return_value.status_code = 200
-        mock_get.return_value.json.return_value = mock_response_data
-
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
+        mock_get.return_value = _ok_response(mock_response_data)
 
-        api = LibreNMSAPI(server_key="default")
-        success, data = api.get_device_vlans(123)
+        success, data = librenms_api.get_device_vlans(123)
 
         assert success is True
         assert len(data) == 2  # Only device 123's VLANs
         assert all(str(v["device_id"]) == "123" for v in data)
 
     @patch("requests.get")
-    def test_get_device_vlans_error(self, mock_get, mock_librenms_config):
+    def test_get_device_vlans_error(self, mock_get, librenms_api):
         """Test VLAN fetch with error."""
-        from requests.exceptions import HTTPError
-
         mock_response = MagicMock()
         mock_response.status_code = 404
         mock_response.raise_for_status.side_effect = HTTPError(response=mock_response)
         mock_get.return_value = mock_response
 
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
-
-        api = LibreNMSAPI(server_key="default")
-
-        success, data = api.get_device_vlans(999)
+        success, data = librenms_api.get_device_vlans(999)
 
         assert success is False
         assert "not found" in data.lower()
 
     @patch("requests.get")
-    def test_get_port_vlan_details_trunk(self, mock_get, mock_librenms_config):
+    def test_get_port_vlan_details_trunk(self, mock_get, librenms_api):
         """Test fetching trunk port VLAN details."""
-        mock_get.return_value.status_code = 200
-        mock_get.return_value.json.return_value = MOCK_PORT_VLAN_DETAILS_TRUNK
-
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
+        mock_get.return_value = _ok_response(MOCK_PORT_VLAN_DETAILS_TRUNK)
 
-        api = LibreNMSAPI(server_key="default")
-
-        success, data = api.get_port_vlan_details(227011)
+        success, data = librenms_api.get_port_vlan_details(227011)
 
         assert success is True
         assert data["ifTrunk"] == "dot1Q"
         assert len(data["vlans"]) == 2
 
     @patch("requests.get")
-    def test_get_port_vlan_details_not_found(self, mock_get, mock_librenms_config):
+    def test_get_port_vlan_details_not_found(self, mock_get, librenms_api):
         """Test fetching port details when port not found."""
-        mock_get.return_value.status_code = 200
-        mock_get.return_value.json.return_value = {"status": "ok", "port": []}
-
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
+        mock_get.return_value = _ok_response({"status": "ok", "port": []})
 
-        api = LibreNMSAPI(server_key="default")
-
-        success, data = api.get_port_vlan_details(999999)
+        success, data = librenms_api.get_port_vlan_details(999999)
 
         assert success is False
         assert "not found" in data.lower()
@@ -243,54 +200,52 @@ class TestVLANAPIClient:
 class TestVLANModeDetection:
     """Tests for 802.1Q mode detection logic."""
 
-    def test_parse_port_vlan_data_access_port(self, mock_librenms_config):
-        """Access port: ifVlan set, ifTrunk null."""
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
-
-        api = LibreNMSAPI(server_key="default")
-
-        port_data = {"port_id": 1, "ifName": "Gi1/0/1", "ifVlan": "50", "ifTrunk": None}
-        result = api.parse_port_vlan_data(port_data)
-
-        assert result["mode"] == "access"
-        assert result["untagged_vlan"] == 50
-        assert result["tagged_vlans"] == []
-
-    def test_parse_port_vlan_data_trunk_port(self, mock_librenms_config):
-        """Trunk port: ifTrunk = dot1Q."""
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
-
-        api = LibreNMSAPI(server_key="default")
-
-        port_data = {
-            "port_id": 2,
-            "ifName": "Te1/1/1",
-            "ifVlan": "90",
-            "ifTrunk": "dot1Q",
-            "vlans": [
-                {"vlan": 90, "untagged": 1},
-                {"vlan": 50, "untagged": 0},
-                {"vlan": 60, "untagged": 0},
-            ],
-        }
-        result = api.parse_port_vlan_data(port_data)
-
-        assert result["mode"] == "tagged"
-        assert result["untagged_vlan"] == 90
-        assert result["tagged_vlans"] == [50, 60]
-
-    def test_parse_port_vlan_data_no_vlan(self, mock_librenms_config):
-        """No VLAN: ifVlan empty."""
-        from netbox_librenms_plugin.librenms_api import LibreNMSAPI
-
-        api = LibreNMSAPI(server_key="default")
-
-        port_data = {"port_id": 3, "ifName": "Gi1/0/48", "ifVlan": "", "ifTrunk": None}
-        result = api.parse_port_vlan_data(port_data)
-
-        assert result["mode"] is None
-        assert result["untagged_vlan"] is None
-        assert result["tagged_vlans"] == []
+    @pytest.mark.parametrize(
+        "port_data, expected_mode, expected_untagged, expected_tagged",
+        [
+            # Access port: ifVlan set, ifTrunk null
+            pytest.param(
+                {"port_id": 1, "ifName": "Gi1/0/1", "ifVlan": "50", "ifTrunk": None},
+                "access",
+                50,
+                [],
+                id="access_port",
+            ),
+            # Trunk port: ifTrunk = dot1Q
+            pytest.param(
+                {
+                    "port_id": 2,
+                    "ifName": "Te1/1/1",
+                    "ifVlan": "90",
+                    "ifTrunk": "dot1Q",
+                    "vlans": [
+                        {"vlan": 90, "untagged": 1},
+                        {"vlan": 50, "untagged": 0},
+                        {"vlan": 60, "untagged": 0},
+                    ],
+                },
+                "tagged",
+                90,
+                [50, 60],
+                id="trunk_port",
+            ),
+            # No VLAN: ifVlan empty
+            pytest.param(
+                {"port_id": 3, "ifName": "Gi1/0/48", "ifVlan": "", "ifTrunk": None},
+                None,
+                None,
+                [],
+                id="no_vlan",
+            ),
+        ],
+    )
+    def test_parse_port_vlan_data(self, librenms_api, port_data, expected_mode, expected_untagged, expected_tagged):
+        """Mode and VLANs are derived from ifVlan, ifTrunk and the per-VLAN untagged flags."""
+        result = librenms_api.parse_port_vlan_data(port_data)
+
+        assert result["mode"] == expected_mode
+        assert result["untagged_vlan"] == expected_untagged
+        assert result["tagged_vlans"] == expected_tagged
 
 
 # ============================================
@@ -387,39 +342,24 @@ class TestPortVLANParsing:
 class TestSyncVLANActions:
     """Tests for VLAN sync action logic."""
 
-    def test_mode_mapping_access(self):
-        """Test mapping LibreNMS access mode to NetBox."""
-        librenms_mode = "access"
-        expected_netbox_mode = "access"
-
-        mode_map = {"access": "access", "tagged": "tagged"}
-        result = mode_map.get(librenms_mode)
-
-        assert result == expected_netbox_mode
-
-    def test_mode_mapping_tagged(self):
-        """Test mapping LibreNMS tagged mode to NetBox."""
-        librenms_mode = "tagged"
-        expected_netbox_mode = "tagged"
-
+    @pytest.mark.parametrize("librenms_mode", ["access", "tagged"])
+    def test_mode_mapping(self, librenms_mode):
+        """Test mapping LibreNMS 802.1Q mode to NetBox."""
         mode_map = {"access": "access", "tagged": "tagged"}
-        result = mode_map.get(librenms_mode)
-
-        assert result == expected_netbox_mode
-
-    def test_vlan_state_mapping_active(self):
-        """Test mapping active VLAN state."""
-        vlan_state = 1
-
-        status = "active" if vlan_state == 1 else "reserved"
-        assert status == "active"
-
-    def test_vlan_state_mapping_inactive(self):
-        """Test mapping inactive VLAN state."""
-        vlan_state = 0
 
+        assert mode_map.get(librenms_mode) == librenms_mode
+
+    @pytest.mark.parametrize(
+        "vlan_state, expected_status",
+        [
+            pytest.param(1, "active", id="active"),
+            pytest.param(0, "reserved", id="inactive"),
+        ],
+    )
+    def test_vlan_state_mapping(self, vlan_state, expected_status):
+        """Test mapping LibreNMS VLAN state to NetBox status."""
         status = "active" if vlan_state == 1 else "reserved"
-        assert status == "reserved"
+        assert status == expected_status
 
 
 # ============================================
@@ -430,32 +370,22 @@ class TestSyncVLANActions:
 class TestGetVlanSyncCssClass:
     """Tests for the shared get_vlan_sync_css_class utility."""
 
-    def test_not_in_netbox(self):
-        """VLAN not in NetBox should return text-danger."""
-        from netbox_librenms_plugin.utils import get_vlan_sync_css_class
-
-        assert get_vlan_sync_css_class(exists_in_netbox=False) == "text-danger"
-
-    def test_not_in_netbox_name_match_irrelevant(self):
-        """Name match flag should be irrelevant when VLAN doesn't exist."""
-        from netbox_librenms_plugin.utils import get_vlan_sync_css_class
-
-        assert get_vlan_sync_css_class(exists_in_netbox=False, name_matches=True) == "text-danger"
-
-    def test_exists_name_matches(self):
-        """VLAN exists with matching name should return text-success."""
-        from netbox_librenms_plugin.utils import get_vlan_sync_css_class
-
-        assert get_vlan_sync_css_class(exists_in_netbox=True, name_matches=True) == "text-success"
-
-    def test_exists_name_mismatch(self):
-        """VLAN exists but name differs should return text-warning."""
-        from netbox_librenms_plugin.utils import get_vlan_sync_css_class
-
-        assert get_vlan_sync_css_class(exists_in_netbox=True, name_matches=False) == "text-warning"
-
-    def test_default_name_matches_is_true(self):
-        """Default name_matches should be True (success when exists)."""
-        from netbox_librenms_plugin.utils import get_vlan_sync_css_class
-
-        assert get_vlan_sync_css_class(exists_in_netbox=True) == "text-success"
+    @pytest.mark.parametrize(
+        "kwargs, expected",
+        [
+            # Name match flag is irrelevant when the VLAN doesn't exist
+            pytest.param({"exists_in_netbox": False}, "text-danger", id="not_in_netbox"),
+            pytest.param(
+                {"exists_in_netbox": False, "name_matches": True},
+                "text-danger",
+                id="not_in_netbox_name_match_irrelevant",
+            ),
+            pytest.param({"exists_in_netbox": True, "name_matches": True}, "text-success", id="exists_name_matches"),
+            pytest.param({"exists_in_netbox": True, "name_matches": False}, "text-warning", id="exists_name_mismatch"),
+            # name_matches defaults to True
+            pytest.param({"exists_in_netbox": True}, "text-success", id="default_name_matches_is_true"),
+        ],
+    )
+    def test_css_class(self, kwargs, expected):
+        """VLAN existence and name match map to danger, warning or success."""
+        assert get_vlan_sync_css_class(**kwargs) == expected
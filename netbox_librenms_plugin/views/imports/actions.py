@@ -6,6 +6,7 @@ import logging
 from django.contrib import messages
 from django.core.cache import cache
 from django.core.exceptions import PermissionDenied, ValidationError
+from django.db import transaction
 from django.http import HttpResponse, JsonResponse
 from django.shortcuts import redirect, render
 from django.utils.html import escape
@@ -13,6 +14,7 @@ from django.views import View
 
 from netbox_librenms_plugin.import_utils import (
     _determine_device_name,
+    _meaningful_serial,
     bulk_import_devices,
     bulk_import_vms,
     fetch_device_with_cache,
@@ -38,9 +40,24 @@ logger = logging.getLogger(__name__)
 # Actions that require the force checkbox when a device-type mismatch is detected.
 _FORCE_REQUIRED_ACTIONS = frozenset({"link", "update", "update_serial", "update_type"})
 
+# Actions that link an existing NetBox device to LibreNMS, mapped to the Device fields each one may change.
+_LINK_ACTION_FIELDS = {
+    "link": ("custom_field_data", "name"),
+    "update": ("custom_field_data", "serial", "name"),
+    "update_serial": ("custom_field_data", "serial"),
+}
+_LINK_ACTIONS = frozenset(_LINK_ACTION_FIELDS)
 
-def _save_device(device) -> HttpResponse | None:
-    """Call full_clean() then save(). Return an HttpResponse on failure, None on success."""
+
+def _save_device(device, update_fields=None) -> HttpResponse | None:
+    """
+    Call full_clean() then save(). Return an HttpResponse on failure, None on success.
+
+    When update_fields is given, only those columns (plus last_updated) are written;
+    save signals, and with them change logging, still fire. A rename also writes the
+    natural-ordering ``_name`` column on NetBox releases whose Device model has one,
+    since that column is only recomputed when it is saved.
+    """
     from django.db import IntegrityError
 
     try:
@@ -48,12 +65,89 @@ def _save_device(device) -> HttpResponse | None:
     except ValidationError as exc:
         return HttpResponse(f"Validation error: {escape(str(exc))}", status=400)
     try:
-        device.save()
+        if update_fields:
+            update_fields = [*update_fields, "last_updated"]
+            if "name" in update_fields and any(field.name == "_name" for field in device._meta.concrete_fields):
+                update_fields.append("_name")
+            device.save(update_fields=update_fields)
+        else:
+            device.save()
     except IntegrityError as exc:
         return HttpResponse(f"Integrity error: {escape(str(exc))}", status=409)
     return None
 
 
+def _apply_link_action(
+    action: str, existing_device, libre_device: dict, validation: dict, request, librenms_device_type=None
+) -> HttpResponse | None:
+    """
+    Apply a link/update/update_serial conflict resolution to a device in memory.
+
+    The caller is responsible for saving the device.
+
+    Returns:
+        HttpResponse on a serial conflict, None on success
+    """
+    from dcim.models import Device
+
+    existing_device.custom_field_data["librenms_id"] = int(libre_device.get("device_id"))
+
+    if action in {"update", "update_serial"}:
+        incoming_serial = _meaningful_serial(libre_device.get("serial"))
+        if incoming_serial:
+            conflict_device = Device.objects.filter(serial=incoming_serial).exclude(pk=existing_device.pk).first()
+            if conflict_device:
+                return HttpResponse(
+                    f"Serial conflict: '{escape(incoming_serial)}' is already assigned to device "
+                    f"'{escape(conflict_device.name)}' (ID: {conflict_device.pk})",
+                    status=409,
+                )
+            existing_device.serial = incoming_serial
+
+    if action in {"link", "update"}:
+        # Take the name from LibreNMS data
+        existing_device.name = validation.get("resolved_name") or _determine_device_name(
+            libre_device,
+            use_sysname=request.POST.get("use-sysname-toggle") == "on",
+            strip_domain=request.POST.get("strip-domain-toggle") == "on",
+        )
+
+    if librenms_device_type:
+        existing_device.device_type = librenms_device_type
+    return None
+
+
+# Relations read by Device.clean(), change logging and the re-rendered row
+# when a conflict action saves an existing device.
+_CONFLICT_DEVICE_RELATED = ("device_type__manufacturer", "platform", "role", "site", "tenant")
+
+
+def _lock_device_for_update(device) -> None:
+    """
+    Row-lock ``device`` for the current transaction and reload its fields.
+
+    Uses FOR NO KEY UPDATE so rows referencing the device through foreign keys
+    (interfaces, IP assignments, ...) are not blocked while the lock is held.
+    Locking and reloading share one query, and the related objects in
+    _CONFLICT_DEVICE_RELATED stay cached on the device.
+    """
+    from dcim.models import Device
+
+    device.refresh_from_db(
+        from_queryset=Device.objects.select_for_update(of=("self",), no_key=True).select_related(
+            *_CONFLICT_DEVICE_RELATED
+        )
+    )
+
+
+def _link_action_update_fields(action: str, librenms_device_type=None) -> list[str]:
+    """Return the Device fields written by a link/update/update_serial action."""
+    fields = list(_LINK_ACTION_FIELDS[action])
+    if librenms_device_type:
+        fields.append("device_type")
+    return fields
+
+
 def _resolve_naming_preferences(request) -> tuple[bool, bool]:
     """Resolve use_sysname/strip_domain: POST/GET data → user pref → plugin settings."""
     from netbox_librenms_plugin.models import LibreNMSSettings
@@ -177,6 +271,7 @@ class DeviceImportHelperMixin:
             include_vc_detection=enable_vc,
             use_sysname=use_sysname,
             strip_domain=strip_domain,
+            cache_result=True,
         )
         validation["import_as_vm"] = is_vm
 
@@ -788,12 +883,13 @@ class DeviceValidationDetailsView(LibreNMSPermissionMixin, LibreNMSAPIMixin, Dev
     @staticmethod
     def _build_sync_info(libre_device, existing_device):
         """Build sync comparison data between LibreNMS device and existing NetBox device."""
-        librenms_serial = libre_device.get("serial") or "-"
+        incoming_serial = _meaningful_serial(libre_device.get("serial"))
+        librenms_serial = incoming_serial or "-"
         librenms_os = libre_device.get("os") or "-"
         librenms_hardware = libre_device.get("hardware") or "-"
 
         # Serial comparison
-        serial_synced = existing_device.serial == librenms_serial or librenms_serial == "-"
+        serial_synced = incoming_serial is None or existing_device.serial == incoming_serial
 
         # Platform comparison
         platform_info = {
@@ -888,29 +984,16 @@ class DeviceConflictActionView(
 ):
     """HTMX view to resolve device conflicts (link, update, update serial)."""
 
-    def post(self, request, device_id):
-        """Resolve a device conflict by linking, updating, or syncing serial."""
-        if error := self.require_write_permission():
-            return error
+    def _prepare_conflict_action(self, request, device_id, action: str, existing_device):
+        """
+        Re-validate a LibreNMS device and check ``action`` may be applied to ``existing_device``.
 
+        Returns:
+            tuple: (libre_device, validation, librenms_device_type) when the action may
+                proceed, otherwise an HttpResponse describing why not
+        """
         from dcim.models import Device
 
-        action = request.POST.get("action")
-        existing_device_id = request.POST.get("existing_device_id")
-
-        if not action or not existing_device_id:
-            return HttpResponse("Missing action or existing_device_id", status=400)
-
-        try:
-            existing_device = Device.objects.get(pk=int(existing_device_id))
-        except (Device.DoesNotExist, ValueError):
-            return HttpResponse("Existing device not found", status=404)
-
-        # Object-level change permission for the specific device being mutated.
-        self.required_object_permissions = {"POST": [("change", Device)]}
-        if error := self.require_object_permissions("POST"):
-            return error
-
         libre_device, validation, selections = self.get_validated_device_with_selections(device_id, request)
         if not libre_device:
             return HttpResponse("LibreNMS device not found", status=404)
@@ -940,7 +1023,7 @@ class DeviceConflictActionView(
         librenms_id = libre_device.get("device_id")
 
         # Check for LibreNMS ID collision before any linking action
-        if action in {"link", "update", "update_serial"}:
+        if action in _LINK_ACTIONS:
             id_conflict = (
                 Device.objects.filter(custom_field_data__librenms_id=int(librenms_id))
                 .exclude(pk=existing_device.pk)
@@ -953,164 +1036,146 @@ class DeviceConflictActionView(
                     status=409,
                 )
 
-        if action == "link":
-            # Link to LibreNMS and update name from LibreNMS data
-            resolved_name = validation.get("resolved_name")
-            hostname = (
-                resolved_name
-                if resolved_name
-                else _determine_device_name(
-                    libre_device,
-                    use_sysname=request.POST.get("use-sysname-toggle") == "on",
-                    strip_domain=request.POST.get("strip-domain-toggle") == "on",
-                )
-            )
-            existing_device.custom_field_data["librenms_id"] = int(librenms_id)
-            existing_device.name = hostname
-            if librenms_device_type:
-                existing_device.device_type = librenms_device_type
-            if err := _save_device(existing_device):
-                return err
-            logger.info(f"Linked device '{existing_device.name}' to LibreNMS ID {librenms_id}")
-
-        elif action == "update":
-            # Update hostname, serial, and link to LibreNMS
-            resolved_name = validation.get("resolved_name")
-            incoming_serial = libre_device.get("serial") or ""
-            hostname = (
-                resolved_name
-                if resolved_name
-                else _determine_device_name(
-                    libre_device,
-                    use_sysname=request.POST.get("use-sysname-toggle") == "on",
-                    strip_domain=request.POST.get("strip-domain-toggle") == "on",
-                )
-            )
-            existing_device.custom_field_data["librenms_id"] = int(librenms_id)
-            if incoming_serial and incoming_serial != "-":
-                conflict_device = Device.objects.filter(serial=incoming_serial).exclude(pk=existing_device.pk).first()
-                if conflict_device:
-                    return HttpResponse(
-                        f"Serial conflict: '{escape(incoming_serial)}' is already assigned to device "
-                        f"'{escape(conflict_device.name)}' (ID: {conflict_device.pk})",
-                        status=409,
-                    )
-                existing_device.serial = incoming_serial
-            existing_device.name = hostname
-            if librenms_device_type:
-                existing_device.device_type = librenms_device_type
-            if err := _save_device(existing_device):
-                return err
-            logger.info(
-                f"Updated device '{existing_device.name}': serial={incoming_serial}, "
-                f"linked to LibreNMS ID {librenms_id}"
-            )
+        return libre_device, validation, librenms_device_type
 
-        elif action == "update_serial":
-            # Update only the serial and link to LibreNMS
-            incoming_serial = libre_device.get("serial") or ""
-            existing_device.custom_field_data["librenms_id"] = int(librenms_id)
-            if incoming_serial and incoming_serial != "-":
-                conflict_device = Device.objects.filter(serial=incoming_serial).exclude(pk=existing_device.pk).first()
-                if conflict_device:
-                    return HttpResponse(
-                        f"Serial conflict: '{escape(incoming_serial)}' is already assigned to device "
-                        f"'{escape(conflict_device.name)}' (ID: {conflict_device.pk})",
-                        status=409,
-                    )
-                existing_device.serial = incoming_serial
-            if librenms_device_type:
-                existing_device.device_type = librenms_device_type
-            if err := _save_device(existing_device):
-                return err
-            logger.info(
-                f"Updated serial on device '{existing_device.name}' to {incoming_serial}, "
-                f"linked to LibreNMS ID {librenms_id}"
-            )
+    def post(self, request, device_id):
+        """Resolve a device conflict by linking, updating, or syncing serial."""
+        if error := self.require_write_permission():
+            return error
 
-        elif action == "sync_name":
-            # Sync device name from LibreNMS (e.g., IP → sysName)
-            resolved_name = validation.get("resolved_name")
-            hostname = (
-                resolved_name
-                if resolved_name
-                else _determine_device_name(
-                    libre_device,
-                    use_sysname=request.POST.get("use-sysname-toggle") == "on",
-                    strip_domain=request.POST.get("strip-domain-toggle") == "on",
-                )
-            )
-            existing_device.name = hostname
-            if err := _save_device(existing_device):
-                return err
-            logger.info(f"Synced name on device '{existing_device.name}' from LibreNMS")
-
-        elif action == "update_type":
-            # Update device type from LibreNMS (requires force for mismatch)
-            if librenms_device_type:
-                existing_device.device_type = librenms_device_type
-                if err := _save_device(existing_device):
+        from dcim.models import Device
+
+        action = request.POST.get("action")
+        existing_device_id = request.POST.get("existing_device_id")
+
+        if not action or not existing_device_id:
+            return HttpResponse("Missing action or existing_device_id", status=400)
+
+        try:
+            existing_device = Device.objects.select_related(*_CONFLICT_DEVICE_RELATED).get(pk=int(existing_device_id))
+        except (Device.DoesNotExist, ValueError):
+            return HttpResponse("Existing device not found", status=404)
+
+        # Object-level change permission for the specific device being mutated.
+        self.required_object_permissions = {"POST": [("change", Device)]}
+        if error := self.require_object_permissions("POST"):
+            return error
+
+        prepared = self._prepare_conflict_action(request, device_id, action, existing_device)
+        if isinstance(prepared, HttpResponse):
+            return prepared
+        libre_device, validation, librenms_device_type = prepared
+        librenms_id = libre_device.get("device_id")
+
+        # Lock only around mutate + save; validation above may call the LibreNMS API
+        with transaction.atomic():
+            _lock_device_for_update(existing_device)
+            if action in _LINK_ACTIONS:
+                if err := _apply_link_action(
+                    action, existing_device, libre_device, validation, request, librenms_device_type
+                ):
                     return err
-                logger.info(f"Updated device type on '{existing_device.name}' to {librenms_device_type}")
-            else:
-                return HttpResponse("No LibreNMS device type available to update", status=400)
-
-        elif action == "sync_serial":
-            # Sync serial number from LibreNMS
-            incoming_serial = libre_device.get("serial") or ""
-            if incoming_serial and incoming_serial != "-":
-                # Check for serial ownership conflict
-                conflict_device = Device.objects.filter(serial=incoming_serial).exclude(pk=existing_device.pk).first()
-                if conflict_device:
-                    logger.warning(
-                        f"Serial sync blocked: '{incoming_serial}' already assigned to "
-                        f"'{conflict_device.name}' (pk={conflict_device.pk})"
+                if err := _save_device(existing_device, _link_action_update_fields(action, librenms_device_type)):
+                    return err
+                incoming_serial = _meaningful_serial(libre_device.get("serial"))
+                if action == "link":
+                    logger.info(f"Linked device '{existing_device.name}' to LibreNMS ID {librenms_id}")
+                elif action == "update":
+                    logger.info(
+                        f"Updated device '{existing_device.name}': serial={incoming_serial}, "
+                        f"linked to LibreNMS ID {librenms_id}"
                     )
-                    return HttpResponse(
-                        f"Serial conflict: '{escape(incoming_serial)}' is already assigned to device "
-                        f"'{escape(conflict_device.name)}' (ID: {conflict_device.pk})",
-                        status=409,
+                else:
+                    logger.info(
+                        f"Updated serial on device '{existing_device.name}' to {incoming_serial}, "
+                        f"linked to LibreNMS ID {librenms_id}"
                     )
-                existing_device.serial = incoming_serial
-                if err := _save_device(existing_device):
-                    return err
-                logger.info(f"Synced serial on '{existing_device.name}' to {incoming_serial}")
-            else:
-                return HttpResponse("No valid serial from LibreNMS", status=400)
 
-        elif action == "sync_platform":
-            # Sync platform from LibreNMS OS
-            from netbox_librenms_plugin.utils import find_matching_platform
+            elif action == "sync_name":
+                # Sync device name from LibreNMS (e.g., IP → sysName)
+                resolved_name = validation.get("resolved_name")
+                hostname = (
+                    resolved_name
+                    if resolved_name
+                    else _determine_device_name(
+                        libre_device,
+                        use_sysname=request.POST.get("use-sysname-toggle") == "on",
+                        strip_domain=request.POST.get("strip-domain-toggle") == "on",
+                    )
+                )
+                existing_device.name = hostname
+                if err := _save_device(existing_device, ["name"]):
+                    return err
+                logger.info(f"Synced name on device '{existing_device.name}' from LibreNMS")
 
-            librenms_os = libre_device.get("os") or ""
-            if librenms_os and librenms_os != "-":
-                match_result = find_matching_platform(librenms_os)
-                if match_result["found"]:
-                    existing_device.platform = match_result["platform"]
-                    if err := _save_device(existing_device):
+            elif action == "update_type":
+                # Update device type from LibreNMS (requires force for mismatch)
+                if librenms_device_type:
+                    existing_device.device_type = librenms_device_type
+                    if err := _save_device(existing_device, ["device_type"]):
                         return err
-                    logger.info(f"Synced platform on '{existing_device.name}' to {match_result['platform']}")
+                    logger.info(f"Updated device type on '{existing_device.name}' to {librenms_device_type}")
                 else:
-                    return HttpResponse(f"Platform '{escape(librenms_os)}' not found in NetBox", status=400)
-            else:
-                return HttpResponse("No OS info from LibreNMS", status=400)
+                    return HttpResponse("No LibreNMS device type available to update", status=400)
+
+            elif action == "sync_serial":
+                # Sync serial number from LibreNMS
+                incoming_serial = _meaningful_serial(libre_device.get("serial"))
+                if incoming_serial:
+                    # Check for serial ownership conflict
+                    conflict_device = (
+                        Device.objects.filter(serial=incoming_serial).exclude(pk=existing_device.pk).first()
+                    )
+                    if conflict_device:
+                        logger.warning(
+                            f"Serial sync blocked: '{incoming_serial}' already assigned to "
+                            f"'{conflict_device.name}' (pk={conflict_device.pk})"
+                        )
+                        return HttpResponse(
+                            f"Serial conflict: '{escape(incoming_serial)}' is already assigned to device "
+                            f"'{escape(conflict_device.name)}' (ID: {conflict_device.pk})",
+                            status=409,
+                        )
+                    existing_device.serial = incoming_serial
+                    if err := _save_device(existing_device, ["serial"]):
+                        return err
+                    logger.info(f"Synced serial on '{existing_device.name}' to {incoming_serial}")
+                else:
+                    return HttpResponse("No valid serial from LibreNMS", status=400)
+
+            elif action == "sync_platform":
+                # Sync platform from LibreNMS OS
+                from netbox_librenms_plugin.utils import find_matching_platform
+
+                librenms_os = libre_device.get("os") or ""
+                if librenms_os and librenms_os != "-":
+                    match_result = find_matching_platform(librenms_os)
+                    if match_result["found"]:
+                        existing_device.platform = match_result["platform"]
+                        if err := _save_device(existing_device, ["platform"]):
+                            return err
+                        logger.info(f"Synced platform on '{existing_device.name}' to {match_result['platform']}")
+                    else:
+                        return HttpResponse(f"Platform '{escape(librenms_os)}' not found in NetBox", status=400)
+                else:
+                    return HttpResponse("No OS info from LibreNMS", status=400)
 
-        elif action == "sync_device_type":
-            # Sync device type from LibreNMS hardware (non-mismatch case)
-            from netbox_librenms_plugin.utils import match_librenms_hardware_to_device_type
+            elif action == "sync_device_type":
+                # Sync device type from LibreNMS hardware (non-mismatch case)
+                from netbox_librenms_plugin.utils import match_librenms_hardware_to_device_type
 
-            hardware = libre_device.get("hardware") or ""
-            hw_match = match_librenms_hardware_to_device_type(hardware)
-            if hw_match.get("matched"):
-                existing_device.device_type = hw_match["device_type"]
-                if err := _save_device(existing_device):
-                    return err
-                logger.info(f"Synced device type on '{existing_device.name}' to {hw_match['device_type']}")
-            else:
-                return HttpResponse(f"No matching device type for '{escape(hardware)}'", status=400)
+                hardware = libre_device.get("hardware") or ""
+                hw_match = match_librenms_hardware_to_device_type(hardware)
+                if hw_match.get("matched"):
+                    existing_device.device_type = hw_match["device_type"]
+                    if err := _save_device(existing_device, ["device_type"]):
+                        return err
+                    logger.info(f"Synced device type on '{existing_device.name}' to {hw_match['device_type']}")
+                else:
+                    return HttpResponse(f"No matching device type for '{escape(hardware)}'", status=400)
 
-        else:
-            return HttpResponse(f"Unknown action: {escape(action)}", status=400)
+            else:
+                return HttpResponse(f"Unknown action: {escape(action)}", status=400)
 
         # Clear cached validation so re-validation picks up the changes
         cache_key = get_import_device_cache_key(device_id, self.librenms_api.server_key)